@@ -0,0 +1,22 @@
+#!/usr/bin/env python3.4
+
+# compares the recursive decode_from with decode_iterative on nested
+# updates.difference values, run with the module generated by gen_test.sh
+
+import timeit
+import tl
+from test import _difference
+
+def bench(name, decode, _bytes, number):
+    seconds = min(timeit.repeat(lambda: decode(_bytes, 0), number=number, repeat=3))
+    print('{:>10} {:>10.1f} us'.format(name, seconds/number*1e6))
+
+if __name__ == '__main__':
+    for count in (1, 100, 10000):
+        _bytes = tl.updates_difference_c.serialize(_difference(count))
+        assert tl.decode_iterative(_bytes) == tl.decode_from(_bytes, 0)
+
+        print('updates.difference with {} messages, {} bytes'.format(count, len(_bytes)))
+        number = max(1, 10000 // count)
+        bench('recursive', tl.decode_from, _bytes, number)
+        bench('iterative', tl.decode_iterative, _bytes, number)
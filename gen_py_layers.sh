@@ -1,6 +1,6 @@
 #!/bin/bash
 
-for layer in $(ls schemas/telegram/layer*)
+for layer in $(ls schemas/telegram/layer* schemas/telegram/mtproto.tl)
 do
     python3.4 -m tlcl.compile -t Python3.4 ${layer} > output/py34/tl/$(basename ${layer%.tl}.py)
 done
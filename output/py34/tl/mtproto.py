@@ -0,0 +1,7289 @@
+from array import array
+from collections import namedtuple, OrderedDict
+from functools import partial
+from itertools import starmap
+from struct import Struct, error as struct_error, pack, pack_into, unpack_from
+from tempfile import TemporaryFile
+from threading import local
+import io
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+combinators = {}
+data_combinators = {}
+
+def serialize(combinator, *args, **kwargs):
+    c = None
+    if type(combinator) is bytes:
+        c = combinators.get(combinator)
+    else:
+        c = combinators.get(combinator.number)
+    if c is None:
+        raise Exception('combinator "{}" does not exist'.format(combinator))
+
+    return c.serialize(*args, **kwargs)
+
+
+def serialize_into(buf, combinator, *args, **kwargs):
+    c = None
+    if type(combinator) is bytes:
+        c = combinators.get(combinator)
+    else:
+        c = combinators.get(combinator.number)
+    if c is None:
+        raise Exception('combinator "{}" does not exist'.format(combinator))
+
+    c.serialize_into(buf, *args, **kwargs)
+
+
+def serialize_many(combinator, items):
+    '''
+    serializes every value of items with the same constructor combinator,
+    one after the other into a single bytes
+    '''
+    buf = bytearray()
+    combinator.serialize_many_into(buf, items)
+    return bytes(buf)
+
+
+class serialization_cache:
+    '''
+    a bounded LRU cache of the encoded bytes of hashable values, evicting
+    the least recently used entries past max_entries or max_bytes
+    '''
+    def __init__(self, max_entries=1024, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, data):
+        '''
+        the encoded bytes of data or None, without touching the counters
+        '''
+        try:
+            return self.entries.get((type(data), _typed_key(data)))
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, data, c):
+        if getattr(c, '_has_floats', False):
+            # -0.0 == 0.0, equal values may have different bytes
+            return c.serialize(data)
+        try:
+            key = (type(data), _typed_key(data))
+            encoded = self.entries.get(key)
+        except (TypeError, ValueError):
+            # values holding lists or writable memoryviews are not hashable
+            return c.serialize(data)
+
+        if encoded is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return encoded
+
+        self.misses += 1
+        encoded = c.serialize(data)
+        if len(encoded) <= self.max_bytes:
+            self.entries[key] = encoded
+            self.size += len(encoded)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= len(self.entries.popitem(last=False)[1])
+        return encoded
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+_serialization_cache = None
+
+
+def set_serialization_cache(cache):
+    '''
+    makes nested values serialize through cache, a serialization_cache,
+    None disables caching
+    '''
+    global _serialization_cache
+    _serialization_cache = cache
+
+
+def serialize_object_into(buf, data):
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is None:
+        c.serialize_into(buf, data)
+    else:
+        buf += _serialization_cache.get(data, c)
+
+
+class segment_writer:
+    '''
+    a serialize_into target that collects the output as a list of segments
+    for socket.sendmsg. Small pieces are packed together, bytes-like values
+    of at least min_reference_size bytes are kept by reference, so they must
+    not change until the segments are sent.
+    '''
+    def __init__(self, min_reference_size=4096):
+        self.min_reference_size = min_reference_size
+        self.size = 0
+        self._segments = []
+        self._current = bytearray()
+
+    def __iadd__(self, data):
+        self.size += len(data)
+        if len(data) < self.min_reference_size:
+            self._current += data
+            return self
+
+        if self._current:
+            self._segments.append(self._current)
+            self._current = bytearray()
+        self._segments.append(data)
+        return self
+
+    def __len__(self):
+        return self.size
+
+    def segments(self):
+        if self._current:
+            self._segments.append(self._current)
+            self._current = bytearray()
+        return self._segments
+
+
+def serialize_segments(data, min_reference_size=4096):
+    '''
+    serializes data to a list of buffers, large bytes fields are not copied
+    '''
+    writer = segment_writer(min_reference_size)
+    serialize_object_into(writer, data)
+    return writer.segments()
+
+
+def pack_object_into(buf, offset, data):
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is None:
+        return c.pack_into(buf, offset, data)
+
+    encoded = _serialization_cache.get(data, c)
+    buf[offset:offset + len(encoded)] = encoded
+    return offset + len(encoded)
+
+
+def encoded_size(data):
+    '''
+    the exact size of the serialized data, without serializing it
+    '''
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is not None:
+        encoded = _serialization_cache.lookup(data)
+        if encoded is not None:
+            return len(encoded)
+
+    return c.encoded_size(data)
+
+
+def deserialize(io_bytes, *args, **kwargs):
+    return decode_io(decode_from, io_bytes, *args, **kwargs)
+
+
+def decode_from(buf, offset, *args, **kwargs):
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
+    if cons is None:
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.decode_from(buf, offset + 4, *args, **kwargs)
+
+    if _raw_slices and cons._column_types:
+        result, end = decode_raw_from(cons, buf, offset, *args, **kwargs)
+    else:
+        result, end = cons.decode_bare_from(buf, offset + 4, *args, **kwargs)
+    if _intern_table is not None:
+        result = _intern_table.intern(result)
+    return result, end
+
+
+class raw_codec:
+    '''
+    serializes a value decoded by keep_raw by copying its wire bytes, values
+    made with _replace have no wire bytes and are encoded by cons
+    '''
+    def __init__(self, cons):
+        self.cons = cons
+        self._has_floats = cons._has_floats
+
+    def serialize(self, data):
+        raw = getattr(data, '_raw', None)
+        return self.cons.serialize(data) if raw is None else bytes(raw)
+
+    def serialize_into(self, buf, data):
+        raw = getattr(data, '_raw', None)
+        if raw is None:
+            self.cons.serialize_into(buf, data)
+        else:
+            buf += raw
+
+    def encoded_size(self, data):
+        raw = getattr(data, '_raw', None)
+        return self.cons.encoded_size(data) if raw is None else len(raw)
+
+    def pack_into(self, buf, offset, data):
+        raw = getattr(data, '_raw', None)
+        if raw is None:
+            return self.cons.pack_into(buf, offset, data)
+        buf[offset:offset + len(raw)] = raw
+        return offset + len(raw)
+
+
+def _frozen(items):
+    if items and type(items[0]) is list:
+        return tuple(_frozen(i) for i in items)
+    return tuple(items)
+
+
+class raw_value:
+    '''
+    the base of the _raw_cls of the constructors. The values keep_raw makes
+    hold their wire bytes as _raw_buf[_raw_start:_raw_end], _raw is that
+    slice, or None for values made with _replace.
+    '''
+    __slots__ = ()
+
+    @property
+    def _raw(self):
+        buf = getattr(self, '_raw_buf', None)
+        if buf is None or (self._raw_start == 0 and self._raw_end == len(buf)):
+            return buf
+        return memoryview(buf)[self._raw_start:self._raw_end]
+
+
+def keep_raw(cons, result, buf, start, end):
+    '''
+    converts a decoded value to cons._raw_cls holding its boxed wire bytes,
+    its vectors become tuples so that the bytes can not go stale. Without
+    use_zero_copy_bytes the bytes are left in buf, and the value waits in
+    _raw_decode.nested for share_raw to copy them.
+    '''
+    result = cons._raw_cls._make(_frozen(v) if type(v) is list else v for v in result)
+    if _zero_copy_bytes:
+        result._raw_buf, result._raw_start, result._raw_end = memoryview(buf)[start:end], 0, end - start
+    else:
+        result._raw_buf, result._raw_start, result._raw_end = buf, start, end
+        _raw_decode.nested.append(result)
+    return result
+
+
+def share_raw(nested):
+    '''
+    copies the wire bytes of the values of keep_raw, listed in the order
+    they were decoded, out of their buffer. The values nested in another
+    one hold slices of its copy instead of copies of their own.
+    '''
+    if _zero_copy_bytes:
+        return
+    start, end = 0, -1
+    # a value comes after the values nested in it
+    for value in reversed(nested):
+        if not (start <= value._raw_start and value._raw_end <= end):
+            start, end = value._raw_start, value._raw_end
+            raw = bytes(value._raw_buf[start:end])
+        value._raw_buf = raw
+        value._raw_start -= start
+        value._raw_end -= start
+
+
+_raw_decode = local()
+
+
+def decode_raw_from(cons, buf, offset, *args, **kwargs):
+    '''
+    decodes the boxed value of cons at offset with keep_raw. The outermost
+    call collects the values decoded within it, and shares their wire bytes
+    once it returns or fails.
+    '''
+    if getattr(_raw_decode, 'nested', None) is None:
+        _raw_decode.nested = nested = []
+        try:
+            return decode_raw_from(cons, buf, offset, *args, **kwargs)
+        finally:
+            _raw_decode.nested = None
+            share_raw(nested)
+
+    result, end = cons.decode_bare_from(buf, offset + 4, *args, **kwargs)
+    return keep_raw(cons, result, buf, offset, end), end
+
+
+_raw_slices = False
+
+
+def use_raw_slices(enabled=True):
+    '''
+    makes decoded values keep their wire bytes, so that serializing them
+    unmodified copies those bytes instead of encoding the value again.
+    Their vector fields decode to tuples, changed values are made with
+    _replace.
+    '''
+    global _raw_slices
+    _raw_slices = enabled
+
+
+def _typed_key(value):
+    '''
+    a key of value that tells apart nested values of different constructors,
+    which compare equal as tuples when they hold the same fields
+    '''
+    if isinstance(value, tuple):
+        return (type(value),) + tuple(map(_typed_key, value))
+    return value
+
+
+class intern_table:
+    '''
+    shares equal decoded strings and hashable values, keeping at most
+    max_entries of them. Used as a context manager it is installed for
+    the decodes in its block. Blocks may exit in any order, the table of
+    the latest block still open stays installed. There is one installed
+    table for the whole process: blocks of different connections that are
+    open at the same time, in threads or interleaved coroutines, all decode
+    with the table of the latest one.
+    '''
+    def __init__(self, max_entries=65536):
+        self.max_entries = max_entries
+        self.values = OrderedDict()
+        self.hits = 0
+
+    def intern(self, value):
+        if getattr(data_combinators.get(type(value)), '_has_floats', False):
+            # -0.0 == 0.0, an equal value may decode to different data
+            return value
+
+        try:
+            key = (type(value), _typed_key(value))
+            shared = self.values.get(key)
+        except (TypeError, ValueError):
+            # values holding lists or writable memoryviews are not hashable
+            return value
+
+        if shared is not None:
+            self.hits += 1
+            return shared
+
+        self.values[key] = value
+        if len(self.values) > self.max_entries:
+            self.values.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.values.clear()
+
+    def __enter__(self):
+        _intern_scopes.append((self, _intern_table))
+        set_intern_table(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        i = max(i for i, scope in enumerate(_intern_scopes) if scope[0] is self)
+        previous = _intern_scopes.pop(i)[1]
+        if i < len(_intern_scopes):
+            # a later block is still open, it restores this block's previous table
+            _intern_scopes[i] = (_intern_scopes[i][0], previous)
+        else:
+            set_intern_table(previous)
+
+
+_intern_table = None
+# the open intern_table blocks and the table installed before each of them
+_intern_scopes = []
+
+
+def set_intern_table(table):
+    '''
+    makes decoded strings and values shared through table, an intern_table,
+    None disables interning
+    '''
+    global _intern_table
+    _intern_table = table
+
+
+def skip(buf, offset):
+    '''
+    returns the offset after the boxed value at offset, without decoding it
+    '''
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
+    if cons is None:
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.skip(buf, offset + 4)
+
+    return cons.skip_bare(buf, offset + 4)
+
+
+def encoded_length(buf, offset=0):
+    return skip(buf, offset) - offset
+
+
+def decode_io(decode, io_bytes, *args, **kwargs):
+    offset = io_bytes.tell()
+    if hasattr(io_bytes, 'getbuffer'):
+        with io_bytes.getbuffer() as buf:
+            result, offset = decode(buf, offset, *args, **kwargs)
+    else:
+        buf = io_bytes.read()
+        result, end = decode(buf, 0, *args, **kwargs)
+        offset += end
+    io_bytes.seek(offset)
+    return result
+
+
+def numpy_dtype(fmt, names=None):
+    if numpy is None:
+        return None
+    if names is None:
+        return numpy.dtype('<' + fmt)
+    return numpy.dtype([(name, '<' + f) for name, f in zip(names, fmt)])
+
+
+def decode_vector_numpy(buf, elem_type, offset=0, bare=False):
+    '''
+    decodes a vector of ints, longs, doubles or fixed-size constructors to a
+    numpy array that shares the memory of buf, bare for vector<...> vectors
+    '''
+    if numpy is None:
+        raise Exception('decode_vector_numpy requires numpy')
+
+    if not bare:
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        offset += 4
+
+    dtype = getattr(elem_type, 'bare_dtype' if bare and not elem_type.is_base else 'dtype', None)
+    if dtype is None:
+        raise Exception('"{}" items do not have a fixed size'.format(elem_type.__name__))
+
+    count = unpack_number_from(buf, offset)[0]
+    array = numpy.frombuffer(buf, dtype, count, offset + 4)
+    if dtype.names is not None and dtype.names[0] == 'number':
+        number = unpack_number_from(elem_type.number)[0]
+        if not (array['number'] == number).all():
+            raise Exception('vector item is not a "{:#x}" combinator'.format(number))
+    return array, offset + 4 + count*dtype.itemsize
+
+
+_pack_number_struct = Struct('<I')
+pack_number = _pack_number_struct.pack
+pack_number_into = _pack_number_struct.pack_into
+unpack_number_from = _pack_number_struct.unpack_from
+
+
+class int_c:
+    number = pack_number(0xa8509bda)
+    is_base = True
+    item_format = 'i'
+    dtype = numpy_dtype('i')
+    item_size = 4
+
+    _struct = Struct('<i')
+
+    @staticmethod
+    def serialize(_int):
+        return int_c._struct.pack(_int)
+
+    @staticmethod
+    def serialize_into(buf, _int):
+        buf += int_c._struct.pack(_int)
+
+    @staticmethod
+    def encoded_size(_int):
+        return 4
+
+    @staticmethod
+    def pack_into(buf, offset, _int):
+        int_c._struct.pack_into(buf, offset, _int)
+        return offset + 4
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(int_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return int_c._struct.unpack_from(buf, offset)[0], offset + 4
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 4
+combinators[int_c.number] = int_c
+
+
+class long_c:
+    number = pack_number(0x22076cba)
+    is_base = True
+    item_format = 'q'
+    dtype = numpy_dtype('q')
+    item_size = 8
+
+    _struct = Struct('<q')
+
+    @staticmethod
+    def serialize(_long):
+        return long_c._struct.pack(_long)
+
+    @staticmethod
+    def serialize_into(buf, _long):
+        buf += long_c._struct.pack(_long)
+
+    @staticmethod
+    def encoded_size(_long):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, _long):
+        long_c._struct.pack_into(buf, offset, _long)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(long_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return long_c._struct.unpack_from(buf, offset)[0], offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 8
+combinators[long_c.number] = long_c
+
+
+class double_c:
+    number = pack_number(0x2210c154)
+    is_base = True
+    item_format = 'd'
+    dtype = numpy_dtype('d')
+    item_size = 8
+
+    _struct = Struct('<d')
+
+    @staticmethod
+    def serialize(_double):
+        return double_c._struct.pack(_double)
+
+    @staticmethod
+    def serialize_into(buf, _double):
+        buf += double_c._struct.pack(_double)
+
+    @staticmethod
+    def encoded_size(_double):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, _double):
+        double_c._struct.pack_into(buf, offset, _double)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(double_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return double_c._struct.unpack_from(buf, offset)[0], offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 8
+combinators[double_c.number] = double_c
+
+
+class string_c:
+    number = pack_number(0xb5286e24)
+    is_base = True
+
+    @staticmethod
+    def serialize(string):
+        result = bytearray()
+        bytes_c.serialize_into(result, string.encode())
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, string):
+        bytes_c.serialize_into(buf, string.encode())
+
+    @staticmethod
+    def encoded_size(string):
+        return bytes_c.encoded_size(string.encode())
+
+    @staticmethod
+    def pack_into(buf, offset, string):
+        return bytes_c.pack_into(buf, offset, string.encode())
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(string_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        if _lazy_text:
+            raw = memoryview(buf)[start:end] if _zero_copy_bytes else bytes(buf[start:end])
+            return lazy_text(raw), end + (offset - end)%4
+
+        string = str(buf[start:end], 'utf-8')
+        if _intern_table is not None:
+            string = _intern_table.intern(string)
+        return string, end + (offset - end)%4
+
+    @staticmethod
+    def skip(buf, offset):
+        return bytes_c.skip(buf, offset)
+combinators[string_c.number] = string_c
+
+
+class lazy_text:
+    '''
+    a string kept as its UTF-8 bytes, raw, until it is first used as text
+    '''
+    __slots__ = ('raw', '_text')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = str(self.raw, 'utf-8')
+        return self._text
+
+    def __bytes__(self):
+        # raw is a memoryview with use_zero_copy_bytes
+        return bytes(self.raw)
+
+    def encode(self, encoding='utf-8', errors='strict'):
+        if encoding.lower().replace('-', '') == 'utf8':
+            return bytes(self.raw)
+        return str(self).encode(encoding, errors)
+
+    def __eq__(self, other):
+        if isinstance(other, lazy_text):
+            return self.raw == other.raw
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __contains__(self, item):
+        return str(item) in str(self)
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __getattr__(self, name):
+        return getattr(str(self), name)
+
+    def __repr__(self):
+        return 'lazy_text({!r})'.format(self.raw)
+
+
+_lazy_text = False
+
+
+def use_lazy_text(enabled=True):
+    '''
+    makes string fields decode to lazy_text objects, which only decode their
+    UTF-8 bytes when they are used as text
+    '''
+    global _lazy_text
+    _lazy_text = enabled
+
+
+class bytes_c:
+    number = pack_number(0xebefb69e)
+    is_base = True
+
+    _padding = (b'', b'\x00\x00\x00', b'\x00\x00', b'\x00')
+
+    @staticmethod
+    def serialize(_bytes):
+        result = bytearray()
+        bytes_c.serialize_into(result, _bytes)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, _bytes):
+        if type(_bytes) is spilled_bytes:
+            _bytes = _bytes.read()
+        size_pfx = len(_bytes)
+        if size_pfx < 254:
+            buf += bytes((size_pfx,))
+            size_pfx += 1
+        else:
+            buf += pack_number(size_pfx << 8 | 254)
+        buf += _bytes
+        buf += bytes_c._padding[size_pfx%4]
+
+    @staticmethod
+    def encoded_size(_bytes):
+        size = len(_bytes)
+        size += 1 if size < 254 else 4
+        return size + -size%4
+
+    @staticmethod
+    def pack_into(buf, offset, _bytes):
+        if type(_bytes) is spilled_bytes:
+            _bytes = _bytes.read()
+        size = len(_bytes)
+        if size < 254:
+            buf[offset] = size
+            start = offset + 1
+        else:
+            pack_number_into(buf, offset, size << 8 | 254)
+            start = offset + 4
+        end = start + size
+        buf[start:end] = _bytes
+        padding = bytes_c._padding[(end - offset)%4]
+        buf[end:end + len(padding)] = padding
+        return end + len(padding)
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(bytes_c.decode_from, io_bytes)
+
+    @staticmethod
+    def payload_from(buf, offset):
+        size = buf[offset]
+        if size == 254:
+            start = offset + 4
+            size = unpack_number_from(buf, offset)[0] >> 8
+        else:
+            start = offset + 1
+        return start, start + size
+
+    @staticmethod
+    def decode_from(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        if _spill_threshold is not None and end - start > _spill_threshold:
+            return spilled_bytes.spill(buf, start, end), end + (offset - end)%4
+        if _zero_copy_bytes:
+            return memoryview(buf)[start:end], end + (offset - end)%4
+        return bytes(buf[start:end]), end + (offset - end)%4
+
+    @staticmethod
+    def view_from(buf, offset):
+        '''
+        the payload at offset as a memoryview of buf, which is never spilled
+        '''
+        start, end = bytes_c.payload_from(buf, offset)
+        return memoryview(buf)[start:end], end + (offset - end)%4
+
+    @staticmethod
+    def skip(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        return end + (offset - end)%4
+combinators[bytes_c.number] = bytes_c
+
+
+class spilled_bytes:
+    '''
+    a bytes field written to file, where it takes size bytes from offset.
+    A field spilled to its own temporary file frees it with close, or once
+    the field is garbage collected.
+    '''
+    __slots__ = ('file', 'offset', 'size', '_owns_file')
+
+    def __init__(self, file, offset, size, owns_file=False):
+        self.file = file
+        self.offset = offset
+        self.size = size
+        self._owns_file = owns_file
+
+    @staticmethod
+    def _open():
+        if _spill_sink is not None:
+            file = _spill_sink()
+            return spilled_bytes(file, file.seek(0, io.SEEK_END), 0)
+        return spilled_bytes(TemporaryFile(), 0, 0, True)
+
+    @staticmethod
+    def spill(buf, start, end):
+        spill = spilled_bytes._open()
+        spill.file.write(memoryview(buf)[start:end])
+        spill.size = end - start
+        return spill
+
+    @staticmethod
+    def reserve(size):
+        '''
+        a spilled_bytes of size bytes that are written later with write_at
+        '''
+        spill = spilled_bytes._open()
+        if size:
+            spill.file.seek(spill.offset + size - 1)
+            spill.file.write(b'\0')
+        spill.size = size
+        return spill
+
+    def close(self):
+        '''
+        closes the temporary file of the field, the file of a sink is left open
+        '''
+        if self._owns_file:
+            self.file.close()
+
+    __del__ = close
+
+    def write_at(self, position, data):
+        self.file.seek(self.offset + position)
+        self.file.write(data)
+
+    def read(self):
+        self.file.seek(self.offset)
+        return self.file.read(self.size)
+
+    def __bytes__(self):
+        return self.read()
+
+    def __len__(self):
+        return self.size
+
+    def __eq__(self, other):
+        if isinstance(other, spilled_bytes):
+            other = other.read()
+        return self.read() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<spilled_bytes: {} bytes>'.format(self.size)
+
+
+_spill_threshold = None
+_spill_sink = None
+
+
+def use_bytes_spill(threshold=1 << 20, sink=None):
+    '''
+    makes bytes fields larger than threshold bytes decode to spilled_bytes,
+    appended to the file object returned by sink() for each field, by
+    default a temporary file of its own. A threshold of None disables
+    spilling. decode_from spills fields that are already in memory,
+    stream_decoder writes the fields of constructors to the file as their
+    chunks arrive and does not keep them.
+    '''
+    global _spill_threshold, _spill_sink
+    _spill_threshold = threshold
+    _spill_sink = sink
+
+
+_zero_copy_bytes = False
+
+
+def use_zero_copy_bytes(enabled=True):
+    '''
+    makes bytes fields, and the raw bytes of lazy_text, decode to memoryview
+    slices of the decoded buffer instead of copies. A slice keeps the whole
+    buffer alive, a bytearray or BytesIO can not be resized while slices of
+    it exist, and writing into the buffer changes the slices: copy with
+    bytes() whatever must outlive the buffer or its next reuse.
+    '''
+    global _zero_copy_bytes
+    _zero_copy_bytes = enabled
+
+
+class vector_c:
+    number = pack_number(0x1cb5c415)
+    is_base = True
+
+    @staticmethod
+    def serialize(iterable, vector_type, bare=False):
+        result = bytearray()
+        vector_c.serialize_into(result, iterable, vector_type, bare)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, iterable, vector_type, bare=False):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, iterable, vector_type, bare)
+
+    @staticmethod
+    def serialize_bare_into(buf, iterable, vector_type, bare=False):
+        buf += pack_number(len(iterable))
+        vector_c.serialize_items_into(buf, iterable, vector_type, bare)
+
+    @staticmethod
+    def serialize_items_into(buf, iterable, vector_type, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            buf += pack('<{}{}'.format(len(iterable), item_format), *iterable)
+            return
+
+        if vector_type is None:
+            serialize_into = serialize_object_into
+        elif bare:
+            serialize_into = vector_type.serialize_bare_into
+        else:
+            serialize_into = vector_type.serialize_into
+        for i in iterable:
+            serialize_into(buf, i)
+
+    @staticmethod
+    def serialize_records_into(buf, iterable, cons, bare=False):
+        buf += pack_number(len(iterable))
+        buf += vector_c.pack_records(iterable, cons, bare)
+
+    @staticmethod
+    def pack_records(iterable, cons, bare=False):
+        '''
+        packs the items of a fixed-size constructor with its precomputed Struct
+        '''
+        if bare:
+            return b''.join(starmap(cons._bare_struct_0.pack, iterable))
+        pack_item = partial(cons._struct_0.pack, unpack_number_from(cons.number)[0])
+        return b''.join(starmap(pack_item, iterable))
+
+    @staticmethod
+    def encoded_size(iterable, vector_type, bare=False):
+        return 8 + vector_c.items_encoded_size(iterable, vector_type, bare)
+
+    @staticmethod
+    def encoded_bare_size(iterable, vector_type, bare=False):
+        return 4 + vector_c.items_encoded_size(iterable, vector_type, bare)
+
+    @staticmethod
+    def items_encoded_size(iterable, vector_type, bare=False):
+        item_size = getattr(vector_type, 'item_size', None)
+        if item_size is not None:
+            return len(iterable)*item_size
+
+        if vector_type is None:
+            size = encoded_size
+        elif bare:
+            size = vector_type.encoded_bare_size
+        else:
+            size = vector_type.encoded_size
+        return sum(map(size, iterable))
+
+    @staticmethod
+    def records_encoded_size(iterable, cons, bare=False):
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        return 4 + len(iterable)*struct.size
+
+    @staticmethod
+    def pack_into(buf, offset, iterable, vector_type, bare=False):
+        buf[offset:offset + 4] = vector_c.number
+        return vector_c.pack_bare_into(buf, offset + 4, iterable, vector_type, bare)
+
+    @staticmethod
+    def pack_bare_into(buf, offset, iterable, vector_type, bare=False):
+        pack_number_into(buf, offset, len(iterable))
+        return vector_c.pack_items_into(buf, offset + 4, iterable, vector_type, bare)
+
+    @staticmethod
+    def pack_items_into(buf, offset, iterable, vector_type, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            pack_into('<{}{}'.format(len(iterable), item_format), buf, offset, *iterable)
+            return offset + len(iterable)*vector_type.item_size
+
+        if vector_type is None:
+            pack_item_into = pack_object_into
+        elif bare:
+            pack_item_into = vector_type.pack_bare_into
+        else:
+            pack_item_into = vector_type.pack_into
+        for i in iterable:
+            offset = pack_item_into(buf, offset, i)
+        return offset
+
+    @staticmethod
+    def pack_records_into(buf, offset, iterable, cons, bare=False):
+        pack_number_into(buf, offset, len(iterable))
+        records = vector_c.pack_records(iterable, cons, bare)
+        buf[offset + 4:offset + 4 + len(records)] = records
+        return offset + 4 + len(records)
+
+    @staticmethod
+    def deserialize(io_bytes, vector_type=None, bare=False):
+        return decode_io(vector_c.decode_from, io_bytes, vector_type, bare)
+
+    @staticmethod
+    def decode_from(buf, offset, vector_type=None, bare=False):
+        count = unpack_number_from(buf, offset)[0]
+        return vector_c.decode_items_from(buf, offset + 4, count, vector_type, bare)
+
+    @staticmethod
+    def decode_items_from(buf, offset, count, vector_type=None, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            items = unpack_from('<{}{}'.format(count, item_format), buf, offset)
+            return list(items), offset + count*vector_type.item_size
+
+        if vector_type is None:
+            decode = decode_from
+        elif bare:
+            decode = vector_type.decode_bare_from
+        else:
+            decode = vector_type.decode_from
+        items = []
+        for i in range(count):
+            item, offset = decode(buf, offset)
+            items.append(item)
+        return items, offset
+
+    @staticmethod
+    def decode_records_from(buf, offset, cons, bare=False):
+        '''
+        unpacks the items of a fixed-size constructor in a single pass of Struct.iter_unpack
+        '''
+        count = unpack_number_from(buf, offset)[0]
+        offset += 4
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        end = offset + count*struct.size
+        records = struct.iter_unpack(buf[offset:end])
+        make = cons._data_cls._make
+        number = unpack_number_from(cons.number)[0]
+        if bare:
+            items = list(map(make, records))
+        else:
+            items = [make(r[1:]) for r in records if r[0] == number]
+        if len(items) != count:
+            raise Exception('expected {} items of combinator "{:#x}", found {}'.format(count, number, len(items)))
+        return items, end
+
+    @staticmethod
+    def skip(buf, offset, vector_type=None, bare=False):
+        count = unpack_number_from(buf, offset)[0]
+        return vector_c.skip_items(buf, offset + 4, count, vector_type, bare)
+
+    @staticmethod
+    def skip_items(buf, offset, count, vector_type=None, bare=False):
+        item_size = getattr(vector_type, 'item_size', None)
+        if item_size is not None:
+            return offset + count*item_size
+
+        if vector_type is None:
+            skip_item = skip
+        elif bare:
+            skip_item = vector_type.skip_bare
+        else:
+            skip_item = vector_type.skip
+        for i in range(count):
+            offset = skip_item(buf, offset)
+        return offset
+
+    @staticmethod
+    def skip_records(buf, offset, cons, bare=False):
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        return offset + 4 + unpack_number_from(buf, offset)[0]*struct.size
+combinators[vector_c.number] = vector_c
+
+
+class blob_column:
+    '''
+    a column of strings or bytes stored back to back in blob,
+    item i is blob[offsets[i]:offsets[i + 1]]
+    '''
+    def __init__(self):
+        self.offsets = array('q', [0])
+        self.blob = bytearray()
+
+    def append(self, value):
+        self.blob += value
+        self.offsets.append(len(self.blob))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+
+vector_partition = namedtuple('vector_partition', ['rows', 'columns'])
+
+
+def new_column(column_type):
+    if column_type is None:
+        return []
+    if column_type == 'blob':
+        return blob_column()
+    return array(column_type)
+
+
+def decode_vector_columns(buf, offset=0):
+    '''
+    decodes a Vector of boxed values to columns, partitioned by constructor.
+    Returns a dict mapping each constructor to a vector_partition of the
+    positions of its items and an OrderedDict of its field columns.
+    '''
+    assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+    count = unpack_number_from(buf, offset + 4)[0]
+    offset += 8
+
+    partitions = {}
+    for i in range(count):
+        cons = combinators.get(bytes(buf[offset:offset + 4]))
+        if cons is None or cons.is_base:
+            raise Exception('combinator "{:#x}" does not decode to columns'.format(unpack_number_from(buf, offset)[0]))
+        partition = partitions.get(cons)
+        if partition is None:
+            columns = [new_column(t) for t in cons._column_types]
+            partition = partitions[cons] = vector_partition(array('I'), columns)
+        partition.rows.append(i)
+        offset = cons.decode_columns_from(buf, offset + 4, partition.columns)
+
+    result = {}
+    for cons, partition in partitions.items():
+        names = cons._data_cls._fields if cons._column_types else ()
+        result[cons] = vector_partition(partition.rows, OrderedDict(zip(names, partition.columns)))
+    return result, offset
+
+
+_unset = object()
+
+
+class lazy_view:
+    '''
+    a value of a constructor whose fields are decoded from buf when first
+    accessed, fields at a fixed offset are read without decoding the ones
+    before them
+    '''
+    __slots__ = ('_cons', '_buf', '_offsets', '_values')
+
+    def __init__(self, cons, buf, offset):
+        self._cons = cons
+        self._buf = buf
+        self._offsets = [offset + o for o in cons._field_offsets]
+        self._values = [_unset] * len(cons._column_types)
+
+    def field(self, index):
+        value = self._values[index]
+        if value is not _unset:
+            return value
+
+        cons, offsets, values = self._cons, self._offsets, self._values
+        if index + 1 < len(offsets):
+            values[index] = cons.decode_field_from(self._buf, offsets[index], index, values)[0]
+        for i in range(len(offsets) - 1, index + 1):
+            values[i], end = cons.decode_field_from(self._buf, offsets[i], i, values)
+            offsets.append(end)
+        return values[index]
+
+    def __getattr__(self, name):
+        try:
+            index = self._cons._data_cls._fields.index(name)
+        except ValueError:
+            raise AttributeError(name)
+        if index >= len(self._values):
+            return getattr(self.decode(), name)
+        return self.field(index)
+
+    @property
+    def end(self):
+        '''
+        the offset after the value, which decodes the trailing fields
+        '''
+        if self._values:
+            self.field(len(self._values) - 1)
+        return self._offsets[-1]
+
+    def decode(self):
+        if not self._values:
+            return self._cons.decode_bare_from(self._buf, self._offsets[0])[0]
+        return self._cons._data_cls(*[self.field(i) for i in range(len(self._values))])
+
+    def __repr__(self):
+        return '<lazy {}>'.format(self._cons.__name__)
+
+
+def decode_lazy_from(buf, offset=0):
+    '''
+    decodes the boxed value at offset to a lazy_view, base values are decoded
+    as usual. The end property of the view is the offset after the value.
+    '''
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
+    if cons is None:
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.decode_from(buf, offset + 4)[0]
+
+    return lazy_view(cons, buf, offset + 4)
+
+
+class _decode_frame:
+    '''
+    a constructor being decoded by _decode_state, or a boxed vector when
+    cons is vector_c. items collects the items of the vector field it is
+    in, boxed values of item_cls decoded by descending into them, or the
+    values of item_decode when it is set. spill is the bytes field being
+    written to the spill file, spill_left bytes of it are still to come.
+    '''
+    __slots__ = ('cons', 'start', 'offset', 'values', 'items', 'item_cls', 'item_decode', 'item_skip', 'count',
+                 'spill', 'spill_left', 'spill_pad')
+
+    def __init__(self, cons, start):
+        self.cons = cons
+        self.start = start
+        self.offset = start + 4
+        self.values = []
+        self.items = None
+        self.item_cls = None
+        self.item_decode = None
+        self.item_skip = None
+        self.count = 0
+        self.spill = None
+        self.spill_left = 0
+        self.spill_pad = 0
+
+
+def _fits(skip, buf, *args):
+    '''
+    whether the value skip reads from buf ends within buf
+    '''
+    try:
+        return skip(buf, *args) <= len(buf)
+    except (struct_error, IndexError):
+        return False
+
+
+def _spill_from(buf, frame):
+    '''
+    writes the bytes field at frame.offset to the spill file as far as buf
+    goes, returns the spilled_bytes once it is complete, _unset before that
+    and None when the field is not larger than the spill threshold
+    '''
+    if frame.spill is None:
+        if len(buf) < frame.offset + 4:
+            return _unset
+        start, end = bytes_c.payload_from(buf, frame.offset)
+        if end - start <= _spill_threshold:
+            return None
+        frame.spill, frame.spill_left = spilled_bytes.reserve(end - start), end - start
+        frame.spill_pad = (frame.offset - end)%4
+        frame.offset = start
+
+    spill = frame.spill
+    if frame.spill_left:
+        size = min(frame.spill_left, len(buf) - frame.offset)
+        spill.write_at(spill.size - frame.spill_left, memoryview(buf)[frame.offset:frame.offset + size])
+        frame.offset += size
+        frame.spill_left -= size
+        if frame.spill_left:
+            return _unset
+
+    if len(buf) < frame.offset + frame.spill_pad:
+        return _unset
+    frame.offset += frame.spill_pad
+    frame.spill = None
+    return spill
+
+
+def _item_codec(codec, bare):
+    '''
+    the functions decoding and skipping one item of a vector of codec
+    '''
+    if codec is None:
+        return decode_from, skip
+    if bare:
+        return codec.decode_bare_from, codec.skip_bare
+    return codec.decode_from, codec.skip
+
+
+class _decode_state:
+    '''
+    the explicit stack of a boxed value being decoded, offset and type_cls
+    are the next boxed value to decode when descend is set. raw_nested are
+    the values of keep_raw that share_raw copies once the value is complete.
+    '''
+    def __init__(self, offset, max_depth):
+        self.max_depth = max_depth
+        self.stack = []
+        self.offset = offset
+        self.type_cls = None
+        self.descend = True
+        self.raw_nested = []
+
+    def run(self, buf, partial=False):
+        '''
+        decodes from buf, returns the value and the offset after it. When
+        partial, returns _unset if buf ends first, and run continues from
+        where it stopped once buf has more bytes.
+        '''
+        if not _raw_slices:
+            return self._run(buf, partial)
+
+        # values decoded by recursive calls wait with those of the frames
+        _raw_decode.nested = self.raw_nested
+        try:
+            return self._run(buf, partial)
+        except Exception:
+            share_raw(self.raw_nested)
+            del self.raw_nested[:]
+            raise
+        finally:
+            _raw_decode.nested = None
+
+    def _run(self, buf, partial):
+        stack, max_depth = self.stack, self.max_depth
+        offset, type_cls, descend = self.offset, self.type_cls, self.descend
+        value = _unset
+        while True:
+            if descend:
+                # offset is at a boxed value of type_cls, or of any type when None
+                if partial and len(buf) < offset + 4:
+                    self.offset, self.type_cls, self.descend = offset, type_cls, True
+                    return _unset
+                number = unpack_number_from(buf, offset)[0]
+                if type_cls is None:
+                    cons = combinators.get(bytes(buf[offset:offset + 4]))
+                    if cons is None:
+                        raise Exception('combinator "{:#x}" does not exist'.format(number))
+                else:
+                    cons = type_cls.constructors.get(number)
+                    if cons is None:
+                        raise Exception('combinator "{:#x}" is not a constructor of {}'.format(number, type_cls.__name__))
+
+                # partly received values are kept in frames down to their fields
+                # and the items of their vectors
+                if partial and cons is vector_c:
+                    if len(buf) < offset + 8:
+                        self.offset, self.type_cls, self.descend = offset, type_cls, True
+                        return _unset
+                    if len(stack) >= max_depth:
+                        raise Exception('value nested deeper than {} levels'.format(max_depth))
+                    frame = _decode_frame(cons, offset)
+                    frame.count = unpack_number_from(buf, offset + 4)[0]
+                    frame.items, frame.offset = [], offset + 8
+                    stack.append(frame)
+                    value = _unset
+                elif cons.is_base or not (cons._column_types if partial else cons._nested_fields):
+                    if partial and not _fits(skip if type_cls is None else type_cls.skip, buf, offset):
+                        self.offset, self.type_cls, self.descend = offset, type_cls, True
+                        return _unset
+                    value, offset = (decode_from if type_cls is None else type_cls.decode_from)(buf, offset)
+                else:
+                    if len(stack) >= max_depth:
+                        raise Exception('value nested deeper than {} levels'.format(max_depth))
+                    stack.append(_decode_frame(cons, offset))
+                    value = _unset
+
+            descend = True
+            while stack:
+                frame = stack[-1]
+                if value is not _unset:
+                    frame.offset = offset
+                    if frame.items is not None:
+                        frame.items.append(value)
+                    else:
+                        frame.values.append(value)
+                    value = _unset
+
+                items = frame.items
+                if items is not None:
+                    while frame.item_decode is not None and len(items) < frame.count:
+                        if not _fits(frame.item_skip, buf, frame.offset):
+                            self.descend = False
+                            return _unset
+                        item, frame.offset = frame.item_decode(buf, frame.offset)
+                        items.append(item)
+                    if len(items) < frame.count:
+                        type_cls, offset = frame.item_cls, frame.offset
+                        break
+                    frame.items = frame.item_decode = None
+                    if frame.cons is vector_c:
+                        stack.pop()
+                        value, offset = items, frame.offset
+                        continue
+                    frame.values.append(items)
+
+                cons, values, nested = frame.cons, frame.values, frame.cons._nested_fields
+                # in partial mode vectors are decoded item by item, except for
+                # items of a fixed size, which are skipped without scanning them
+                vectors = cons._vector_fields if partial else ()
+                index, count = len(values), len(cons._column_types)
+                while (index < count and (not nested or nested[index] is None) and
+                       (not vectors or vectors[index] is None or hasattr(vectors[index][0], 'item_size'))):
+                    field = None
+                    if partial and _spill_threshold is not None and index in cons._bytes_fields:
+                        field = _spill_from(buf, frame)
+                        if field is _unset:
+                            self.descend = False
+                            return _unset
+                    if field is None:
+                        if partial and not _fits(cons.skip_field_from, buf, frame.offset, index, values):
+                            self.descend = False
+                            return _unset
+                        field, frame.offset = cons.decode_field_from(buf, frame.offset, index, values)
+                    values.append(field)
+                    index += 1
+
+                if index < count:
+                    offset = frame.offset
+                    if nested and nested[index] is not None:
+                        type_cls, is_vector = nested[index]
+                        if not is_vector:
+                            break
+                        frame.item_cls, boxed = type_cls, True
+                    else:
+                        codec, bare, boxed = vectors[index]
+                        frame.item_decode, frame.item_skip = _item_codec(codec, bare)
+                    header = 8 if boxed else 4
+                    if partial and len(buf) < offset + header:
+                        self.descend = False
+                        return _unset
+                    if boxed:
+                        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+                    frame.count = unpack_number_from(buf, offset + header - 4)[0]
+                    frame.items = []
+                    frame.offset = offset + header
+                    continue
+
+                stack.pop()
+                value, offset = cons._data_cls(*values), frame.offset
+                if _raw_slices:
+                    value = keep_raw(cons, value, buf, frame.start, offset)
+                if _intern_table is not None:
+                    value = _intern_table.intern(value)
+
+            if not stack:
+                if self.raw_nested:
+                    share_raw(self.raw_nested)
+                    del self.raw_nested[:]
+                return value, offset
+
+
+def decode_iterative(buf, offset=0, max_depth=1000):
+    '''
+    decodes the boxed value at offset like decode_from, but nested boxed
+    values are decoded by a loop over an explicit stack, driven by the
+    _nested_fields of the constructors, instead of by recursive calls.
+    Values nested deeper than max_depth raise an exception.
+    '''
+    return _decode_state(offset, max_depth).run(buf)
+
+
+class stream_decoder:
+    '''
+    decodes a stream of boxed values received in chunks of any size. The
+    fields, nested values and vector items of a partly received value are
+    kept between chunks, only a field or vector item that is not complete
+    yet is checked again from its start by the next feed.
+    '''
+    def __init__(self, max_depth=1000):
+        self.max_depth = max_depth
+        self._buf = bytearray()
+        self._state = _decode_state(0, max_depth)
+
+    def feed(self, chunk):
+        '''
+        adds chunk to the stream, returns the values it completes
+        '''
+        try:
+            self._buf += chunk
+        except BufferError:
+            # zero-copy fields of the pending value hold views of the buffer
+            self._buf = self._buf + chunk
+
+        results = []
+        while True:
+            result = self._state.run(self._buf, partial=True)
+            if result is _unset:
+                break
+            value, offset = result
+            results.append(value)
+            self._state = _decode_state(offset, self.max_depth)
+
+        state = self._state
+        position = state.offset if state.descend or not state.stack else state.stack[-1].offset
+        if position and 2*position >= len(self._buf) and (not state.stack or not _raw_slices):
+            # the bytes before position are decoded, or spilled, and only raw
+            # slices refer to them. Dropping them when they are at least half
+            # of the buffer copies every byte a bounded number of times.
+            self._buf = self._buf[position:]
+            state.offset -= position
+            for frame in state.stack:
+                frame.start -= position
+                frame.offset -= position
+        return results
+
+    @property
+    def pending(self):
+        '''
+        whether a value is partly received
+        '''
+        return len(self._buf) > self._state.offset or bool(self._state.stack)
+
+
+def _fixed_size(buf, offset, size):
+    return offset + size
+
+
+class vector_stream:
+    '''
+    decodes the boxed value at offset of source, a buffer or a binary file,
+    yielding the items of its vector field one at a time. fields holds the
+    other fields by name, the ones before the vector once the stream is
+    made and the ones after it once the items are iterated, when end is
+    the offset after the value in a buffer. Files are read in chunks of
+    chunk_size and only the bytes of the current item are kept.
+    '''
+    def __init__(self, source, field, offset=0, chunk_size=65536):
+        if hasattr(source, 'read'):
+            self._file, self._buf, self._offset = source, bytearray(), 0
+        else:
+            self._file, self._buf, self._offset = None, source, offset
+        self._chunk_size = chunk_size
+
+        self._fill(_fixed_size, 4)
+        cons = combinators.get(bytes(self._buf[self._offset:self._offset + 4]))
+        if cons is None or cons.is_base:
+            raise Exception('combinator "{:#x}" is not a constructor'.format(unpack_number_from(self._buf, self._offset)[0]))
+        names = cons._data_cls._fields
+        if field not in names or not cons._vector_fields or cons._vector_fields[names.index(field)] is None:
+            raise Exception('{} has no vector field "{}"'.format(cons.__name__, field))
+
+        self.cons = cons
+        self.fields = OrderedDict()
+        self.end = None
+        self._index = names.index(field)
+        self._values = []
+        self._offset += 4
+        self._decode_fields(self._index)
+
+        boxed = cons._vector_fields[self._index][2]
+        self._fill(_fixed_size, 8 if boxed else 4)
+        if boxed:
+            assert unpack_number_from(self._buf, self._offset)[0] == 0x1cb5c415
+            self._offset += 4
+        self.count = unpack_number_from(self._buf, self._offset)[0]
+        self._offset += 4
+        self._started = False
+
+    def _fill(self, skip, *args):
+        '''
+        reads the file until the value that skip reads at the offset is in
+        the buffer, dropping the bytes before the offset
+        '''
+        if self._file is None:
+            return
+        while not _fits(skip, self._buf, self._offset, *args):
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                raise Exception('the file ends inside the value')
+            # a new buffer, decoded zero-copy fields may hold views of the old one
+            self._buf = self._buf[self._offset:] + chunk
+            self._offset = 0
+
+    def _decode_fields(self, end):
+        cons, values = self.cons, self._values
+        for i in range(len(values), end):
+            if i == self._index:
+                values.append(None)
+                continue
+            self._fill(cons.skip_field_from, i, values)
+            value, self._offset = cons.decode_field_from(self._buf, self._offset, i, values)
+            values.append(value)
+            self.fields[cons._data_cls._fields[i]] = value
+
+    def __iter__(self):
+        if self._started:
+            raise Exception('the items of a vector_stream are iterated once')
+        self._started = True
+
+        codec, bare, boxed = self.cons._vector_fields[self._index]
+        decode, skip_item = _item_codec(codec, bare)
+
+        for i in range(self.count):
+            self._fill(skip_item)
+            item, self._offset = decode(self._buf, self._offset)
+            yield item
+
+        self._decode_fields(len(self.cons._column_types))
+        self.end = self._offset if self._file is None else None
+
+
+_field_structs = {code: Struct('<' + code) for code in 'iIqd'}
+
+
+class request_template:
+    '''
+    a request serialized once, fill packs the named fixed-width fields in
+    place and leaves the rest of the bytes as they are. prefix holds the
+    already serialized headers of wrappers such as invokeWithLayer and
+    initConnection, whose query is the templated request.
+    '''
+    def __init__(self, cons, data, variable=(), prefix=b''):
+        self.cons = cons
+        self._buf = bytearray(prefix)
+        start = len(self._buf)
+        cons.serialize_into(self._buf, data)
+
+        fields = cons._data_cls._fields
+        indices = []
+        for name in variable:
+            if name not in fields:
+                raise Exception('{} has no field "{}"'.format(cons.__name__, name))
+            index = fields.index(name)
+            if cons._column_types[index] not in _field_structs:
+                raise Exception('field "{}" of {} is not fixed-width'.format(name, cons.__name__))
+            indices.append(index)
+
+        self._fields = {}
+        offset, values = start + 4, []
+        for i in range(max(indices, default=-1) + 1):
+            if i in indices:
+                self._fields[fields[i]] = (_field_structs[cons._column_types[i]], offset)
+            value, offset = cons.decode_field_from(self._buf, offset, i, values)
+            values.append(value)
+
+    def fill(self, **values):
+        '''
+        the request bytes with the given variable fields replaced, fields
+        that are not given keep their last value
+        '''
+        fields = self._fields
+        for name, value in values.items():
+            field_struct, offset = fields[name]
+            field_struct.pack_into(self._buf, offset, value)
+        return bytes(self._buf)
+
+    def __len__(self):
+        return len(self._buf)
+
+
+class ResPQ_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(ResPQ_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = ResPQ_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of ResPQ'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = ResPQ_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of ResPQ'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class P_Q_inner_data_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(P_Q_inner_data_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = P_Q_inner_data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of P_Q_inner_data'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = P_Q_inner_data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of P_Q_inner_data'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Server_DH_Params_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Server_DH_Params_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Server_DH_Params_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Server_DH_Params'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Server_DH_Params_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Server_DH_Params'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Server_DH_inner_data_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Server_DH_inner_data_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Server_DH_inner_data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Server_DH_inner_data'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Server_DH_inner_data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Server_DH_inner_data'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Client_DH_Inner_Data_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Client_DH_Inner_Data_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Client_DH_Inner_Data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Client_DH_Inner_Data'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Client_DH_Inner_Data_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Client_DH_Inner_Data'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Set_client_DH_params_answer_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Set_client_DH_params_answer_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Set_client_DH_params_answer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Set_client_DH_params_answer'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Set_client_DH_params_answer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Set_client_DH_params_answer'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class RpcResult_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(RpcResult_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcResult_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcResult'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcResult_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcResult'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class RpcError_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(RpcError_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcError_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcError'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcError_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcError'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class RpcDropAnswer_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(RpcDropAnswer_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcDropAnswer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcDropAnswer'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = RpcDropAnswer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of RpcDropAnswer'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class FutureSalt_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(FutureSalt_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = FutureSalt_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of FutureSalt'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = FutureSalt_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of FutureSalt'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class FutureSalts_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(FutureSalts_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = FutureSalts_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of FutureSalts'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = FutureSalts_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of FutureSalts'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Pong_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Pong_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Pong_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Pong'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Pong_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Pong'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class DestroySessionRes_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(DestroySessionRes_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = DestroySessionRes_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of DestroySessionRes'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = DestroySessionRes_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of DestroySessionRes'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class NewSession_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(NewSession_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = NewSession_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of NewSession'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = NewSession_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of NewSession'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MessageContainer_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MessageContainer_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MessageContainer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MessageContainer'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MessageContainer_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MessageContainer'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class Message_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(Message_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Message_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Message'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = Message_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of Message'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MessageCopy_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MessageCopy_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MessageCopy_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MessageCopy'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MessageCopy_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MessageCopy'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgsAck_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgsAck_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsAck_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsAck'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsAck_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsAck'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class BadMsgNotification_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(BadMsgNotification_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = BadMsgNotification_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of BadMsgNotification'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = BadMsgNotification_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of BadMsgNotification'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgResendReq_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgResendReq_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgResendReq_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgResendReq'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgResendReq_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgResendReq'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgsStateReq_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgsStateReq_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsStateReq_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsStateReq'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsStateReq_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsStateReq'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgsStateInfo_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgsStateInfo_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsStateInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsStateInfo'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsStateInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsStateInfo'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgsAllInfo_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgsAllInfo_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsAllInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsAllInfo'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgsAllInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgsAllInfo'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class MsgDetailedInfo_t:
+    constructors = {}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(MsgDetailedInfo_t.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgDetailedInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgDetailedInfo'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = MsgDetailedInfo_t.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{:#x}" is not a constructor of MsgDetailedInfo'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
+
+
+class int128_c:
+    number = pack_number(0x84ccf7b7)
+    is_base = True
+    item_size = 16
+
+    @staticmethod
+    def serialize(_int):
+        return _int.to_bytes(16, byteorder='little', signed=True)
+
+    @staticmethod
+    def serialize_into(buf, _int):
+        buf += _int.to_bytes(16, byteorder='little', signed=True)
+
+    @staticmethod
+    def encoded_size(_int):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, _int):
+        buf[offset:offset + 16] = _int.to_bytes(16, byteorder='little', signed=True)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(int128_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return int.from_bytes(buf[offset:offset + 16], byteorder='little', signed=True), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 16
+combinators[int128_c.number] = int128_c
+
+
+class int256_c:
+    number = pack_number(0x7bedeb5b)
+    is_base = True
+    item_size = 32
+
+    @staticmethod
+    def serialize(_int):
+        return _int.to_bytes(32, byteorder='little', signed=True)
+
+    @staticmethod
+    def serialize_into(buf, _int):
+        buf += _int.to_bytes(32, byteorder='little', signed=True)
+
+    @staticmethod
+    def encoded_size(_int):
+        return 32
+
+    @staticmethod
+    def pack_into(buf, offset, _int):
+        buf[offset:offset + 32] = _int.to_bytes(32, byteorder='little', signed=True)
+        return offset + 32
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(int256_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return int.from_bytes(buf[offset:offset + 32], byteorder='little', signed=True), offset + 32
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 32
+combinators[int256_c.number] = int256_c
+
+
+class resPQ_c:
+    number = pack_number(0x5162463)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('ResPQ', ['nonce', 'server_nonce', 'pq', 'server_public_key_fingerprints'])
+    _column_types = (None, None, 'blob', None)
+    _field_offsets = (0,16,32,)
+    _nested_fields = ()
+    _bytes_fields = (2,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s')
+    _bare_struct_0 = Struct('<16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        resPQ_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += resPQ_c._struct_0.pack(0x5162463, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.pq)
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.server_public_key_fingerprints, long_c)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += resPQ_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.pq)
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.server_public_key_fingerprints, long_c)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = resPQ_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x5162463, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+            bytes_c.serialize_into(buf, data.pq)
+            buf += vector_c.number
+            vector_c.serialize_bare_into(buf, data.server_public_key_fingerprints, long_c)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return (40 +
+                bytes_c.encoded_size(data.pq) +
+                vector_c.encoded_bare_size(data.server_public_key_fingerprints, long_c))
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return (36 +
+                bytes_c.encoded_size(data.pq) +
+                vector_c.encoded_bare_size(data.server_public_key_fingerprints, long_c))
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        resPQ_c._struct_0.pack_into(buf, offset, 0x5162463, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 36, data.pq)
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.server_public_key_fingerprints, long_c)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        resPQ_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 32, data.pq)
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.server_public_key_fingerprints, long_c)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(resPQ_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5162463
+        return resPQ_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce = resPQ_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _pq, offset = bytes_c.decode_from(buf, offset + 32)
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _server_public_key_fingerprints, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        return resPQ_c._data_cls(_nonce, _server_nonce, _pq, _server_public_key_fingerprints), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5162463
+        return resPQ_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 32)
+        offset = vector_c.skip(buf, offset + 4, long_c)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce = resPQ_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _pq, offset = bytes_c.view_from(buf, offset + 32)
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _server_public_key_fingerprints, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_pq)
+        columns[3].append(_server_public_key_fingerprints)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            _pq, offset = bytes_c.decode_from(buf, offset)
+            return _pq, offset
+        if index == 3:
+            assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+            _server_public_key_fingerprints, offset = vector_c.decode_from(buf, offset + 4, long_c)
+            return _server_public_key_fingerprints, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return bytes_c.skip(buf, offset)
+        if index == 3:
+            return vector_c.skip(buf, offset + 4, long_c)
+        raise IndexError(index)
+combinators[resPQ_c.number] = resPQ_c
+data_combinators[resPQ_c._data_cls] = resPQ_c
+data_combinators[resPQ_c._raw_cls] = raw_codec(resPQ_c)
+ResPQ_t.constructors[0x5162463] = resPQ_c
+
+
+class p_q_inner_data_c:
+    number = pack_number(0x83c95aec)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('P_Q_inner_data', ['pq', 'p', 'q', 'nonce', 'server_nonce', 'new_nonce'])
+    _column_types = ('blob', 'blob', 'blob', None, None, None)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = (0, 1, 2)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_1 = Struct('<16s16s32s')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        p_q_inner_data_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += p_q_inner_data_c.number
+        bytes_c.serialize_into(buf, data.pq)
+        bytes_c.serialize_into(buf, data.p)
+        bytes_c.serialize_into(buf, data.q)
+        buf += p_q_inner_data_c._struct_1.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce.to_bytes(32, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        bytes_c.serialize_into(buf, data.pq)
+        bytes_c.serialize_into(buf, data.p)
+        bytes_c.serialize_into(buf, data.q)
+        buf += p_q_inner_data_c._struct_1.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce.to_bytes(32, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = p_q_inner_data_c.number
+        _pack_1 = p_q_inner_data_c._struct_1.pack
+        for data in items:
+            buf += number
+            bytes_c.serialize_into(buf, data.pq)
+            bytes_c.serialize_into(buf, data.p)
+            bytes_c.serialize_into(buf, data.q)
+            buf += _pack_1(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce.to_bytes(32, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return (68 +
+                bytes_c.encoded_size(data.pq) +
+                bytes_c.encoded_size(data.p) +
+                bytes_c.encoded_size(data.q))
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return (64 +
+                bytes_c.encoded_size(data.pq) +
+                bytes_c.encoded_size(data.p) +
+                bytes_c.encoded_size(data.q))
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = p_q_inner_data_c.number
+        offset = bytes_c.pack_into(buf, offset + 4, data.pq)
+        offset = bytes_c.pack_into(buf, offset, data.p)
+        offset = bytes_c.pack_into(buf, offset, data.q)
+        p_q_inner_data_c._struct_1.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce.to_bytes(32, byteorder='little', signed=True))
+        return offset + 64
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        offset = bytes_c.pack_into(buf, offset, data.pq)
+        offset = bytes_c.pack_into(buf, offset, data.p)
+        offset = bytes_c.pack_into(buf, offset, data.q)
+        p_q_inner_data_c._struct_1.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce.to_bytes(32, byteorder='little', signed=True))
+        return offset + 64
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(p_q_inner_data_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x83c95aec
+        return p_q_inner_data_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _pq, offset = bytes_c.decode_from(buf, offset)
+        _p, offset = bytes_c.decode_from(buf, offset)
+        _q, offset = bytes_c.decode_from(buf, offset)
+        _nonce, _server_nonce, _new_nonce = p_q_inner_data_c._struct_1.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce = int.from_bytes(_new_nonce, byteorder='little', signed=True)
+        return p_q_inner_data_c._data_cls(_pq, _p, _q, _nonce, _server_nonce, _new_nonce), offset + 64
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x83c95aec
+        return p_q_inner_data_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset)
+        offset = bytes_c.skip(buf, offset)
+        offset = bytes_c.skip(buf, offset)
+        return offset + 64
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _pq, offset = bytes_c.view_from(buf, offset)
+        _p, offset = bytes_c.view_from(buf, offset)
+        _q, offset = bytes_c.view_from(buf, offset)
+        _nonce, _server_nonce, _new_nonce = p_q_inner_data_c._struct_1.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce = int.from_bytes(_new_nonce, byteorder='little', signed=True)
+        columns[0].append(_pq)
+        columns[1].append(_p)
+        columns[2].append(_q)
+        columns[3].append(_nonce)
+        columns[4].append(_server_nonce)
+        columns[5].append(_new_nonce)
+        return offset + 64
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            _pq, offset = bytes_c.decode_from(buf, offset)
+            return _pq, offset
+        if index == 1:
+            _p, offset = bytes_c.decode_from(buf, offset)
+            return _p, offset
+        if index == 2:
+            _q, offset = bytes_c.decode_from(buf, offset)
+            return _q, offset
+        if index == 3:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 4:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 5:
+            return int.from_bytes(unpack_from('<32s', buf, offset)[0], byteorder='little', signed=True), offset + 32
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return bytes_c.skip(buf, offset)
+        if index == 1:
+            return bytes_c.skip(buf, offset)
+        if index == 2:
+            return bytes_c.skip(buf, offset)
+        if index == 3:
+            return offset + 16
+        if index == 4:
+            return offset + 16
+        if index == 5:
+            return offset + 32
+        raise IndexError(index)
+combinators[p_q_inner_data_c.number] = p_q_inner_data_c
+data_combinators[p_q_inner_data_c._data_cls] = p_q_inner_data_c
+data_combinators[p_q_inner_data_c._raw_cls] = raw_codec(p_q_inner_data_c)
+P_Q_inner_data_t.constructors[0x83c95aec] = p_q_inner_data_c
+
+
+class server_DH_params_fail_c:
+    number = pack_number(0x79cb045d)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Server_DH_Params', ['nonce', 'server_nonce', 'new_nonce_hash'])
+    _column_types = (None, None, None)
+    _field_offsets = (0,16,32,48,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s16s')
+    _bare_struct_0 = Struct('<16s16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        return server_DH_params_fail_c._struct_0.pack(0x79cb045d, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += server_DH_params_fail_c._struct_0.pack(0x79cb045d, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += server_DH_params_fail_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = server_DH_params_fail_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x79cb045d, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 52
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 48
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        server_DH_params_fail_c._struct_0.pack_into(buf, offset, 0x79cb045d, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+        return offset + 52
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        server_DH_params_fail_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash.to_bytes(16, byteorder='little', signed=True))
+        return offset + 48
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(server_DH_params_fail_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x79cb045d
+        return server_DH_params_fail_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _new_nonce_hash = server_DH_params_fail_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash = int.from_bytes(_new_nonce_hash, byteorder='little', signed=True)
+        return server_DH_params_fail_c._data_cls(_nonce, _server_nonce, _new_nonce_hash), offset + 48
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x79cb045d
+        return server_DH_params_fail_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 48
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _new_nonce_hash = server_DH_params_fail_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash = int.from_bytes(_new_nonce_hash, byteorder='little', signed=True)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_new_nonce_hash)
+        return offset + 48
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 16
+        raise IndexError(index)
+combinators[server_DH_params_fail_c.number] = server_DH_params_fail_c
+data_combinators[server_DH_params_fail_c._data_cls] = server_DH_params_fail_c
+data_combinators[server_DH_params_fail_c._raw_cls] = raw_codec(server_DH_params_fail_c)
+Server_DH_Params_t.constructors[0x79cb045d] = server_DH_params_fail_c
+
+
+class server_DH_params_ok_c:
+    number = pack_number(0xd0e8075c)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Server_DH_Params', ['nonce', 'server_nonce', 'encrypted_answer'])
+    _column_types = (None, None, 'blob')
+    _field_offsets = (0,16,32,)
+    _nested_fields = ()
+    _bytes_fields = (2,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s')
+    _bare_struct_0 = Struct('<16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        server_DH_params_ok_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += server_DH_params_ok_c._struct_0.pack(0xd0e8075c, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.encrypted_answer)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += server_DH_params_ok_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.encrypted_answer)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = server_DH_params_ok_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xd0e8075c, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+            bytes_c.serialize_into(buf, data.encrypted_answer)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 36 + bytes_c.encoded_size(data.encrypted_answer)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 32 + bytes_c.encoded_size(data.encrypted_answer)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        server_DH_params_ok_c._struct_0.pack_into(buf, offset, 0xd0e8075c, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 36, data.encrypted_answer)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        server_DH_params_ok_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 32, data.encrypted_answer)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(server_DH_params_ok_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xd0e8075c
+        return server_DH_params_ok_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce = server_DH_params_ok_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _encrypted_answer, offset = bytes_c.decode_from(buf, offset + 32)
+        return server_DH_params_ok_c._data_cls(_nonce, _server_nonce, _encrypted_answer), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xd0e8075c
+        return server_DH_params_ok_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 32)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce = server_DH_params_ok_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _encrypted_answer, offset = bytes_c.view_from(buf, offset + 32)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_encrypted_answer)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            _encrypted_answer, offset = bytes_c.decode_from(buf, offset)
+            return _encrypted_answer, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[server_DH_params_ok_c.number] = server_DH_params_ok_c
+data_combinators[server_DH_params_ok_c._data_cls] = server_DH_params_ok_c
+data_combinators[server_DH_params_ok_c._raw_cls] = raw_codec(server_DH_params_ok_c)
+Server_DH_Params_t.constructors[0xd0e8075c] = server_DH_params_ok_c
+
+
+class server_DH_inner_data_c:
+    number = pack_number(0xb5890dba)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Server_DH_inner_data', ['nonce', 'server_nonce', 'g', 'dh_prime', 'g_a', 'server_time'])
+    _column_types = (None, None, 'i', 'blob', 'blob', 'i')
+    _field_offsets = (0,16,32,36,)
+    _nested_fields = ()
+    _bytes_fields = (3, 4)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16si')
+    _bare_struct_0 = Struct('<16s16si')
+    _struct_1 = Struct('<i')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        server_DH_inner_data_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += server_DH_inner_data_c._struct_0.pack(0xb5890dba, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.g)
+        bytes_c.serialize_into(buf, data.dh_prime)
+        bytes_c.serialize_into(buf, data.g_a)
+        buf += server_DH_inner_data_c._struct_1.pack(data.server_time)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += server_DH_inner_data_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.g)
+        bytes_c.serialize_into(buf, data.dh_prime)
+        bytes_c.serialize_into(buf, data.g_a)
+        buf += server_DH_inner_data_c._struct_1.pack(data.server_time)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = server_DH_inner_data_c._struct_0.pack
+        _pack_1 = server_DH_inner_data_c._struct_1.pack
+        for data in items:
+            buf += _pack_0(0xb5890dba, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.g)
+            bytes_c.serialize_into(buf, data.dh_prime)
+            bytes_c.serialize_into(buf, data.g_a)
+            buf += _pack_1(data.server_time)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return (44 +
+                bytes_c.encoded_size(data.dh_prime) +
+                bytes_c.encoded_size(data.g_a))
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return (40 +
+                bytes_c.encoded_size(data.dh_prime) +
+                bytes_c.encoded_size(data.g_a))
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        server_DH_inner_data_c._struct_0.pack_into(buf, offset, 0xb5890dba, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.g)
+        offset = bytes_c.pack_into(buf, offset + 40, data.dh_prime)
+        offset = bytes_c.pack_into(buf, offset, data.g_a)
+        server_DH_inner_data_c._struct_1.pack_into(buf, offset, data.server_time)
+        return offset + 4
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        server_DH_inner_data_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.g)
+        offset = bytes_c.pack_into(buf, offset + 36, data.dh_prime)
+        offset = bytes_c.pack_into(buf, offset, data.g_a)
+        server_DH_inner_data_c._struct_1.pack_into(buf, offset, data.server_time)
+        return offset + 4
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(server_DH_inner_data_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xb5890dba
+        return server_DH_inner_data_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _g = server_DH_inner_data_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _dh_prime, offset = bytes_c.decode_from(buf, offset + 36)
+        _g_a, offset = bytes_c.decode_from(buf, offset)
+        _server_time, = server_DH_inner_data_c._struct_1.unpack_from(buf, offset)
+        return server_DH_inner_data_c._data_cls(_nonce, _server_nonce, _g, _dh_prime, _g_a, _server_time), offset + 4
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xb5890dba
+        return server_DH_inner_data_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 36)
+        offset = bytes_c.skip(buf, offset)
+        return offset + 4
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _g = server_DH_inner_data_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _dh_prime, offset = bytes_c.view_from(buf, offset + 36)
+        _g_a, offset = bytes_c.view_from(buf, offset)
+        _server_time, = server_DH_inner_data_c._struct_1.unpack_from(buf, offset)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_g)
+        columns[3].append(_dh_prime)
+        columns[4].append(_g_a)
+        columns[5].append(_server_time)
+        return offset + 4
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 3:
+            _dh_prime, offset = bytes_c.decode_from(buf, offset)
+            return _dh_prime, offset
+        if index == 4:
+            _g_a, offset = bytes_c.decode_from(buf, offset)
+            return _g_a, offset
+        if index == 5:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 4
+        if index == 3:
+            return bytes_c.skip(buf, offset)
+        if index == 4:
+            return bytes_c.skip(buf, offset)
+        if index == 5:
+            return offset + 4
+        raise IndexError(index)
+combinators[server_DH_inner_data_c.number] = server_DH_inner_data_c
+data_combinators[server_DH_inner_data_c._data_cls] = server_DH_inner_data_c
+data_combinators[server_DH_inner_data_c._raw_cls] = raw_codec(server_DH_inner_data_c)
+Server_DH_inner_data_t.constructors[0xb5890dba] = server_DH_inner_data_c
+
+
+class client_DH_inner_data_c:
+    number = pack_number(0x6643b654)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Client_DH_Inner_Data', ['nonce', 'server_nonce', 'retry_id', 'g_b'])
+    _column_types = (None, None, 'q', 'blob')
+    _field_offsets = (0,16,32,40,)
+    _nested_fields = ()
+    _bytes_fields = (3,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16sq')
+    _bare_struct_0 = Struct('<16s16sq')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        client_DH_inner_data_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += client_DH_inner_data_c._struct_0.pack(0x6643b654, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.retry_id)
+        bytes_c.serialize_into(buf, data.g_b)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += client_DH_inner_data_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.retry_id)
+        bytes_c.serialize_into(buf, data.g_b)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = client_DH_inner_data_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x6643b654, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.retry_id)
+            bytes_c.serialize_into(buf, data.g_b)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 44 + bytes_c.encoded_size(data.g_b)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 40 + bytes_c.encoded_size(data.g_b)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        client_DH_inner_data_c._struct_0.pack_into(buf, offset, 0x6643b654, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.retry_id)
+        offset = bytes_c.pack_into(buf, offset + 44, data.g_b)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        client_DH_inner_data_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.retry_id)
+        offset = bytes_c.pack_into(buf, offset + 40, data.g_b)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(client_DH_inner_data_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x6643b654
+        return client_DH_inner_data_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _retry_id = client_DH_inner_data_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _g_b, offset = bytes_c.decode_from(buf, offset + 40)
+        return client_DH_inner_data_c._data_cls(_nonce, _server_nonce, _retry_id, _g_b), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x6643b654
+        return client_DH_inner_data_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 40)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _retry_id = client_DH_inner_data_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _g_b, offset = bytes_c.view_from(buf, offset + 40)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_retry_id)
+        columns[3].append(_g_b)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 3:
+            _g_b, offset = bytes_c.decode_from(buf, offset)
+            return _g_b, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 8
+        if index == 3:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[client_DH_inner_data_c.number] = client_DH_inner_data_c
+data_combinators[client_DH_inner_data_c._data_cls] = client_DH_inner_data_c
+data_combinators[client_DH_inner_data_c._raw_cls] = raw_codec(client_DH_inner_data_c)
+Client_DH_Inner_Data_t.constructors[0x6643b654] = client_DH_inner_data_c
+
+
+class dh_gen_ok_c:
+    number = pack_number(0x3bcbf734)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Set_client_DH_params_answer', ['nonce', 'server_nonce', 'new_nonce_hash1'])
+    _column_types = (None, None, None)
+    _field_offsets = (0,16,32,48,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s16s')
+    _bare_struct_0 = Struct('<16s16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        return dh_gen_ok_c._struct_0.pack(0x3bcbf734, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += dh_gen_ok_c._struct_0.pack(0x3bcbf734, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += dh_gen_ok_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = dh_gen_ok_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x3bcbf734, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 52
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 48
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        dh_gen_ok_c._struct_0.pack_into(buf, offset, 0x3bcbf734, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+        return offset + 52
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        dh_gen_ok_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash1.to_bytes(16, byteorder='little', signed=True))
+        return offset + 48
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(dh_gen_ok_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x3bcbf734
+        return dh_gen_ok_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _new_nonce_hash1 = dh_gen_ok_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash1 = int.from_bytes(_new_nonce_hash1, byteorder='little', signed=True)
+        return dh_gen_ok_c._data_cls(_nonce, _server_nonce, _new_nonce_hash1), offset + 48
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x3bcbf734
+        return dh_gen_ok_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 48
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _new_nonce_hash1 = dh_gen_ok_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash1 = int.from_bytes(_new_nonce_hash1, byteorder='little', signed=True)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_new_nonce_hash1)
+        return offset + 48
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 16
+        raise IndexError(index)
+combinators[dh_gen_ok_c.number] = dh_gen_ok_c
+data_combinators[dh_gen_ok_c._data_cls] = dh_gen_ok_c
+data_combinators[dh_gen_ok_c._raw_cls] = raw_codec(dh_gen_ok_c)
+Set_client_DH_params_answer_t.constructors[0x3bcbf734] = dh_gen_ok_c
+
+
+class dh_gen_retry_c:
+    number = pack_number(0x46dc1fb9)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Set_client_DH_params_answer', ['nonce', 'server_nonce', 'new_nonce_hash2'])
+    _column_types = (None, None, None)
+    _field_offsets = (0,16,32,48,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s16s')
+    _bare_struct_0 = Struct('<16s16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        return dh_gen_retry_c._struct_0.pack(0x46dc1fb9, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += dh_gen_retry_c._struct_0.pack(0x46dc1fb9, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += dh_gen_retry_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = dh_gen_retry_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x46dc1fb9, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 52
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 48
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        dh_gen_retry_c._struct_0.pack_into(buf, offset, 0x46dc1fb9, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+        return offset + 52
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        dh_gen_retry_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash2.to_bytes(16, byteorder='little', signed=True))
+        return offset + 48
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(dh_gen_retry_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x46dc1fb9
+        return dh_gen_retry_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _new_nonce_hash2 = dh_gen_retry_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash2 = int.from_bytes(_new_nonce_hash2, byteorder='little', signed=True)
+        return dh_gen_retry_c._data_cls(_nonce, _server_nonce, _new_nonce_hash2), offset + 48
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x46dc1fb9
+        return dh_gen_retry_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 48
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _new_nonce_hash2 = dh_gen_retry_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash2 = int.from_bytes(_new_nonce_hash2, byteorder='little', signed=True)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_new_nonce_hash2)
+        return offset + 48
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 16
+        raise IndexError(index)
+combinators[dh_gen_retry_c.number] = dh_gen_retry_c
+data_combinators[dh_gen_retry_c._data_cls] = dh_gen_retry_c
+data_combinators[dh_gen_retry_c._raw_cls] = raw_codec(dh_gen_retry_c)
+Set_client_DH_params_answer_t.constructors[0x46dc1fb9] = dh_gen_retry_c
+
+
+class dh_gen_fail_c:
+    number = pack_number(0xa69dae02)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Set_client_DH_params_answer', ['nonce', 'server_nonce', 'new_nonce_hash3'])
+    _column_types = (None, None, None)
+    _field_offsets = (0,16,32,48,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s16s')
+    _bare_struct_0 = Struct('<16s16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        return dh_gen_fail_c._struct_0.pack(0xa69dae02, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += dh_gen_fail_c._struct_0.pack(0xa69dae02, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += dh_gen_fail_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = dh_gen_fail_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xa69dae02, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 52
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 48
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        dh_gen_fail_c._struct_0.pack_into(buf, offset, 0xa69dae02, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+        return offset + 52
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        dh_gen_fail_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True), data.new_nonce_hash3.to_bytes(16, byteorder='little', signed=True))
+        return offset + 48
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(dh_gen_fail_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa69dae02
+        return dh_gen_fail_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce, _new_nonce_hash3 = dh_gen_fail_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash3 = int.from_bytes(_new_nonce_hash3, byteorder='little', signed=True)
+        return dh_gen_fail_c._data_cls(_nonce, _server_nonce, _new_nonce_hash3), offset + 48
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa69dae02
+        return dh_gen_fail_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 48
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce, _new_nonce_hash3 = dh_gen_fail_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _new_nonce_hash3 = int.from_bytes(_new_nonce_hash3, byteorder='little', signed=True)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_new_nonce_hash3)
+        return offset + 48
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return offset + 16
+        raise IndexError(index)
+combinators[dh_gen_fail_c.number] = dh_gen_fail_c
+data_combinators[dh_gen_fail_c._data_cls] = dh_gen_fail_c
+data_combinators[dh_gen_fail_c._raw_cls] = raw_codec(dh_gen_fail_c)
+Set_client_DH_params_answer_t.constructors[0xa69dae02] = dh_gen_fail_c
+
+
+class rpc_result_c:
+    number = pack_number(0xf35c6d01)
+    is_base = False
+    _has_floats = True
+    _data_cls = namedtuple('RpcResult', ['req_msg_id', 'result'])
+    _column_types = ('q', None)
+    _field_offsets = (0,8,)
+    _nested_fields = (None, (None, False))
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        rpc_result_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_result_c._struct_0.pack(0xf35c6d01, data.req_msg_id)
+        serialize_object_into(buf, data.result)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += rpc_result_c._bare_struct_0.pack(data.req_msg_id)
+        serialize_object_into(buf, data.result)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = rpc_result_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xf35c6d01, data.req_msg_id)
+            serialize_object_into(buf, data.result)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12 + encoded_size(data.result)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8 + encoded_size(data.result)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        rpc_result_c._struct_0.pack_into(buf, offset, 0xf35c6d01, data.req_msg_id)
+        offset = pack_object_into(buf, offset + 12, data.result)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        rpc_result_c._bare_struct_0.pack_into(buf, offset, data.req_msg_id)
+        offset = pack_object_into(buf, offset + 8, data.result)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_result_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf35c6d01
+        return rpc_result_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _req_msg_id, = rpc_result_c._bare_struct_0.unpack_from(buf, offset)
+        _result, offset = decode_from(buf, offset + 8)
+        return rpc_result_c._data_cls(_req_msg_id, _result), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf35c6d01
+        return rpc_result_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = skip(buf, offset + 8)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _req_msg_id, = rpc_result_c._bare_struct_0.unpack_from(buf, offset)
+        _result, offset = decode_from(buf, offset + 8)
+        columns[0].append(_req_msg_id)
+        columns[1].append(_result)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            _result, offset = decode_from(buf, offset)
+            return _result, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return skip(buf, offset)
+        raise IndexError(index)
+combinators[rpc_result_c.number] = rpc_result_c
+data_combinators[rpc_result_c._data_cls] = rpc_result_c
+data_combinators[rpc_result_c._raw_cls] = raw_codec(rpc_result_c)
+RpcResult_t.constructors[0xf35c6d01] = rpc_result_c
+
+
+class rpc_error_c:
+    number = pack_number(0x2144ca19)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('RpcError', ['error_code', 'error_message'])
+    _column_types = ('i', 'blob')
+    _field_offsets = (0,4,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Ii')
+    _bare_struct_0 = Struct('<i')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        rpc_error_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_error_c._struct_0.pack(0x2144ca19, data.error_code)
+        string_c.serialize_into(buf, data.error_message)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += rpc_error_c._bare_struct_0.pack(data.error_code)
+        string_c.serialize_into(buf, data.error_message)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = rpc_error_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x2144ca19, data.error_code)
+            string_c.serialize_into(buf, data.error_message)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 8 + string_c.encoded_size(data.error_message)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 4 + string_c.encoded_size(data.error_message)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        rpc_error_c._struct_0.pack_into(buf, offset, 0x2144ca19, data.error_code)
+        offset = string_c.pack_into(buf, offset + 8, data.error_message)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        rpc_error_c._bare_struct_0.pack_into(buf, offset, data.error_code)
+        offset = string_c.pack_into(buf, offset + 4, data.error_message)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_error_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x2144ca19
+        return rpc_error_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _error_code, = rpc_error_c._bare_struct_0.unpack_from(buf, offset)
+        _error_message, offset = string_c.decode_from(buf, offset + 4)
+        return rpc_error_c._data_cls(_error_code, _error_message), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x2144ca19
+        return rpc_error_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = string_c.skip(buf, offset + 4)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _error_code, = rpc_error_c._bare_struct_0.unpack_from(buf, offset)
+        _error_message, offset = bytes_c.view_from(buf, offset + 4)
+        columns[0].append(_error_code)
+        columns[1].append(_error_message)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 1:
+            _error_message, offset = string_c.decode_from(buf, offset)
+            return _error_message, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 4
+        if index == 1:
+            return string_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[rpc_error_c.number] = rpc_error_c
+data_combinators[rpc_error_c._data_cls] = rpc_error_c
+data_combinators[rpc_error_c._raw_cls] = raw_codec(rpc_error_c)
+RpcError_t.constructors[0x2144ca19] = rpc_error_c
+
+
+class rpc_answer_unknown_c:
+    number = pack_number(0x5e2ad36e)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('RpcDropAnswer', ['tag', 'number'])
+    _column_types = ()
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    instance = _data_cls(tag='rpc_answer_unknown', number=number)
+
+    @staticmethod
+    def serialize(data=None):
+        return rpc_answer_unknown_c.number
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_answer_unknown_c.number
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        pass
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = rpc_answer_unknown_c.number
+        for data in items:
+            buf += number
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 4
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 0
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = rpc_answer_unknown_c.number
+        return offset + 4
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_answer_unknown_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5e2ad36e
+        return rpc_answer_unknown_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        return rpc_answer_unknown_c.instance, offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5e2ad36e
+        return rpc_answer_unknown_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        raise IndexError(index)
+combinators[rpc_answer_unknown_c.number] = rpc_answer_unknown_c
+data_combinators[rpc_answer_unknown_c._data_cls] = rpc_answer_unknown_c
+RpcDropAnswer_t.constructors[0x5e2ad36e] = rpc_answer_unknown_c
+
+
+class rpc_answer_dropped_running_c:
+    number = pack_number(0xcd78e586)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('RpcDropAnswer', ['tag', 'number'])
+    _column_types = ()
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    instance = _data_cls(tag='rpc_answer_dropped_running', number=number)
+
+    @staticmethod
+    def serialize(data=None):
+        return rpc_answer_dropped_running_c.number
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_answer_dropped_running_c.number
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        pass
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = rpc_answer_dropped_running_c.number
+        for data in items:
+            buf += number
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 4
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 0
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = rpc_answer_dropped_running_c.number
+        return offset + 4
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_answer_dropped_running_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xcd78e586
+        return rpc_answer_dropped_running_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        return rpc_answer_dropped_running_c.instance, offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xcd78e586
+        return rpc_answer_dropped_running_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        raise IndexError(index)
+combinators[rpc_answer_dropped_running_c.number] = rpc_answer_dropped_running_c
+data_combinators[rpc_answer_dropped_running_c._data_cls] = rpc_answer_dropped_running_c
+RpcDropAnswer_t.constructors[0xcd78e586] = rpc_answer_dropped_running_c
+
+
+class rpc_answer_dropped_c:
+    number = pack_number(0xa43ad8b7)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('RpcDropAnswer', ['msg_id', 'seq_no', 'bytes'])
+    _column_types = ('q', 'i', 'i')
+    _field_offsets = (0,8,12,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqii')
+    _bare_struct_0 = Struct('<qii')
+    dtype = numpy_dtype('Iqii', ['number', 'msg_id', 'seq_no', 'bytes'])
+    bare_dtype = numpy_dtype('qii', ['msg_id', 'seq_no', 'bytes'])
+
+    @staticmethod
+    def serialize(data=None):
+        return rpc_answer_dropped_c._struct_0.pack(0xa43ad8b7, data.msg_id, data.seq_no, data.bytes)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_answer_dropped_c._struct_0.pack(0xa43ad8b7, data.msg_id, data.seq_no, data.bytes)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += rpc_answer_dropped_c._bare_struct_0.pack(data.msg_id, data.seq_no, data.bytes)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = rpc_answer_dropped_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xa43ad8b7, data.msg_id, data.seq_no, data.bytes)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        rpc_answer_dropped_c._struct_0.pack_into(buf, offset, 0xa43ad8b7, data.msg_id, data.seq_no, data.bytes)
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        rpc_answer_dropped_c._bare_struct_0.pack_into(buf, offset, data.msg_id, data.seq_no, data.bytes)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_answer_dropped_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa43ad8b7
+        return rpc_answer_dropped_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _msg_id, _seq_no, _bytes = rpc_answer_dropped_c._bare_struct_0.unpack_from(buf, offset)
+        return rpc_answer_dropped_c._data_cls(_msg_id, _seq_no, _bytes), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa43ad8b7
+        return rpc_answer_dropped_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _msg_id, _seq_no, _bytes = rpc_answer_dropped_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_msg_id)
+        columns[1].append(_seq_no)
+        columns[2].append(_bytes)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        raise IndexError(index)
+combinators[rpc_answer_dropped_c.number] = rpc_answer_dropped_c
+data_combinators[rpc_answer_dropped_c._data_cls] = rpc_answer_dropped_c
+data_combinators[rpc_answer_dropped_c._raw_cls] = raw_codec(rpc_answer_dropped_c)
+RpcDropAnswer_t.constructors[0xa43ad8b7] = rpc_answer_dropped_c
+
+
+class future_salt_c:
+    number = pack_number(0x949d9dc)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('FutureSalt', ['valid_since', 'valid_until', 'salt'])
+    _column_types = ('i', 'i', 'q')
+    _field_offsets = (0,4,8,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iiiq')
+    _bare_struct_0 = Struct('<iiq')
+    dtype = numpy_dtype('Iiiq', ['number', 'valid_since', 'valid_until', 'salt'])
+    bare_dtype = numpy_dtype('iiq', ['valid_since', 'valid_until', 'salt'])
+
+    @staticmethod
+    def serialize(data=None):
+        return future_salt_c._struct_0.pack(0x949d9dc, data.valid_since, data.valid_until, data.salt)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += future_salt_c._struct_0.pack(0x949d9dc, data.valid_since, data.valid_until, data.salt)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += future_salt_c._bare_struct_0.pack(data.valid_since, data.valid_until, data.salt)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = future_salt_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x949d9dc, data.valid_since, data.valid_until, data.salt)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        future_salt_c._struct_0.pack_into(buf, offset, 0x949d9dc, data.valid_since, data.valid_until, data.salt)
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        future_salt_c._bare_struct_0.pack_into(buf, offset, data.valid_since, data.valid_until, data.salt)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(future_salt_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x949d9dc
+        return future_salt_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _valid_since, _valid_until, _salt = future_salt_c._bare_struct_0.unpack_from(buf, offset)
+        return future_salt_c._data_cls(_valid_since, _valid_until, _salt), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x949d9dc
+        return future_salt_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _valid_since, _valid_until, _salt = future_salt_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_valid_since)
+        columns[1].append(_valid_until)
+        columns[2].append(_salt)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 4
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 8
+        raise IndexError(index)
+combinators[future_salt_c.number] = future_salt_c
+data_combinators[future_salt_c._data_cls] = future_salt_c
+data_combinators[future_salt_c._raw_cls] = raw_codec(future_salt_c)
+FutureSalt_t.constructors[0x949d9dc] = future_salt_c
+
+
+class future_salts_c:
+    number = pack_number(0xae500895)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('FutureSalts', ['req_msg_id', 'now', 'salts'])
+    _column_types = ('q', 'i', None)
+    _field_offsets = (0,8,12,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqi')
+    _bare_struct_0 = Struct('<qi')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        future_salts_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += future_salts_c._struct_0.pack(0xae500895, data.req_msg_id, data.now)
+        vector_c.serialize_records_into(buf, data.salts, future_salt_c, True)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += future_salts_c._bare_struct_0.pack(data.req_msg_id, data.now)
+        vector_c.serialize_records_into(buf, data.salts, future_salt_c, True)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = future_salts_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xae500895, data.req_msg_id, data.now)
+            vector_c.serialize_records_into(buf, data.salts, future_salt_c, True)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 16 + vector_c.records_encoded_size(data.salts, future_salt_c, True)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 12 + vector_c.records_encoded_size(data.salts, future_salt_c, True)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        future_salts_c._struct_0.pack_into(buf, offset, 0xae500895, data.req_msg_id, data.now)
+        offset = vector_c.pack_records_into(buf, offset + 16, data.salts, future_salt_c, True)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        future_salts_c._bare_struct_0.pack_into(buf, offset, data.req_msg_id, data.now)
+        offset = vector_c.pack_records_into(buf, offset + 12, data.salts, future_salt_c, True)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(future_salts_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xae500895
+        return future_salts_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _req_msg_id, _now = future_salts_c._bare_struct_0.unpack_from(buf, offset)
+        _salts, offset = vector_c.decode_records_from(buf, offset + 12, future_salt_c, True)
+        return future_salts_c._data_cls(_req_msg_id, _now, _salts), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xae500895
+        return future_salts_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip_records(buf, offset + 12, future_salt_c, True)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _req_msg_id, _now = future_salts_c._bare_struct_0.unpack_from(buf, offset)
+        _salts, offset = vector_c.decode_records_from(buf, offset + 12, future_salt_c, True)
+        columns[0].append(_req_msg_id)
+        columns[1].append(_now)
+        columns[2].append(_salts)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            _salts, offset = vector_c.decode_records_from(buf, offset, future_salt_c, True)
+            return _salts, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return vector_c.skip_records(buf, offset, future_salt_c, True)
+        raise IndexError(index)
+combinators[future_salts_c.number] = future_salts_c
+data_combinators[future_salts_c._data_cls] = future_salts_c
+data_combinators[future_salts_c._raw_cls] = raw_codec(future_salts_c)
+FutureSalts_t.constructors[0xae500895] = future_salts_c
+
+
+class pong_c:
+    number = pack_number(0x347773c5)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Pong', ['msg_id', 'ping_id'])
+    _column_types = ('q', 'q')
+    _field_offsets = (0,8,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqq')
+    _bare_struct_0 = Struct('<qq')
+    dtype = numpy_dtype('Iqq', ['number', 'msg_id', 'ping_id'])
+    bare_dtype = numpy_dtype('qq', ['msg_id', 'ping_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return pong_c._struct_0.pack(0x347773c5, data.msg_id, data.ping_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += pong_c._struct_0.pack(0x347773c5, data.msg_id, data.ping_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += pong_c._bare_struct_0.pack(data.msg_id, data.ping_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = pong_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x347773c5, data.msg_id, data.ping_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        pong_c._struct_0.pack_into(buf, offset, 0x347773c5, data.msg_id, data.ping_id)
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        pong_c._bare_struct_0.pack_into(buf, offset, data.msg_id, data.ping_id)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(pong_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x347773c5
+        return pong_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _msg_id, _ping_id = pong_c._bare_struct_0.unpack_from(buf, offset)
+        return pong_c._data_cls(_msg_id, _ping_id), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x347773c5
+        return pong_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _msg_id, _ping_id = pong_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_msg_id)
+        columns[1].append(_ping_id)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 8
+        raise IndexError(index)
+combinators[pong_c.number] = pong_c
+data_combinators[pong_c._data_cls] = pong_c
+data_combinators[pong_c._raw_cls] = raw_codec(pong_c)
+Pong_t.constructors[0x347773c5] = pong_c
+
+
+class destroy_session_ok_c:
+    number = pack_number(0xe22045fc)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('DestroySessionRes', ['session_id'])
+    _column_types = ('q',)
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+    dtype = numpy_dtype('Iq', ['number', 'session_id'])
+    bare_dtype = numpy_dtype('q', ['session_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return destroy_session_ok_c._struct_0.pack(0xe22045fc, data.session_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += destroy_session_ok_c._struct_0.pack(0xe22045fc, data.session_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += destroy_session_ok_c._bare_struct_0.pack(data.session_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = destroy_session_ok_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xe22045fc, data.session_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        destroy_session_ok_c._struct_0.pack_into(buf, offset, 0xe22045fc, data.session_id)
+        return offset + 12
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        destroy_session_ok_c._bare_struct_0.pack_into(buf, offset, data.session_id)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(destroy_session_ok_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe22045fc
+        return destroy_session_ok_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _session_id, = destroy_session_ok_c._bare_struct_0.unpack_from(buf, offset)
+        return destroy_session_ok_c._data_cls(_session_id), offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe22045fc
+        return destroy_session_ok_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 8
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _session_id, = destroy_session_ok_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_session_id)
+        return offset + 8
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        raise IndexError(index)
+combinators[destroy_session_ok_c.number] = destroy_session_ok_c
+data_combinators[destroy_session_ok_c._data_cls] = destroy_session_ok_c
+data_combinators[destroy_session_ok_c._raw_cls] = raw_codec(destroy_session_ok_c)
+DestroySessionRes_t.constructors[0xe22045fc] = destroy_session_ok_c
+
+
+class destroy_session_none_c:
+    number = pack_number(0x62d350c9)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('DestroySessionRes', ['session_id'])
+    _column_types = ('q',)
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+    dtype = numpy_dtype('Iq', ['number', 'session_id'])
+    bare_dtype = numpy_dtype('q', ['session_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return destroy_session_none_c._struct_0.pack(0x62d350c9, data.session_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += destroy_session_none_c._struct_0.pack(0x62d350c9, data.session_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += destroy_session_none_c._bare_struct_0.pack(data.session_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = destroy_session_none_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x62d350c9, data.session_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        destroy_session_none_c._struct_0.pack_into(buf, offset, 0x62d350c9, data.session_id)
+        return offset + 12
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        destroy_session_none_c._bare_struct_0.pack_into(buf, offset, data.session_id)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(destroy_session_none_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x62d350c9
+        return destroy_session_none_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _session_id, = destroy_session_none_c._bare_struct_0.unpack_from(buf, offset)
+        return destroy_session_none_c._data_cls(_session_id), offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x62d350c9
+        return destroy_session_none_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 8
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _session_id, = destroy_session_none_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_session_id)
+        return offset + 8
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        raise IndexError(index)
+combinators[destroy_session_none_c.number] = destroy_session_none_c
+data_combinators[destroy_session_none_c._data_cls] = destroy_session_none_c
+data_combinators[destroy_session_none_c._raw_cls] = raw_codec(destroy_session_none_c)
+DestroySessionRes_t.constructors[0x62d350c9] = destroy_session_none_c
+
+
+class new_session_created_c:
+    number = pack_number(0x9ec20908)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('NewSession', ['first_msg_id', 'unique_id', 'server_salt'])
+    _column_types = ('q', 'q', 'q')
+    _field_offsets = (0,8,16,24,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqqq')
+    _bare_struct_0 = Struct('<qqq')
+    dtype = numpy_dtype('Iqqq', ['number', 'first_msg_id', 'unique_id', 'server_salt'])
+    bare_dtype = numpy_dtype('qqq', ['first_msg_id', 'unique_id', 'server_salt'])
+
+    @staticmethod
+    def serialize(data=None):
+        return new_session_created_c._struct_0.pack(0x9ec20908, data.first_msg_id, data.unique_id, data.server_salt)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += new_session_created_c._struct_0.pack(0x9ec20908, data.first_msg_id, data.unique_id, data.server_salt)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += new_session_created_c._bare_struct_0.pack(data.first_msg_id, data.unique_id, data.server_salt)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = new_session_created_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x9ec20908, data.first_msg_id, data.unique_id, data.server_salt)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 28
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 24
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        new_session_created_c._struct_0.pack_into(buf, offset, 0x9ec20908, data.first_msg_id, data.unique_id, data.server_salt)
+        return offset + 28
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        new_session_created_c._bare_struct_0.pack_into(buf, offset, data.first_msg_id, data.unique_id, data.server_salt)
+        return offset + 24
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(new_session_created_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x9ec20908
+        return new_session_created_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _first_msg_id, _unique_id, _server_salt = new_session_created_c._bare_struct_0.unpack_from(buf, offset)
+        return new_session_created_c._data_cls(_first_msg_id, _unique_id, _server_salt), offset + 24
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x9ec20908
+        return new_session_created_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 24
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _first_msg_id, _unique_id, _server_salt = new_session_created_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_first_msg_id)
+        columns[1].append(_unique_id)
+        columns[2].append(_server_salt)
+        return offset + 24
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 2:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 8
+        if index == 2:
+            return offset + 8
+        raise IndexError(index)
+combinators[new_session_created_c.number] = new_session_created_c
+data_combinators[new_session_created_c._data_cls] = new_session_created_c
+data_combinators[new_session_created_c._raw_cls] = raw_codec(new_session_created_c)
+NewSession_t.constructors[0x9ec20908] = new_session_created_c
+
+
+class msg_container_c:
+    number = pack_number(0x73f1f8dc)
+    is_base = False
+    _has_floats = True
+    _data_cls = namedtuple('MessageContainer', ['messages'])
+    _column_types = (None,)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msg_container_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msg_container_c.number
+        vector_c.serialize_bare_into(buf, data.messages, message_c, True)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        vector_c.serialize_bare_into(buf, data.messages, message_c, True)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msg_container_c.number
+        for data in items:
+            buf += number
+            vector_c.serialize_bare_into(buf, data.messages, message_c, True)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 4 + vector_c.encoded_bare_size(data.messages, message_c, True)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 0 + vector_c.encoded_bare_size(data.messages, message_c, True)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msg_container_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.messages, message_c, True)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        offset = vector_c.pack_bare_into(buf, offset, data.messages, message_c, True)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msg_container_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x73f1f8dc
+        return msg_container_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _messages, offset = vector_c.decode_from(buf, offset, message_c, True)
+        return msg_container_c._data_cls(_messages), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x73f1f8dc
+        return msg_container_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip(buf, offset, message_c, True)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _messages, offset = vector_c.decode_from(buf, offset, message_c, True)
+        columns[0].append(_messages)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            _messages, offset = vector_c.decode_from(buf, offset, message_c, True)
+            return _messages, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return vector_c.skip(buf, offset, message_c, True)
+        raise IndexError(index)
+combinators[msg_container_c.number] = msg_container_c
+data_combinators[msg_container_c._data_cls] = msg_container_c
+data_combinators[msg_container_c._raw_cls] = raw_codec(msg_container_c)
+MessageContainer_t.constructors[0x73f1f8dc] = msg_container_c
+
+
+class message_c:
+    number = pack_number(0x5bb8e511)
+    is_base = False
+    _has_floats = True
+    _data_cls = namedtuple('Message', ['msg_id', 'seqno', 'bytes', 'body'])
+    _column_types = ('q', 'i', 'i', None)
+    _field_offsets = (0,8,12,16,)
+    _nested_fields = (None, None, None, (None, False))
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqii')
+    _bare_struct_0 = Struct('<qii')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        message_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += message_c._struct_0.pack(0x5bb8e511, data.msg_id, data.seqno, data.bytes)
+        serialize_object_into(buf, data.body)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += message_c._bare_struct_0.pack(data.msg_id, data.seqno, data.bytes)
+        serialize_object_into(buf, data.body)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = message_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x5bb8e511, data.msg_id, data.seqno, data.bytes)
+            serialize_object_into(buf, data.body)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20 + encoded_size(data.body)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16 + encoded_size(data.body)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        message_c._struct_0.pack_into(buf, offset, 0x5bb8e511, data.msg_id, data.seqno, data.bytes)
+        offset = pack_object_into(buf, offset + 20, data.body)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        message_c._bare_struct_0.pack_into(buf, offset, data.msg_id, data.seqno, data.bytes)
+        offset = pack_object_into(buf, offset + 16, data.body)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(message_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5bb8e511
+        return message_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _msg_id, _seqno, _bytes = message_c._bare_struct_0.unpack_from(buf, offset)
+        _body, offset = decode_from(buf, offset + 16)
+        return message_c._data_cls(_msg_id, _seqno, _bytes, _body), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x5bb8e511
+        return message_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = skip(buf, offset + 16)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _msg_id, _seqno, _bytes = message_c._bare_struct_0.unpack_from(buf, offset)
+        _body, offset = decode_from(buf, offset + 16)
+        columns[0].append(_msg_id)
+        columns[1].append(_seqno)
+        columns[2].append(_bytes)
+        columns[3].append(_body)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 3:
+            _body, offset = decode_from(buf, offset)
+            return _body, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        if index == 3:
+            return skip(buf, offset)
+        raise IndexError(index)
+combinators[message_c.number] = message_c
+data_combinators[message_c._data_cls] = message_c
+data_combinators[message_c._raw_cls] = raw_codec(message_c)
+Message_t.constructors[0x5bb8e511] = message_c
+
+
+class msg_copy_c:
+    number = pack_number(0xe06046b2)
+    is_base = False
+    _has_floats = True
+    _data_cls = namedtuple('MessageCopy', ['orig_message'])
+    _column_types = (None,)
+    _field_offsets = (0,)
+    _nested_fields = ((Message_t, False),)
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msg_copy_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msg_copy_c.number
+        serialize_object_into(buf, data.orig_message)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        serialize_object_into(buf, data.orig_message)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msg_copy_c.number
+        for data in items:
+            buf += number
+            serialize_object_into(buf, data.orig_message)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 4 + encoded_size(data.orig_message)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 0 + encoded_size(data.orig_message)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msg_copy_c.number
+        offset = pack_object_into(buf, offset + 4, data.orig_message)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        offset = pack_object_into(buf, offset, data.orig_message)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msg_copy_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe06046b2
+        return msg_copy_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _orig_message, offset = Message_t.decode_from(buf, offset)
+        return msg_copy_c._data_cls(_orig_message), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe06046b2
+        return msg_copy_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = Message_t.skip(buf, offset)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _orig_message, offset = Message_t.decode_from(buf, offset)
+        columns[0].append(_orig_message)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            _orig_message, offset = Message_t.decode_from(buf, offset)
+            return _orig_message, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return Message_t.skip(buf, offset)
+        raise IndexError(index)
+combinators[msg_copy_c.number] = msg_copy_c
+data_combinators[msg_copy_c._data_cls] = msg_copy_c
+data_combinators[msg_copy_c._raw_cls] = raw_codec(msg_copy_c)
+MessageCopy_t.constructors[0xe06046b2] = msg_copy_c
+
+
+class gzip_packed_c:
+    number = pack_number(0x3072cfa1)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Object', ['packed_data'])
+    _column_types = ('blob',)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = (0,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        gzip_packed_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += gzip_packed_c.number
+        bytes_c.serialize_into(buf, data.packed_data)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        bytes_c.serialize_into(buf, data.packed_data)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = gzip_packed_c.number
+        for data in items:
+            buf += number
+            bytes_c.serialize_into(buf, data.packed_data)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 4 + bytes_c.encoded_size(data.packed_data)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 0 + bytes_c.encoded_size(data.packed_data)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = gzip_packed_c.number
+        offset = bytes_c.pack_into(buf, offset + 4, data.packed_data)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        offset = bytes_c.pack_into(buf, offset, data.packed_data)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(gzip_packed_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x3072cfa1
+        return gzip_packed_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _packed_data, offset = bytes_c.decode_from(buf, offset)
+        return gzip_packed_c._data_cls(_packed_data), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x3072cfa1
+        return gzip_packed_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _packed_data, offset = bytes_c.view_from(buf, offset)
+        columns[0].append(_packed_data)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            _packed_data, offset = bytes_c.decode_from(buf, offset)
+            return _packed_data, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[gzip_packed_c.number] = gzip_packed_c
+data_combinators[gzip_packed_c._data_cls] = gzip_packed_c
+data_combinators[gzip_packed_c._raw_cls] = raw_codec(gzip_packed_c)
+
+
+class msgs_ack_c:
+    number = pack_number(0x62d6b459)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgsAck', ['msg_ids'])
+    _column_types = (None,)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msgs_ack_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msgs_ack_c.number
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msgs_ack_c.number
+        for data in items:
+            buf += number
+            buf += vector_c.number
+            vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 8 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 4 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msgs_ack_c.number
+        buf[offset + 4:offset + 4 + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 8, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msgs_ack_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x62d6b459
+        return msgs_ack_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        return msgs_ack_c._data_cls(_msg_ids), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x62d6b459
+        return msgs_ack_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip(buf, offset + 4, long_c)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        columns[0].append(_msg_ids)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+            _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+            return _msg_ids, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return vector_c.skip(buf, offset + 4, long_c)
+        raise IndexError(index)
+combinators[msgs_ack_c.number] = msgs_ack_c
+data_combinators[msgs_ack_c._data_cls] = msgs_ack_c
+data_combinators[msgs_ack_c._raw_cls] = raw_codec(msgs_ack_c)
+MsgsAck_t.constructors[0x62d6b459] = msgs_ack_c
+
+
+class bad_msg_notification_c:
+    number = pack_number(0xa7eff811)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('BadMsgNotification', ['bad_msg_id', 'bad_msg_seqno', 'error_code'])
+    _column_types = ('q', 'i', 'i')
+    _field_offsets = (0,8,12,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqii')
+    _bare_struct_0 = Struct('<qii')
+    dtype = numpy_dtype('Iqii', ['number', 'bad_msg_id', 'bad_msg_seqno', 'error_code'])
+    bare_dtype = numpy_dtype('qii', ['bad_msg_id', 'bad_msg_seqno', 'error_code'])
+
+    @staticmethod
+    def serialize(data=None):
+        return bad_msg_notification_c._struct_0.pack(0xa7eff811, data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += bad_msg_notification_c._struct_0.pack(0xa7eff811, data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += bad_msg_notification_c._bare_struct_0.pack(data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = bad_msg_notification_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xa7eff811, data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        bad_msg_notification_c._struct_0.pack_into(buf, offset, 0xa7eff811, data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        bad_msg_notification_c._bare_struct_0.pack_into(buf, offset, data.bad_msg_id, data.bad_msg_seqno, data.error_code)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(bad_msg_notification_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa7eff811
+        return bad_msg_notification_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _bad_msg_id, _bad_msg_seqno, _error_code = bad_msg_notification_c._bare_struct_0.unpack_from(buf, offset)
+        return bad_msg_notification_c._data_cls(_bad_msg_id, _bad_msg_seqno, _error_code), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xa7eff811
+        return bad_msg_notification_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _bad_msg_id, _bad_msg_seqno, _error_code = bad_msg_notification_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_bad_msg_id)
+        columns[1].append(_bad_msg_seqno)
+        columns[2].append(_error_code)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        raise IndexError(index)
+combinators[bad_msg_notification_c.number] = bad_msg_notification_c
+data_combinators[bad_msg_notification_c._data_cls] = bad_msg_notification_c
+data_combinators[bad_msg_notification_c._raw_cls] = raw_codec(bad_msg_notification_c)
+BadMsgNotification_t.constructors[0xa7eff811] = bad_msg_notification_c
+
+
+class bad_server_salt_c:
+    number = pack_number(0xedab447b)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('BadMsgNotification', ['bad_msg_id', 'bad_msg_seqno', 'error_code', 'new_server_salt'])
+    _column_types = ('q', 'i', 'i', 'q')
+    _field_offsets = (0,8,12,16,24,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqiiq')
+    _bare_struct_0 = Struct('<qiiq')
+    dtype = numpy_dtype('Iqiiq', ['number', 'bad_msg_id', 'bad_msg_seqno', 'error_code', 'new_server_salt'])
+    bare_dtype = numpy_dtype('qiiq', ['bad_msg_id', 'bad_msg_seqno', 'error_code', 'new_server_salt'])
+
+    @staticmethod
+    def serialize(data=None):
+        return bad_server_salt_c._struct_0.pack(0xedab447b, data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += bad_server_salt_c._struct_0.pack(0xedab447b, data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += bad_server_salt_c._bare_struct_0.pack(data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = bad_server_salt_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xedab447b, data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 28
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 24
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        bad_server_salt_c._struct_0.pack_into(buf, offset, 0xedab447b, data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+        return offset + 28
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        bad_server_salt_c._bare_struct_0.pack_into(buf, offset, data.bad_msg_id, data.bad_msg_seqno, data.error_code, data.new_server_salt)
+        return offset + 24
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(bad_server_salt_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xedab447b
+        return bad_server_salt_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _bad_msg_id, _bad_msg_seqno, _error_code, _new_server_salt = bad_server_salt_c._bare_struct_0.unpack_from(buf, offset)
+        return bad_server_salt_c._data_cls(_bad_msg_id, _bad_msg_seqno, _error_code, _new_server_salt), offset + 24
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xedab447b
+        return bad_server_salt_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 24
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _bad_msg_id, _bad_msg_seqno, _error_code, _new_server_salt = bad_server_salt_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_bad_msg_id)
+        columns[1].append(_bad_msg_seqno)
+        columns[2].append(_error_code)
+        columns[3].append(_new_server_salt)
+        return offset + 24
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 3:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        if index == 3:
+            return offset + 8
+        raise IndexError(index)
+combinators[bad_server_salt_c.number] = bad_server_salt_c
+data_combinators[bad_server_salt_c._data_cls] = bad_server_salt_c
+data_combinators[bad_server_salt_c._raw_cls] = raw_codec(bad_server_salt_c)
+BadMsgNotification_t.constructors[0xedab447b] = bad_server_salt_c
+
+
+class msg_resend_req_c:
+    number = pack_number(0x7d861a08)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgResendReq', ['msg_ids'])
+    _column_types = (None,)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msg_resend_req_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msg_resend_req_c.number
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msg_resend_req_c.number
+        for data in items:
+            buf += number
+            buf += vector_c.number
+            vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 8 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 4 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msg_resend_req_c.number
+        buf[offset + 4:offset + 4 + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 8, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msg_resend_req_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x7d861a08
+        return msg_resend_req_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        return msg_resend_req_c._data_cls(_msg_ids), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x7d861a08
+        return msg_resend_req_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip(buf, offset + 4, long_c)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        columns[0].append(_msg_ids)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+            _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+            return _msg_ids, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return vector_c.skip(buf, offset + 4, long_c)
+        raise IndexError(index)
+combinators[msg_resend_req_c.number] = msg_resend_req_c
+data_combinators[msg_resend_req_c._data_cls] = msg_resend_req_c
+data_combinators[msg_resend_req_c._raw_cls] = raw_codec(msg_resend_req_c)
+MsgResendReq_t.constructors[0x7d861a08] = msg_resend_req_c
+
+
+class msgs_state_req_c:
+    number = pack_number(0xda69fb52)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgsStateReq', ['msg_ids'])
+    _column_types = (None,)
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msgs_state_req_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msgs_state_req_c.number
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msgs_state_req_c.number
+        for data in items:
+            buf += number
+            buf += vector_c.number
+            vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 8 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 4 + vector_c.encoded_bare_size(data.msg_ids, long_c)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msgs_state_req_c.number
+        buf[offset + 4:offset + 4 + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 8, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.msg_ids, long_c)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msgs_state_req_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xda69fb52
+        return msgs_state_req_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        return msgs_state_req_c._data_cls(_msg_ids), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xda69fb52
+        return msgs_state_req_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip(buf, offset + 4, long_c)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        columns[0].append(_msg_ids)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+            _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+            return _msg_ids, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return vector_c.skip(buf, offset + 4, long_c)
+        raise IndexError(index)
+combinators[msgs_state_req_c.number] = msgs_state_req_c
+data_combinators[msgs_state_req_c._data_cls] = msgs_state_req_c
+data_combinators[msgs_state_req_c._raw_cls] = raw_codec(msgs_state_req_c)
+MsgsStateReq_t.constructors[0xda69fb52] = msgs_state_req_c
+
+
+class msgs_state_info_c:
+    number = pack_number(0x4deb57d)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgsStateInfo', ['req_msg_id', 'info'])
+    _column_types = ('q', 'blob')
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = (1,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msgs_state_info_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msgs_state_info_c._struct_0.pack(0x4deb57d, data.req_msg_id)
+        bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += msgs_state_info_c._bare_struct_0.pack(data.req_msg_id)
+        bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = msgs_state_info_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x4deb57d, data.req_msg_id)
+            bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12 + bytes_c.encoded_size(data.info)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8 + bytes_c.encoded_size(data.info)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        msgs_state_info_c._struct_0.pack_into(buf, offset, 0x4deb57d, data.req_msg_id)
+        offset = bytes_c.pack_into(buf, offset + 12, data.info)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        msgs_state_info_c._bare_struct_0.pack_into(buf, offset, data.req_msg_id)
+        offset = bytes_c.pack_into(buf, offset + 8, data.info)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msgs_state_info_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x4deb57d
+        return msgs_state_info_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _req_msg_id, = msgs_state_info_c._bare_struct_0.unpack_from(buf, offset)
+        _info, offset = bytes_c.decode_from(buf, offset + 8)
+        return msgs_state_info_c._data_cls(_req_msg_id, _info), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x4deb57d
+        return msgs_state_info_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 8)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _req_msg_id, = msgs_state_info_c._bare_struct_0.unpack_from(buf, offset)
+        _info, offset = bytes_c.view_from(buf, offset + 8)
+        columns[0].append(_req_msg_id)
+        columns[1].append(_info)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            _info, offset = bytes_c.decode_from(buf, offset)
+            return _info, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[msgs_state_info_c.number] = msgs_state_info_c
+data_combinators[msgs_state_info_c._data_cls] = msgs_state_info_c
+data_combinators[msgs_state_info_c._raw_cls] = raw_codec(msgs_state_info_c)
+MsgsStateInfo_t.constructors[0x4deb57d] = msgs_state_info_c
+
+
+class msgs_all_info_c:
+    number = pack_number(0x8cc0d131)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgsAllInfo', ['msg_ids', 'info'])
+    _column_types = (None, 'blob')
+    _field_offsets = (0,)
+    _nested_fields = ()
+    _bytes_fields = (1,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        msgs_all_info_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msgs_all_info_c.number
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+        bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+        bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        number = msgs_all_info_c.number
+        for data in items:
+            buf += number
+            buf += vector_c.number
+            vector_c.serialize_bare_into(buf, data.msg_ids, long_c)
+            bytes_c.serialize_into(buf, data.info)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return (8 +
+                vector_c.encoded_bare_size(data.msg_ids, long_c) +
+                bytes_c.encoded_size(data.info))
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return (4 +
+                vector_c.encoded_bare_size(data.msg_ids, long_c) +
+                bytes_c.encoded_size(data.info))
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        buf[offset:offset + 4] = msgs_all_info_c.number
+        buf[offset + 4:offset + 4 + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 8, data.msg_ids, long_c)
+        offset = bytes_c.pack_into(buf, offset, data.info)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        buf[offset:offset + 4] = vector_c.number
+        offset = vector_c.pack_bare_into(buf, offset + 4, data.msg_ids, long_c)
+        offset = bytes_c.pack_into(buf, offset, data.info)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msgs_all_info_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x8cc0d131
+        return msgs_all_info_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        _info, offset = bytes_c.decode_from(buf, offset)
+        return msgs_all_info_c._data_cls(_msg_ids, _info), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x8cc0d131
+        return msgs_all_info_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = vector_c.skip(buf, offset + 4, long_c)
+        offset = bytes_c.skip(buf, offset)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+        _info, offset = bytes_c.view_from(buf, offset)
+        columns[0].append(_msg_ids)
+        columns[1].append(_info)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+            _msg_ids, offset = vector_c.decode_from(buf, offset + 4, long_c)
+            return _msg_ids, offset
+        if index == 1:
+            _info, offset = bytes_c.decode_from(buf, offset)
+            return _info, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return vector_c.skip(buf, offset + 4, long_c)
+        if index == 1:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[msgs_all_info_c.number] = msgs_all_info_c
+data_combinators[msgs_all_info_c._data_cls] = msgs_all_info_c
+data_combinators[msgs_all_info_c._raw_cls] = raw_codec(msgs_all_info_c)
+MsgsAllInfo_t.constructors[0x8cc0d131] = msgs_all_info_c
+
+
+class msg_detailed_info_c:
+    number = pack_number(0x276d3ec6)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgDetailedInfo', ['msg_id', 'answer_msg_id', 'bytes', 'status'])
+    _column_types = ('q', 'q', 'i', 'i')
+    _field_offsets = (0,8,16,20,24,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqqii')
+    _bare_struct_0 = Struct('<qqii')
+    dtype = numpy_dtype('Iqqii', ['number', 'msg_id', 'answer_msg_id', 'bytes', 'status'])
+    bare_dtype = numpy_dtype('qqii', ['msg_id', 'answer_msg_id', 'bytes', 'status'])
+
+    @staticmethod
+    def serialize(data=None):
+        return msg_detailed_info_c._struct_0.pack(0x276d3ec6, data.msg_id, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msg_detailed_info_c._struct_0.pack(0x276d3ec6, data.msg_id, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += msg_detailed_info_c._bare_struct_0.pack(data.msg_id, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = msg_detailed_info_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x276d3ec6, data.msg_id, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 28
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 24
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        msg_detailed_info_c._struct_0.pack_into(buf, offset, 0x276d3ec6, data.msg_id, data.answer_msg_id, data.bytes, data.status)
+        return offset + 28
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        msg_detailed_info_c._bare_struct_0.pack_into(buf, offset, data.msg_id, data.answer_msg_id, data.bytes, data.status)
+        return offset + 24
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msg_detailed_info_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x276d3ec6
+        return msg_detailed_info_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _msg_id, _answer_msg_id, _bytes, _status = msg_detailed_info_c._bare_struct_0.unpack_from(buf, offset)
+        return msg_detailed_info_c._data_cls(_msg_id, _answer_msg_id, _bytes, _status), offset + 24
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x276d3ec6
+        return msg_detailed_info_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 24
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _msg_id, _answer_msg_id, _bytes, _status = msg_detailed_info_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_msg_id)
+        columns[1].append(_answer_msg_id)
+        columns[2].append(_bytes)
+        columns[3].append(_status)
+        return offset + 24
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 3:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 8
+        if index == 2:
+            return offset + 4
+        if index == 3:
+            return offset + 4
+        raise IndexError(index)
+combinators[msg_detailed_info_c.number] = msg_detailed_info_c
+data_combinators[msg_detailed_info_c._data_cls] = msg_detailed_info_c
+data_combinators[msg_detailed_info_c._raw_cls] = raw_codec(msg_detailed_info_c)
+MsgDetailedInfo_t.constructors[0x276d3ec6] = msg_detailed_info_c
+
+
+class msg_new_detailed_info_c:
+    number = pack_number(0x809db6df)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('MsgDetailedInfo', ['answer_msg_id', 'bytes', 'status'])
+    _column_types = ('q', 'i', 'i')
+    _field_offsets = (0,8,12,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqii')
+    _bare_struct_0 = Struct('<qii')
+    dtype = numpy_dtype('Iqii', ['number', 'answer_msg_id', 'bytes', 'status'])
+    bare_dtype = numpy_dtype('qii', ['answer_msg_id', 'bytes', 'status'])
+
+    @staticmethod
+    def serialize(data=None):
+        return msg_new_detailed_info_c._struct_0.pack(0x809db6df, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += msg_new_detailed_info_c._struct_0.pack(0x809db6df, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += msg_new_detailed_info_c._bare_struct_0.pack(data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = msg_new_detailed_info_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x809db6df, data.answer_msg_id, data.bytes, data.status)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        msg_new_detailed_info_c._struct_0.pack_into(buf, offset, 0x809db6df, data.answer_msg_id, data.bytes, data.status)
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        msg_new_detailed_info_c._bare_struct_0.pack_into(buf, offset, data.answer_msg_id, data.bytes, data.status)
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(msg_new_detailed_info_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x809db6df
+        return msg_new_detailed_info_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _answer_msg_id, _bytes, _status = msg_new_detailed_info_c._bare_struct_0.unpack_from(buf, offset)
+        return msg_new_detailed_info_c._data_cls(_answer_msg_id, _bytes, _status), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x809db6df
+        return msg_new_detailed_info_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _answer_msg_id, _bytes, _status = msg_new_detailed_info_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_answer_msg_id)
+        columns[1].append(_bytes)
+        columns[2].append(_status)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        raise IndexError(index)
+combinators[msg_new_detailed_info_c.number] = msg_new_detailed_info_c
+data_combinators[msg_new_detailed_info_c._data_cls] = msg_new_detailed_info_c
+data_combinators[msg_new_detailed_info_c._raw_cls] = raw_codec(msg_new_detailed_info_c)
+MsgDetailedInfo_t.constructors[0x809db6df] = msg_new_detailed_info_c
+
+
+class req_pq_c:
+    number = pack_number(0x60469778)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('ResPQ', ['nonce'])
+    _column_types = (None,)
+    _field_offsets = (0,16,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s')
+    _bare_struct_0 = Struct('<16s')
+
+    @staticmethod
+    def serialize(data=None):
+        return req_pq_c._struct_0.pack(0x60469778, data.nonce.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += req_pq_c._struct_0.pack(0x60469778, data.nonce.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += req_pq_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = req_pq_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x60469778, data.nonce.to_bytes(16, byteorder='little', signed=True))
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 20
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 16
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        req_pq_c._struct_0.pack_into(buf, offset, 0x60469778, data.nonce.to_bytes(16, byteorder='little', signed=True))
+        return offset + 20
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        req_pq_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True))
+        return offset + 16
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(req_pq_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x60469778
+        return req_pq_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, = req_pq_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        return req_pq_c._data_cls(_nonce), offset + 16
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x60469778
+        return req_pq_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 16
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, = req_pq_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        columns[0].append(_nonce)
+        return offset + 16
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        raise IndexError(index)
+combinators[req_pq_c.number] = req_pq_c
+data_combinators[req_pq_c._data_cls] = req_pq_c
+data_combinators[req_pq_c._raw_cls] = raw_codec(req_pq_c)
+
+
+class req_DH_params_c:
+    number = pack_number(0xd712e4be)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Server_DH_Params', ['nonce', 'server_nonce', 'p', 'q', 'public_key_fingerprint', 'encrypted_data'])
+    _column_types = (None, None, 'blob', 'blob', 'q', 'blob')
+    _field_offsets = (0,16,32,)
+    _nested_fields = ()
+    _bytes_fields = (2, 3, 5)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s')
+    _bare_struct_0 = Struct('<16s16s')
+    _struct_1 = Struct('<q')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        req_DH_params_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += req_DH_params_c._struct_0.pack(0xd712e4be, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.p)
+        bytes_c.serialize_into(buf, data.q)
+        buf += req_DH_params_c._struct_1.pack(data.public_key_fingerprint)
+        bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += req_DH_params_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.p)
+        bytes_c.serialize_into(buf, data.q)
+        buf += req_DH_params_c._struct_1.pack(data.public_key_fingerprint)
+        bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = req_DH_params_c._struct_0.pack
+        _pack_1 = req_DH_params_c._struct_1.pack
+        for data in items:
+            buf += _pack_0(0xd712e4be, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+            bytes_c.serialize_into(buf, data.p)
+            bytes_c.serialize_into(buf, data.q)
+            buf += _pack_1(data.public_key_fingerprint)
+            bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return (44 +
+                bytes_c.encoded_size(data.p) +
+                bytes_c.encoded_size(data.q) +
+                bytes_c.encoded_size(data.encrypted_data))
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return (40 +
+                bytes_c.encoded_size(data.p) +
+                bytes_c.encoded_size(data.q) +
+                bytes_c.encoded_size(data.encrypted_data))
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        req_DH_params_c._struct_0.pack_into(buf, offset, 0xd712e4be, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 36, data.p)
+        offset = bytes_c.pack_into(buf, offset, data.q)
+        req_DH_params_c._struct_1.pack_into(buf, offset, data.public_key_fingerprint)
+        offset = bytes_c.pack_into(buf, offset + 8, data.encrypted_data)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        req_DH_params_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 32, data.p)
+        offset = bytes_c.pack_into(buf, offset, data.q)
+        req_DH_params_c._struct_1.pack_into(buf, offset, data.public_key_fingerprint)
+        offset = bytes_c.pack_into(buf, offset + 8, data.encrypted_data)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(req_DH_params_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xd712e4be
+        return req_DH_params_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce = req_DH_params_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _p, offset = bytes_c.decode_from(buf, offset + 32)
+        _q, offset = bytes_c.decode_from(buf, offset)
+        _public_key_fingerprint, = req_DH_params_c._struct_1.unpack_from(buf, offset)
+        _encrypted_data, offset = bytes_c.decode_from(buf, offset + 8)
+        return req_DH_params_c._data_cls(_nonce, _server_nonce, _p, _q, _public_key_fingerprint, _encrypted_data), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xd712e4be
+        return req_DH_params_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 32)
+        offset = bytes_c.skip(buf, offset)
+        offset = bytes_c.skip(buf, offset + 8)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce = req_DH_params_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _p, offset = bytes_c.view_from(buf, offset + 32)
+        _q, offset = bytes_c.view_from(buf, offset)
+        _public_key_fingerprint, = req_DH_params_c._struct_1.unpack_from(buf, offset)
+        _encrypted_data, offset = bytes_c.view_from(buf, offset + 8)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_p)
+        columns[3].append(_q)
+        columns[4].append(_public_key_fingerprint)
+        columns[5].append(_encrypted_data)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            _p, offset = bytes_c.decode_from(buf, offset)
+            return _p, offset
+        if index == 3:
+            _q, offset = bytes_c.decode_from(buf, offset)
+            return _q, offset
+        if index == 4:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 5:
+            _encrypted_data, offset = bytes_c.decode_from(buf, offset)
+            return _encrypted_data, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return bytes_c.skip(buf, offset)
+        if index == 3:
+            return bytes_c.skip(buf, offset)
+        if index == 4:
+            return offset + 8
+        if index == 5:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[req_DH_params_c.number] = req_DH_params_c
+data_combinators[req_DH_params_c._data_cls] = req_DH_params_c
+data_combinators[req_DH_params_c._raw_cls] = raw_codec(req_DH_params_c)
+
+
+class set_client_DH_params_c:
+    number = pack_number(0xf5045f1f)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Set_client_DH_params_answer', ['nonce', 'server_nonce', 'encrypted_data'])
+    _column_types = (None, None, 'blob')
+    _field_offsets = (0,16,32,)
+    _nested_fields = ()
+    _bytes_fields = (2,)
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<I16s16s')
+    _bare_struct_0 = Struct('<16s16s')
+
+    @staticmethod
+    def serialize(data=None):
+        result = bytearray()
+        set_client_DH_params_c.serialize_into(result, data)
+        return bytes(result)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += set_client_DH_params_c._struct_0.pack(0xf5045f1f, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += set_client_DH_params_c._bare_struct_0.pack(data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = set_client_DH_params_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xf5045f1f, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+            bytes_c.serialize_into(buf, data.encrypted_data)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 36 + bytes_c.encoded_size(data.encrypted_data)
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 32 + bytes_c.encoded_size(data.encrypted_data)
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        set_client_DH_params_c._struct_0.pack_into(buf, offset, 0xf5045f1f, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 36, data.encrypted_data)
+        return offset
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        set_client_DH_params_c._bare_struct_0.pack_into(buf, offset, data.nonce.to_bytes(16, byteorder='little', signed=True), data.server_nonce.to_bytes(16, byteorder='little', signed=True))
+        offset = bytes_c.pack_into(buf, offset + 32, data.encrypted_data)
+        return offset
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(set_client_DH_params_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf5045f1f
+        return set_client_DH_params_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _nonce, _server_nonce = set_client_DH_params_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _encrypted_data, offset = bytes_c.decode_from(buf, offset + 32)
+        return set_client_DH_params_c._data_cls(_nonce, _server_nonce, _encrypted_data), offset
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf5045f1f
+        return set_client_DH_params_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        offset = bytes_c.skip(buf, offset + 32)
+        return offset
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _nonce, _server_nonce = set_client_DH_params_c._bare_struct_0.unpack_from(buf, offset)
+        _nonce = int.from_bytes(_nonce, byteorder='little', signed=True)
+        _server_nonce = int.from_bytes(_server_nonce, byteorder='little', signed=True)
+        _encrypted_data, offset = bytes_c.view_from(buf, offset + 32)
+        columns[0].append(_nonce)
+        columns[1].append(_server_nonce)
+        columns[2].append(_encrypted_data)
+        return offset
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 1:
+            return int.from_bytes(unpack_from('<16s', buf, offset)[0], byteorder='little', signed=True), offset + 16
+        if index == 2:
+            _encrypted_data, offset = bytes_c.decode_from(buf, offset)
+            return _encrypted_data, offset
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 16
+        if index == 1:
+            return offset + 16
+        if index == 2:
+            return bytes_c.skip(buf, offset)
+        raise IndexError(index)
+combinators[set_client_DH_params_c.number] = set_client_DH_params_c
+data_combinators[set_client_DH_params_c._data_cls] = set_client_DH_params_c
+data_combinators[set_client_DH_params_c._raw_cls] = raw_codec(set_client_DH_params_c)
+
+
+class rpc_drop_answer_c:
+    number = pack_number(0x58e4a740)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('RpcDropAnswer', ['req_msg_id'])
+    _column_types = ('q',)
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+    dtype = numpy_dtype('Iq', ['number', 'req_msg_id'])
+    bare_dtype = numpy_dtype('q', ['req_msg_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return rpc_drop_answer_c._struct_0.pack(0x58e4a740, data.req_msg_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += rpc_drop_answer_c._struct_0.pack(0x58e4a740, data.req_msg_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += rpc_drop_answer_c._bare_struct_0.pack(data.req_msg_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = rpc_drop_answer_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x58e4a740, data.req_msg_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        rpc_drop_answer_c._struct_0.pack_into(buf, offset, 0x58e4a740, data.req_msg_id)
+        return offset + 12
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        rpc_drop_answer_c._bare_struct_0.pack_into(buf, offset, data.req_msg_id)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(rpc_drop_answer_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x58e4a740
+        return rpc_drop_answer_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _req_msg_id, = rpc_drop_answer_c._bare_struct_0.unpack_from(buf, offset)
+        return rpc_drop_answer_c._data_cls(_req_msg_id), offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x58e4a740
+        return rpc_drop_answer_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 8
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _req_msg_id, = rpc_drop_answer_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_req_msg_id)
+        return offset + 8
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        raise IndexError(index)
+combinators[rpc_drop_answer_c.number] = rpc_drop_answer_c
+data_combinators[rpc_drop_answer_c._data_cls] = rpc_drop_answer_c
+data_combinators[rpc_drop_answer_c._raw_cls] = raw_codec(rpc_drop_answer_c)
+
+
+class get_future_salts_c:
+    number = pack_number(0xb921bd04)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('FutureSalts', ['num'])
+    _column_types = ('i',)
+    _field_offsets = (0,4,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Ii')
+    _bare_struct_0 = Struct('<i')
+    dtype = numpy_dtype('Ii', ['number', 'num'])
+    bare_dtype = numpy_dtype('i', ['num'])
+
+    @staticmethod
+    def serialize(data=None):
+        return get_future_salts_c._struct_0.pack(0xb921bd04, data.num)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += get_future_salts_c._struct_0.pack(0xb921bd04, data.num)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += get_future_salts_c._bare_struct_0.pack(data.num)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = get_future_salts_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xb921bd04, data.num)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 8
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 4
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        get_future_salts_c._struct_0.pack_into(buf, offset, 0xb921bd04, data.num)
+        return offset + 8
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        get_future_salts_c._bare_struct_0.pack_into(buf, offset, data.num)
+        return offset + 4
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(get_future_salts_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xb921bd04
+        return get_future_salts_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _num, = get_future_salts_c._bare_struct_0.unpack_from(buf, offset)
+        return get_future_salts_c._data_cls(_num), offset + 4
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xb921bd04
+        return get_future_salts_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 4
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _num, = get_future_salts_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_num)
+        return offset + 4
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 4
+        raise IndexError(index)
+combinators[get_future_salts_c.number] = get_future_salts_c
+data_combinators[get_future_salts_c._data_cls] = get_future_salts_c
+data_combinators[get_future_salts_c._raw_cls] = raw_codec(get_future_salts_c)
+
+
+class ping_c:
+    number = pack_number(0x7abe77ec)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Pong', ['ping_id'])
+    _column_types = ('q',)
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+    dtype = numpy_dtype('Iq', ['number', 'ping_id'])
+    bare_dtype = numpy_dtype('q', ['ping_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return ping_c._struct_0.pack(0x7abe77ec, data.ping_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += ping_c._struct_0.pack(0x7abe77ec, data.ping_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += ping_c._bare_struct_0.pack(data.ping_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = ping_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x7abe77ec, data.ping_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        ping_c._struct_0.pack_into(buf, offset, 0x7abe77ec, data.ping_id)
+        return offset + 12
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        ping_c._bare_struct_0.pack_into(buf, offset, data.ping_id)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(ping_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x7abe77ec
+        return ping_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _ping_id, = ping_c._bare_struct_0.unpack_from(buf, offset)
+        return ping_c._data_cls(_ping_id), offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x7abe77ec
+        return ping_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 8
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _ping_id, = ping_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_ping_id)
+        return offset + 8
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        raise IndexError(index)
+combinators[ping_c.number] = ping_c
+data_combinators[ping_c._data_cls] = ping_c
+data_combinators[ping_c._raw_cls] = raw_codec(ping_c)
+
+
+class ping_delay_disconnect_c:
+    number = pack_number(0xf3427b8c)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('Pong', ['ping_id', 'disconnect_delay'])
+    _column_types = ('q', 'i')
+    _field_offsets = (0,8,12,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iqi')
+    _bare_struct_0 = Struct('<qi')
+    dtype = numpy_dtype('Iqi', ['number', 'ping_id', 'disconnect_delay'])
+    bare_dtype = numpy_dtype('qi', ['ping_id', 'disconnect_delay'])
+
+    @staticmethod
+    def serialize(data=None):
+        return ping_delay_disconnect_c._struct_0.pack(0xf3427b8c, data.ping_id, data.disconnect_delay)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += ping_delay_disconnect_c._struct_0.pack(0xf3427b8c, data.ping_id, data.disconnect_delay)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += ping_delay_disconnect_c._bare_struct_0.pack(data.ping_id, data.disconnect_delay)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = ping_delay_disconnect_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xf3427b8c, data.ping_id, data.disconnect_delay)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 16
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 12
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        ping_delay_disconnect_c._struct_0.pack_into(buf, offset, 0xf3427b8c, data.ping_id, data.disconnect_delay)
+        return offset + 16
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        ping_delay_disconnect_c._bare_struct_0.pack_into(buf, offset, data.ping_id, data.disconnect_delay)
+        return offset + 12
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(ping_delay_disconnect_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf3427b8c
+        return ping_delay_disconnect_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _ping_id, _disconnect_delay = ping_delay_disconnect_c._bare_struct_0.unpack_from(buf, offset)
+        return ping_delay_disconnect_c._data_cls(_ping_id, _disconnect_delay), offset + 12
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xf3427b8c
+        return ping_delay_disconnect_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 12
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _ping_id, _disconnect_delay = ping_delay_disconnect_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_ping_id)
+        columns[1].append(_disconnect_delay)
+        return offset + 12
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        if index == 1:
+            return offset + 4
+        raise IndexError(index)
+combinators[ping_delay_disconnect_c.number] = ping_delay_disconnect_c
+data_combinators[ping_delay_disconnect_c._data_cls] = ping_delay_disconnect_c
+data_combinators[ping_delay_disconnect_c._raw_cls] = raw_codec(ping_delay_disconnect_c)
+
+
+class destroy_session_c:
+    number = pack_number(0xe7512126)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('DestroySessionRes', ['session_id'])
+    _column_types = ('q',)
+    _field_offsets = (0,8,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iq')
+    _bare_struct_0 = Struct('<q')
+    dtype = numpy_dtype('Iq', ['number', 'session_id'])
+    bare_dtype = numpy_dtype('q', ['session_id'])
+
+    @staticmethod
+    def serialize(data=None):
+        return destroy_session_c._struct_0.pack(0xe7512126, data.session_id)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += destroy_session_c._struct_0.pack(0xe7512126, data.session_id)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += destroy_session_c._bare_struct_0.pack(data.session_id)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = destroy_session_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0xe7512126, data.session_id)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 12
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        destroy_session_c._struct_0.pack_into(buf, offset, 0xe7512126, data.session_id)
+        return offset + 12
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        destroy_session_c._bare_struct_0.pack_into(buf, offset, data.session_id)
+        return offset + 8
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(destroy_session_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe7512126
+        return destroy_session_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _session_id, = destroy_session_c._bare_struct_0.unpack_from(buf, offset)
+        return destroy_session_c._data_cls(_session_id), offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0xe7512126
+        return destroy_session_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 8
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _session_id, = destroy_session_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_session_id)
+        return offset + 8
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<q', buf, offset)[0], offset + 8
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 8
+        raise IndexError(index)
+combinators[destroy_session_c.number] = destroy_session_c
+data_combinators[destroy_session_c._data_cls] = destroy_session_c
+data_combinators[destroy_session_c._raw_cls] = raw_codec(destroy_session_c)
+
+
+class http_wait_c:
+    number = pack_number(0x9299359f)
+    is_base = False
+    _has_floats = False
+    _data_cls = namedtuple('HttpWait', ['max_delay', 'wait_after', 'max_wait'])
+    _column_types = ('i', 'i', 'i')
+    _field_offsets = (0,4,8,12,)
+    _nested_fields = ()
+    _bytes_fields = ()
+    _vector_fields = ()
+    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})
+    _struct_0 = Struct('<Iiii')
+    _bare_struct_0 = Struct('<iii')
+    dtype = numpy_dtype('Iiii', ['number', 'max_delay', 'wait_after', 'max_wait'])
+    bare_dtype = numpy_dtype('iii', ['max_delay', 'wait_after', 'max_wait'])
+
+    @staticmethod
+    def serialize(data=None):
+        return http_wait_c._struct_0.pack(0x9299359f, data.max_delay, data.wait_after, data.max_wait)
+
+    @staticmethod
+    def serialize_into(buf, data=None):
+        buf += http_wait_c._struct_0.pack(0x9299359f, data.max_delay, data.wait_after, data.max_wait)
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        buf += http_wait_c._bare_struct_0.pack(data.max_delay, data.wait_after, data.max_wait)
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        _pack_0 = http_wait_c._struct_0.pack
+        for data in items:
+            buf += _pack_0(0x9299359f, data.max_delay, data.wait_after, data.max_wait)
+
+    @staticmethod
+    def encoded_size(data=None):
+        return 16
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        return 12
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        http_wait_c._struct_0.pack_into(buf, offset, 0x9299359f, data.max_delay, data.wait_after, data.max_wait)
+        return offset + 16
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        http_wait_c._bare_struct_0.pack_into(buf, offset, data.max_delay, data.wait_after, data.max_wait)
+        return offset + 12
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(http_wait_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x9299359f
+        return http_wait_c.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        _max_delay, _wait_after, _max_wait = http_wait_c._bare_struct_0.unpack_from(buf, offset)
+        return http_wait_c._data_cls(_max_delay, _wait_after, _max_wait), offset + 12
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == 0x9299359f
+        return http_wait_c.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        return offset + 12
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        _max_delay, _wait_after, _max_wait = http_wait_c._bare_struct_0.unpack_from(buf, offset)
+        columns[0].append(_max_delay)
+        columns[1].append(_wait_after)
+        columns[2].append(_max_wait)
+        return offset + 12
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        if index == 0:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 1:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        if index == 2:
+            return unpack_from('<i', buf, offset)[0], offset + 4
+        raise IndexError(index)
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        if index == 0:
+            return offset + 4
+        if index == 1:
+            return offset + 4
+        if index == 2:
+            return offset + 4
+        raise IndexError(index)
+combinators[http_wait_c.number] = http_wait_c
+data_combinators[http_wait_c._data_cls] = http_wait_c
+data_combinators[http_wait_c._raw_cls] = raw_codec(http_wait_c)
+
+
+resPQ_c._vector_fields = (None, None, None, (long_c, False, True))
+future_salts_c._vector_fields = (None, None, (future_salt_c, True, False))
+msg_container_c._vector_fields = ((message_c, True, False),)
+msgs_ack_c._vector_fields = ((long_c, False, True),)
+msg_resend_req_c._vector_fields = ((long_c, False, True),)
+msgs_state_req_c._vector_fields = ((long_c, False, True),)
+msgs_all_info_c._vector_fields = ((long_c, False, True), None)
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3.4
 
+import importlib.machinery
 import io
+import os
 import tl
+import unittest
 
 def test_int():
     val = int(1234)
@@ -123,6 +126,713 @@ def test_general():
     serial_data = tl.inputUserForeign_c.serialize(data)
     print(serial_data)
 
+def test_struct_fusion():
+    assert tl.inputPeerForeign_c._struct_0.format in ('<Iiq', b'<Iiq')
+    assert tl.inputFile_c._struct_0.format in ('<Iqi', b'<Iqi')
+
+    data = tl.inputPeerForeign_c._data_cls(user_id=1234, access_hash=-2)
+    result = tl.inputPeerForeign_c.serialize(data)
+
+    ref = tl.inputPeerForeign_c.number
+    ref += int(1234).to_bytes(4, byteorder='little')
+    ref += int(-2).to_bytes(8, byteorder='little', signed=True)
+    assert result == ref, 'incorrect serialization'
+
+    io_bytes = io.BytesIO(result)
+    result = tl.deserialize(io_bytes)
+
+    assert len(io_bytes.read()) == 0, 'Failed to read all the data'
+    assert result == data
+
+    data = tl.inputFile_c._data_cls(id=7, parts=3, name='file', md5_checksum='')
+    io_bytes = io.BytesIO(tl.inputFile_c.serialize(data))
+    result = tl.deserialize(io_bytes)
+    assert result == data
+
+def test_decode_from():
+    result = tl.string_c.decode_from(b'\x07Michael', 0)
+    assert result == ('Michael', 8), 'Error decoding aligned string'
+
+    val = 'x' * 300
+    _bytes = tl.string_c.serialize(val)
+    assert len(_bytes) == 304, 'long string is not properly aligned'
+    assert tl.string_c.decode_from(_bytes, 0) == (val, 304)
+
+    data = tl.inputFile_c._data_cls(id=7, parts=3, name='photo.jpg', md5_checksum='d41d8cd98f')
+    _bytes = bytearray(8) + tl.inputFile_c.serialize(data)
+
+    result, offset = tl.decode_from(memoryview(_bytes), 8)
+    assert offset == len(_bytes), 'Failed to read all the data'
+    assert result == data
+
+    result, offset = tl.inputFile_c.decode_from(bytes(_bytes), 8)
+    assert offset == len(_bytes), 'Failed to read all the data'
+    assert result == data
+
+def _user(id=1, last_name='Parker'):
+    location = tl.fileLocation_c._data_cls(dc_id=2, volume_id=10, local_id=20, secret=30)
+    photo = tl.userProfilePhoto_c._data_cls(photo_id=5, photo_small=location, photo_big=location)
+    return tl.userSelf_c._data_cls(id=id, first_name='Peter', last_name=last_name, username='spidey', phone='555',
+                                   photo=photo, status=tl.userStatusOnline_c._data_cls(expires=1400000000),
+                                   inactive=tl.boolFalse_c.instance)
+
+def test_serialize_into():
+    data = _user()
+
+    buf = bytearray(b'prefix')
+    tl.userSelf_c.serialize_into(buf, data)
+    assert buf[:6] == b'prefix'
+    assert bytes(buf[6:]) == tl.userSelf_c.serialize(data)
+
+    result, offset = tl.decode_from(buf, 6)
+    assert offset == len(buf), 'Failed to read all the data'
+    assert result == data
+
+def test_dispatch():
+    assert tl.InputPeer_t.constructors[0x9b447325] is tl.inputPeerForeign_c
+    assert 0x9db1bc6d not in tl.InputPeer_t.constructors, 'peerUser is not an InputPeer'
+
+    data = tl.inputPeerForeign_c._data_cls(user_id=1234, access_hash=0xDEADBEAF)
+    _bytes = tl.inputPeerForeign_c.serialize(data)
+    assert tl.InputPeer_t.decode_from(_bytes, 0) == (data, len(_bytes))
+
+    status = tl.userStatusOnline_c._data_cls(expires=1400000000)
+    photo = tl.userProfilePhoto_c._data_cls(photo_id=5, photo_small=status, photo_big=status)
+    _bytes = tl.userProfilePhoto_c.serialize(photo)
+
+    try:
+        tl.deserialize(io.BytesIO(_bytes))
+    except Exception as e:
+        assert 'FileLocation' in str(e), str(e)
+    else:
+        assert False, 'decoded a UserStatus as a FileLocation'
+
+    # photos.photo is generated as photos_photo_c, it does not replace photo_c
+    assert tl.Photo_t.constructors[0x22b56751] is tl.photo_c and tl.photos_photo_c is not tl.photo_c
+    photo = tl.photo_c._data_cls(id=1, access_hash=2, user_id=3, date=4, caption='', geo=tl.geoPointEmpty_c.instance,
+                                 sizes=[])
+    media = tl.messageMediaPhoto_c._data_cls(photo=photo)
+    _bytes = tl.messageMediaPhoto_c.serialize(media)
+    assert tl.decode_from(_bytes, 0) == (media, len(_bytes))
+
+def test_vector_bulk():
+    val = [1, -2, 3] * 1000
+    result = tl.serialize(tl.vector_c, val, tl.long_c)
+    assert len(result) == 8 + 8*len(val)
+
+    io_bytes = io.BytesIO(result)
+    assert tl.deserialize(io_bytes, tl.long_c) == val
+    assert len(io_bytes.read()) == 0, 'Failed to read all the data'
+
+    data = tl.messageActionChatCreate_c._data_cls(title='chat', users=[10, 20, 30])
+    _bytes = tl.messageActionChatCreate_c.serialize(data)
+    assert tl.MessageAction_t.decode_from(_bytes, 0) == (data, len(_bytes))
+
+    user = tl.userEmpty_c._data_cls(id=42)
+    imported = tl.importedContact_c._data_cls(user_id=42, client_id=-1)
+    data = tl.contacts_importedContacts_c._data_cls(imported=[imported, imported], retry_contacts=[1, 2**40],
+                                           users=[user])
+    _bytes = tl.contacts_importedContacts_c.serialize(data)
+    assert tl.deserialize(io.BytesIO(_bytes)) == data
+
+def test_int128():
+    nonce = -0x0123456789abcdef0123456789abcdef
+    new_nonce = 2**255 - 1
+
+    assert tl.int128_c.serialize(nonce) == nonce.to_bytes(16, byteorder='little', signed=True)
+    assert tl.int256_c.decode_from(tl.int256_c.serialize(new_nonce), 0) == (new_nonce, 32)
+
+    data = tl.resPQ_c._data_cls(nonce=nonce, server_nonce=1, pq=b'\x17\xed\x48\x94\x1a\x08\xf9\x81',
+                                server_public_key_fingerprints=[-4344800451088585951])
+    _bytes = tl.resPQ_c.serialize(data)
+    assert len(_bytes) == 4 + 32 + 12 + 4 + 4 + 8
+    assert tl.deserialize(io.BytesIO(_bytes)) == data
+
+    data = tl.p_q_inner_data_c._data_cls(pq=b'pq', p=b'p', q=b'q', nonce=nonce, server_nonce=nonce,
+                                         new_nonce=new_nonce)
+    _bytes = tl.p_q_inner_data_c.serialize(data)
+    assert tl.P_Q_inner_data_t.decode_from(_bytes, 0) == (data, len(_bytes))
+
+def test_vector_records():
+    imported = [tl.importedContact_c._data_cls(user_id=i, client_id=-i) for i in range(1000)]
+    data = tl.contacts_importedContacts_c._data_cls(imported=imported, retry_contacts=[], users=[])
+    _bytes = tl.contacts_importedContacts_c.serialize(data)
+    assert len(_bytes) == 4 + 8 + 16*1000 + 16
+    assert tl.deserialize(io.BytesIO(_bytes)) == data
+
+    blocked = tl.contactBlocked_c._data_cls(user_id=1, date=2)
+    _bytes = bytearray()
+    tl.vector_c.serialize_records_into(_bytes, [blocked, blocked], tl.contactBlocked_c)
+    assert bytes(_bytes) == tl.vector_c.serialize([blocked, blocked], tl.ContactBlocked_t)[4:]
+
+    _bytes[16:20] = tl.contactSuggested_c.number
+    try:
+        tl.vector_c.decode_records_from(_bytes, 0, tl.contactBlocked_c)
+    except Exception as e:
+        assert '0x561bc879' in str(e), str(e)
+    else:
+        assert False, 'decoded a contactSuggested as a contactBlocked'
+
+    salts = [tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=-i) for i in range(10)]
+    data = tl.future_salts_c._data_cls(req_msg_id=2**40, now=7, salts=salts)
+    _bytes = tl.future_salts_c.serialize(data)
+    assert len(_bytes) == 4 + 12 + 4 + 16*10, 'vector<future_salt> holds bare items'
+    assert tl.FutureSalts_t.decode_from(memoryview(_bytes), 0) == (data, len(_bytes))
+
+def test_vector_numpy():
+    if tl.numpy is None:
+        raise unittest.SkipTest('numpy is not installed')
+
+    val = [1, -2, 3] * 1000
+    result = tl.serialize(tl.vector_c, val, tl.long_c)
+    array, offset = tl.decode_vector_numpy(result, tl.long_c)
+    assert array.dtype == tl.numpy.int64 and offset == len(result)
+    assert array.tolist() == val
+
+    imported = [tl.importedContact_c._data_cls(user_id=i, client_id=-i) for i in range(100)]
+    _bytes = tl.vector_c.serialize(imported, tl.ImportedContact_t)
+    array, offset = tl.decode_vector_numpy(_bytes, tl.importedContact_c)
+    assert offset == len(_bytes)
+    assert array['user_id'].tolist() == list(range(100))
+    assert array['client_id'].sum() == -sum(range(100))
+
+    salts = [tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=-i) for i in range(10)]
+    _bytes = bytearray()
+    tl.vector_c.serialize_records_into(_bytes, salts, tl.future_salt_c, True)
+    array, offset = tl.decode_vector_numpy(_bytes, tl.future_salt_c, bare=True)
+    assert [tl.future_salt_c._data_cls(*a) for a in array.tolist()] == salts
+
+def test_vector_columns():
+    users = [_user(i, 'Parker' * i) for i in range(3)]
+    users.insert(1, tl.userEmpty_c._data_cls(id=42))
+    _bytes = tl.vector_c.serialize(users, tl.User_t)
+
+    partitions, offset = tl.decode_vector_columns(_bytes)
+    assert offset == len(_bytes), 'Failed to read all the data'
+    assert set(partitions) == {tl.userSelf_c, tl.userEmpty_c}
+
+    rows, columns = partitions[tl.userEmpty_c]
+    assert list(rows) == [1] and list(columns['id']) == [42]
+
+    rows, columns = partitions[tl.userSelf_c]
+    assert list(rows) == [0, 2, 3]
+    assert list(columns) == list(tl.userSelf_c._data_cls._fields)
+    assert columns['id'].tolist() == [0, 1, 2]
+    assert columns['last_name'][2] == b'ParkerParker'
+    assert list(columns['last_name'].offsets) == [0, 0, 6, 18]
+    assert columns['status'] == [users[0].status] * 3
+
+    tl.use_bytes_spill(threshold=4)
+    try:
+        partitions = tl.decode_vector_columns(_bytes)[0]
+    finally:
+        tl.use_bytes_spill(None)
+    assert partitions[tl.userSelf_c].columns['last_name'][2] == b'ParkerParker'
+
+def test_lazy():
+    data = _user()
+    _bytes = bytearray(tl.userSelf_c.serialize(data))
+
+    view = tl.decode_lazy_from(_bytes)
+    assert view.id == 1
+    assert view._offsets == [4, 8], 'a fixed-offset field decoded the fields after it'
+    assert view.username == 'spidey'
+    assert len(view._offsets) == 5 and view._values[4] is tl._unset
+    assert view.status == data.status
+    assert view.end == len(_bytes)
+    assert view.decode() == data
+
+    view = tl.decode_lazy_from(tl.fileLocation_c.serialize(data.photo.photo_small))
+    assert view.secret == 30 and view._values[:3] == [tl._unset] * 3
+
+    view = tl.decode_lazy_from(tl.boolFalse_c.serialize())
+    assert view.decode() == data.inactive and view.tag == 'boolFalse'
+
+def test_skip():
+    user = _user(last_name='Parker' * 50)
+    imported = tl.importedContact_c._data_cls(user_id=42, client_id=-1)
+    data = tl.contacts_importedContacts_c._data_cls(imported=[imported] * 3, retry_contacts=[1, 2], users=[user, user])
+    _bytes = b'head' + tl.contacts_importedContacts_c.serialize(data) + b'tail'
+
+    assert tl.encoded_length(_bytes, 4) == len(_bytes) - 8
+    assert tl.contacts_importedContacts_c.skip(_bytes, 4) == len(_bytes) - 4
+    assert tl.contacts_ImportedContacts_t.skip(memoryview(_bytes), 4) == len(_bytes) - 4
+
+    user_bytes = tl.userSelf_c.serialize(user)
+    offset = _bytes.index(user_bytes)
+    assert tl.skip(_bytes, offset) == offset + len(user_bytes)
+    assert tl.vector_c.skip(_bytes, offset - 4) == len(_bytes) - 4
+
+    salts = [tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=-i) for i in range(10)]
+    _bytes = tl.future_salts_c.serialize(tl.future_salts_c._data_cls(req_msg_id=1, now=2, salts=salts))
+    assert tl.encoded_length(_bytes) == len(_bytes)
+
+def test_encoded_size():
+    assert tl.bytes_c.encoded_size(b'') == 4
+    assert tl.bytes_c.encoded_size(b'x' * 253) == 256
+    assert tl.bytes_c.encoded_size(b'x' * 254) == 260
+    assert tl.string_c.encoded_size('\u00e9' * 3) == 8
+
+    users = [_user(i, 'Parker' * 50 * i) for i in range(3)]
+    imported = tl.importedContact_c._data_cls(user_id=42, client_id=-1)
+    data = tl.contacts_importedContacts_c._data_cls(imported=[imported] * 3, retry_contacts=[1, 2], users=users)
+
+    _bytes = tl.contacts_importedContacts_c.serialize(data)
+    buf = bytearray()
+    tl.contacts_importedContacts_c.serialize_into(buf, data)
+    assert _bytes == bytes(buf)
+    assert tl.encoded_size(data) == len(_bytes)
+    assert tl.deserialize(io.BytesIO(_bytes)) == data
+
+    buf = bytearray(len(_bytes) + 3)
+    assert tl.pack_object_into(memoryview(buf), 3, data) == len(buf)
+    assert bytes(buf[3:]) == _bytes
+
+def test_singletons():
+    _bytes = tl.inputPeerEmpty_c.serialize()
+    assert tl.InputPeer_t.decode_from(_bytes, 0)[0] is tl.inputPeerEmpty_c.instance
+    assert tl.decode_from(_bytes, 0)[0] is tl.decode_from(_bytes, 0)[0]
+
+    data = tl.contactStatus_c._data_cls(user_id=1, status=tl.userStatusEmpty_c.instance)
+    assert tl.deserialize(io.BytesIO(tl.contactStatus_c.serialize(data))).status is tl.userStatusEmpty_c.instance
+
+    data = tl.contacts_importContacts_c._data_cls(contacts=[], replace=True)
+    _bytes = tl.contacts_importContacts_c.serialize(data)
+    assert _bytes[-4:] == tl.boolTrue_c.number
+    assert tl.deserialize(io.BytesIO(_bytes)).replace is tl.boolTrue_c.instance
+
+    tl.use_native_bool()
+    try:
+        assert tl.deserialize(io.BytesIO(_bytes)) == data
+        assert tl.Bool_t.decode_from(tl.boolFalse_c.number, 0) == (False, 4)
+    finally:
+        tl.use_native_bool(False)
+    assert tl.Bool_t.decode_from(tl.boolFalse_c.number, 0)[0] is tl.boolFalse_c.instance
+
+def test_serialization_cache():
+    peer = tl.inputPeerForeign_c._data_cls(user_id=1234, access_hash=0xDEADBEAF)
+    other = tl.inputPeerContact_c._data_cls(user_id=1234)
+    data = [tl.messages_sendMessage_c._data_cls(peer=p, message='hi', random_id=i) for i in range(3) for p in (peer, other)]
+    expected = [tl.messages_sendMessage_c.serialize(d) for d in data]
+
+    cache = tl.serialization_cache(max_entries=1)
+    tl.set_serialization_cache(cache)
+    try:
+        assert [tl.messages_sendMessage_c.serialize(d) for d in data] == expected
+        assert (cache.hits, cache.misses) == (0, 6), 'max_entries is not enforced'
+
+        cache.max_entries = 2
+        assert [tl.messages_sendMessage_c.serialize(d) for d in data] == expected
+        assert (cache.hits, cache.misses) == (5, 7)
+        assert cache.size == len(tl.inputPeerForeign_c.serialize(peer)) + len(tl.inputPeerContact_c.serialize(other))
+
+        buf = bytearray()
+        tl.serialize_object_into(buf, peer)
+        assert bytes(buf) == tl.inputPeerForeign_c.serialize(peer) and cache.hits == 6
+
+        unhashable = tl.contacts_importedContacts_c._data_cls(imported=[], retry_contacts=[1], users=[])
+        buf = bytearray()
+        tl.serialize_object_into(buf, unhashable)
+        assert bytes(buf) == tl.contacts_importedContacts_c.serialize(unhashable) and cache.misses == 7
+
+        cache.max_entries = 100
+        online = _user()
+        offline = online._replace(status=tl.userStatusOffline_c._data_cls(was_online=1400000000))
+        for user in (online, offline):
+            buf = bytearray()
+            tl.serialize_object_into(buf, user)
+            assert bytes(buf) == tl.userSelf_c.serialize(user), 'bytes of another nested constructor were cached'
+
+        misses = cache.misses
+        for lat in (0.0, -0.0):
+            point = tl.inputGeoPoint_c._data_cls(lat=lat, long=1.0)
+            buf = bytearray()
+            tl.serialize_object_into(buf, point)
+            assert bytes(buf) == tl.inputGeoPoint_c.serialize(point)
+        assert cache.lookup(point) is None and cache.misses == misses, 'a value with doubles was cached'
+    finally:
+        tl.set_serialization_cache(None)
+
+def test_intern_table():
+    users = [_user(i % 2) for i in range(4)]
+    _bytes = tl.vector_c.serialize(users, tl.User_t)
+
+    result = tl.vector_c.decode_from(_bytes, 4, tl.User_t)[0]
+    assert result == users and result[0] is not result[2]
+
+    table = tl.intern_table(max_entries=100)
+    with table:
+        result = tl.vector_c.decode_from(_bytes, 4, tl.User_t)[0]
+    assert tl._intern_table is None
+    assert result == users
+    assert result[0] is result[2] and result[1] is result[3] and result[0] is not result[1]
+    assert result[0].first_name is result[1].first_name
+    assert result[0].photo is result[1].photo
+
+    online = _user()
+    offline = online._replace(status=tl.userStatusOffline_c._data_cls(was_online=1400000000))
+    encoded = tl.vector_c.serialize([online, offline], tl.User_t)
+    with tl.intern_table():
+        result = tl.vector_c.decode_from(encoded, 4, tl.User_t)[0]
+    assert result == [online, offline]
+    assert type(result[1].status) is tl.userStatusOffline_c._data_cls, 'a value with another nested constructor was shared'
+
+    points = [tl.inputGeoPoint_c._data_cls(lat=lat, long=1.0) for lat in (0.0, -0.0)]
+    encoded = tl.vector_c.serialize(points, tl.InputGeoPoint_t)
+    with tl.intern_table():
+        result = tl.vector_c.decode_from(encoded, 4, tl.InputGeoPoint_t)[0]
+    assert str(result[1].lat) == '-0.0', 'a value with doubles was interned'
+
+    first, second = tl.intern_table(), tl.intern_table()
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert tl._intern_table is second
+    second.__exit__(None, None, None)
+    assert tl._intern_table is None, 'blocks exiting out of order left a table installed'
+
+    table = tl.intern_table(max_entries=1)
+    tl.set_intern_table(table)
+    try:
+        tl.vector_c.decode_from(_bytes, 4, tl.User_t)
+        assert len(table.values) == 1
+    finally:
+        tl.set_intern_table(None)
+
+def test_lazy_text():
+    data = tl.inputFile_c._data_cls(id=7, parts=3, name='h\u00e9llo', md5_checksum='d41d8cd98f')
+    _bytes = tl.inputFile_c.serialize(data)
+
+    tl.use_lazy_text()
+    try:
+        result = tl.deserialize(io.BytesIO(_bytes))
+    finally:
+        tl.use_lazy_text(False)
+
+    name = result.name
+    assert isinstance(name, tl.lazy_text)
+    assert name.raw == 'h\u00e9llo'.encode() and name._text is None
+    assert tl.inputFile_c.serialize(result) == _bytes and name._text is None, 'forwarding decoded the text'
+    assert name == 'h\u00e9llo' and str(name) == 'h\u00e9llo'
+    assert name.upper() == 'H\u00c9LLO' and len(name) == 5 and 'llo' in name
+    assert result == data and hash(name) == hash('h\u00e9llo')
+
+def test_zero_copy_bytes():
+    payload = bytes(range(256)) * 2048
+    data = tl.p_q_inner_data_c._data_cls(pq=payload, p=b'p', q=b'q', nonce=1, server_nonce=2, new_nonce=3)
+    buf = bytearray(tl.p_q_inner_data_c.serialize(data))
+
+    tl.use_zero_copy_bytes()
+    try:
+        result, offset = tl.decode_from(buf, 0)
+        io_bytes = io.BytesIO(bytes(buf))
+        from_io = tl.deserialize(io_bytes)
+    finally:
+        tl.use_zero_copy_bytes(False)
+
+    assert offset == len(buf) and result == data and from_io == data
+    assert isinstance(result.pq, memoryview) and result.pq.obj is buf
+    assert tl.p_q_inner_data_c.serialize(result) == bytes(buf)
+
+    buf[8] ^= 0xff
+    assert result.pq[0] == payload[0] ^ 0xff, 'the field does not share the buffer'
+    try:
+        buf.append(0)
+    except BufferError:
+        pass
+    else:
+        assert False, 'resized a buffer with live slices'
+    del result
+
+    buf.append(0)
+    assert from_io.q == b'q'
+
+    tl.use_zero_copy_bytes()
+    tl.use_lazy_text()
+    try:
+        _bytes = tl.inputFile_c.serialize(tl.inputFile_c._data_cls(id=1, parts=2, name='name', md5_checksum='md5'))
+        result = tl.decode_from(_bytes, 0)[0]
+    finally:
+        tl.use_lazy_text(False)
+        tl.use_zero_copy_bytes(False)
+    assert isinstance(result.name.raw, memoryview)
+    assert bytes(result.name) == result.name.encode() == b'name' and type(result.name.encode()) is bytes
+
+    # slices of a writable buffer are writable memoryviews, which can not be hashed
+    data = tl.p_q_inner_data_c._data_cls(pq=b'pq', p=b'p', q=b'q', nonce=1, server_nonce=2, new_nonce=3)
+    buf = bytearray(tl.p_q_inner_data_c.serialize(data))
+    tl.use_zero_copy_bytes()
+    tl.set_serialization_cache(tl.serialization_cache())
+    try:
+        with tl.intern_table():
+            result = tl.decode_from(buf, 0)[0]
+            from_io = tl.deserialize(io.BytesIO(bytes(buf)))
+        assert tl.serialize_segments(result) == [buf]
+    finally:
+        tl.set_serialization_cache(None)
+        tl.use_zero_copy_bytes(False)
+    assert result == from_io == data and isinstance(result.pq, memoryview)
+
+def test_serialize_segments():
+    payload = bytes(512 * 1024 + 1)
+    data = tl.upload_saveFilePart_c._data_cls(file_id=1, file_part=2, bytes=payload)
+
+    segments = tl.serialize_segments(data)
+    assert len(segments) == 3
+    assert segments[1] is payload, 'the payload was copied'
+    assert b''.join(segments) == tl.upload_saveFilePart_c.serialize(data)
+    assert len(segments[0]) == 4 + 8 + 4 + 4 and segments[2] == b'\x00' * 3
+
+    writer = tl.segment_writer()
+    tl.upload_saveFilePart_c.serialize_into(writer, data._replace(bytes=b'x'))
+    assert len(writer) == 20
+    assert writer.segments() == [tl.upload_saveFilePart_c.serialize(data._replace(bytes=b'x'))]
+
+def test_bytes_spill():
+    payload = bytes(range(256)) * 4096
+    data = tl.p_q_inner_data_c._data_cls(pq=payload, p=b'p', q=b'q', nonce=1, server_nonce=2, new_nonce=3)
+    _bytes = tl.p_q_inner_data_c.serialize(data)
+
+    sink = io.BytesIO(b'head')
+    sink.seek(4)
+    tl.use_bytes_spill(threshold=1024, sink=lambda: sink)
+    try:
+        result = tl.deserialize(io.BytesIO(_bytes))
+    finally:
+        tl.use_bytes_spill(None)
+
+    assert isinstance(result.pq, tl.spilled_bytes) and result.p == b'p'
+    assert (result.pq.offset, len(result.pq)) == (4, len(payload))
+    assert sink.getvalue() == b'head' + payload
+    assert result == data
+    assert tl.p_q_inner_data_c.serialize(result) == _bytes
+
+    tl.use_bytes_spill(threshold=1024)
+    try:
+        result = tl.decode_from(_bytes, 0)[0]
+    finally:
+        tl.use_bytes_spill(None)
+    assert result.pq.read() == payload
+    assert tl.decode_from(_bytes, 0)[0].pq == payload
+
+    tl.use_bytes_spill(threshold=1024)
+    try:
+        decoder = tl.stream_decoder()
+        results, buffered = [], 0
+        for i in range(0, 2*len(_bytes), 4096):
+            results += decoder.feed((_bytes + _bytes)[i:i + 4096])
+            buffered = max(buffered, len(decoder._buf))
+    finally:
+        tl.use_bytes_spill(None)
+    assert results == [data, data] and buffered < 3*4096, 'the spilled field was kept in memory'
+    assert results[0].pq.file is not results[1].pq.file, 'the spilled fields share a file'
+    assert results[0].pq.read() == results[1].pq.read() == payload
+
+    files = [r.pq.file for r in results]
+    results[0].pq.close()
+    assert files[0].closed and not files[1].closed
+    del results
+    assert files[1].closed, 'the file of a collected field was kept open'
+    assert not sink.closed
+
+def test_raw_slices():
+    user = _user()
+    _bytes = tl.userSelf_c.serialize(user)
+
+    tl.use_raw_slices()
+    try:
+        result = tl.deserialize(io.BytesIO(_bytes))
+    finally:
+        tl.use_raw_slices(False)
+
+    assert result == user and result._raw == _bytes
+    assert result.photo._raw == tl.userProfilePhoto_c.serialize(user.photo)
+    assert result.photo._raw.obj is result._raw, 'a nested value copied its wire bytes'
+    assert repr(result).startswith('User(')
+
+    buf = bytearray()
+    tl.serialize_object_into(buf, result)
+    assert buf == _bytes and tl.encoded_size(result) == len(_bytes)
+
+    changed = result._replace(first_name='Mary Jane')
+    assert changed._raw is None and changed.photo is result.photo
+    buf = bytearray()
+    tl.serialize_object_into(buf, changed)
+    assert buf == tl.userSelf_c.serialize(user._replace(first_name='Mary Jane'))
+
+    data = tl.updateDeleteMessages_c._data_cls(messages=[1, 2], pts=3)
+    _bytes = tl.updateDeleteMessages_c.serialize(data)
+    tl.use_raw_slices()
+    try:
+        result = tl.decode_from(_bytes, 0)[0]
+    finally:
+        tl.use_raw_slices(False)
+    assert result.messages == (1, 2) and result._raw == _bytes
+    changed = result._replace(messages=result.messages + (4,))
+    assert tl.encoded_size(changed) == len(_bytes) + 4
+    assert tl.updateDeleteMessages_c.serialize(changed) == tl.updateDeleteMessages_c.serialize(data._replace(messages=[1, 2, 4]))
+
+    buf = bytearray(tl.updates_difference_c.serialize(_difference(3)))
+    expected = bytes(buf)
+    tl.use_raw_slices()
+    try:
+        results = [tl.decode_from(buf, 0)[0], tl.decode_iterative(buf)[0]]
+    finally:
+        tl.use_raw_slices(False)
+    buf[:] = bytes(len(buf))
+    for result in results:
+        assert result._raw == expected and type(result._raw) is bytes
+        message = result.new_messages[0]
+        assert message._raw.obj is message.to_id._raw.obj is result._raw, 'a nested value copied its wire bytes'
+        assert tl.serialize_segments(message) == [tl.message_c.serialize(message)]
+
+def test_request_template():
+    location = tl.inputFileLocation_c._data_cls(volume_id=10, local_id=20, secret=30)
+    request = tl.upload_getFile_c._data_cls(location=location, offset=0, limit=1024)
+    prefix = tl.pack_number(0xda9b0d0d) + tl.int_c.serialize(23)
+    template = tl.request_template(tl.upload_getFile_c, request, variable=['offset'], prefix=prefix)
+
+    for offset in (0, 1024, 4096):
+        _bytes = template.fill(offset=offset)
+        assert _bytes == prefix + tl.upload_getFile_c.serialize(request._replace(offset=offset))
+        assert len(template) == len(_bytes)
+
+    try:
+        tl.request_template(tl.upload_getFile_c, request, variable=['location'])
+        assert False
+    except Exception as e:
+        assert 'fixed-width' in str(e)
+
+def test_serialize_many():
+    contacts = [tl.inputPhoneContact_c._data_cls(client_id=i, phone=str(i), first_name='Peter', last_name='Parker')
+                for i in range(100)]
+    _bytes = tl.serialize_many(tl.inputPhoneContact_c, contacts)
+    assert _bytes == b''.join(tl.inputPhoneContact_c.serialize(c) for c in contacts)
+
+    salts = (tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=i) for i in range(3))
+    assert tl.serialize_many(tl.future_salt_c, salts) == b''.join(
+        tl.future_salt_c.serialize(tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=i)) for i in range(3))
+
+    assert tl.serialize_many(tl.boolTrue_c, [None]*3) == tl.boolTrue_c.number*3
+    assert tl.serialize_many(tl.inputPhoneContact_c, []) == b''
+
+def _difference(count):
+    geo = tl.geoPoint_c._data_cls(long=1.5, lat=2.5)
+    message = tl.message_c._data_cls(flags=0, id=1, from_id=2, to_id=tl.peerUser_c._data_cls(user_id=3), date=4,
+                                     message='hello', media=tl.messageMediaGeo_c._data_cls(geo=geo))
+    user = _user()
+    updates = [tl.updateNewMessage_c._data_cls(message=message, pts=1),
+               tl.updateDeleteMessages_c._data_cls(messages=[1, 2], pts=2)]
+    state = tl.updates_state_c._data_cls(pts=1, qts=2, date=3, seq=4, unread_count=5)
+    return tl.updates_difference_c._data_cls(new_messages=[message]*count, new_encrypted_messages=[],
+                                     other_updates=updates*count, chats=[tl.chatEmpty_c._data_cls(id=7)],
+                                     users=[user]*count, state=state)
+
+def test_decode_iterative():
+    data = _difference(3)
+    _bytes = tl.updates_difference_c.serialize(data)
+
+    assert tl.decode_iterative(_bytes) == (data, len(_bytes))
+    assert tl.decode_iterative(_bytes, max_depth=4) == (data, len(_bytes))
+    _int = tl.int_c.number + tl.int_c.serialize(5)
+    assert tl.decode_iterative(_int) == tl.decode_from(_int, 0) == (5, 8)
+
+    try:
+        tl.decode_iterative(_bytes, max_depth=3)
+        assert False
+    except Exception as e:
+        assert 'deeper than 3' in str(e)
+
+    tl.use_raw_slices()
+    try:
+        result = tl.decode_iterative(_bytes)[0]
+    finally:
+        tl.use_raw_slices(False)
+    assert result._raw == _bytes and result.users[0]._raw == tl.userSelf_c.serialize(data.users[0])
+
+def test_stream_decoder():
+    data = _difference(2)
+    location = tl.fileLocation_c._data_cls(dc_id=2, volume_id=10, local_id=20, secret=30)
+    values = [data, location, 'x' * 300, data]
+    _bytes = tl.updates_difference_c.serialize(data) + tl.fileLocation_c.serialize(location)
+    _bytes += tl.string_c.number + tl.string_c.serialize('x' * 300) + tl.updates_difference_c.serialize(data)
+
+    for size in (1, 3, 64, len(_bytes)):
+        decoder = tl.stream_decoder()
+        results = []
+        for i in range(0, len(_bytes), size):
+            results += decoder.feed(_bytes[i:i + size])
+        assert results == values and not decoder.pending
+
+    decoder = tl.stream_decoder()
+    assert decoder.feed(_bytes[:100]) == [] and decoder.pending
+    assert decoder._state.stack, 'the partly received value is not kept'
+    assert decoder.feed(_bytes[100:]) == values
+
+    decoder = tl.stream_decoder(max_depth=3)
+    try:
+        decoder.feed(_bytes)
+        assert False
+    except Exception as e:
+        assert 'deeper than 3' in str(e)
+
+def test_stream_decoder_vectors():
+    salts = [tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=i) for i in range(200)]
+    data = tl.future_salts_c._data_cls(req_msg_id=1, now=2, salts=salts)
+    users = _difference(20).users
+    _bytes = tl.future_salts_c.serialize(data) + tl.vector_c.serialize(users, tl.User_t)
+
+    calls = []
+    skip_bare = tl.future_salt_c.skip_bare
+    tl.future_salt_c.skip_bare = staticmethod(lambda buf, offset: calls.append(offset) or skip_bare(buf, offset))
+    try:
+        decoder = tl.stream_decoder()
+        results = []
+        for i in range(0, len(_bytes), 8):
+            results += decoder.feed(_bytes[i:i + 8])
+    finally:
+        tl.future_salt_c.skip_bare = skip_bare
+
+    assert results == [data, users]
+    # an item is checked again only by the feeds that end inside it
+    assert len(calls) <= 3*len(salts), 'vector items were scanned again on every feed'
+
+def test_vector_stream():
+    data = _difference(50)
+    _bytes = tl.updates_difference_c.serialize(data)
+
+    stream = tl.vector_stream(_bytes, 'users')
+    assert list(stream.fields) == ['new_messages', 'new_encrypted_messages', 'other_updates', 'chats']
+    assert stream.fields['chats'] == data.chats and stream.count == 50
+    assert list(stream) == data.users
+    assert stream.fields['state'] == data.state and stream.end == len(_bytes)
+
+    stream = tl.vector_stream(io.BytesIO(_bytes), 'new_messages', chunk_size=16)
+    items = []
+    for item in stream:
+        assert len(stream._buf) < 16 + len(tl.message_c.serialize(item)), 'the buffer holds more than one item'
+        items.append(item)
+    assert items == data.new_messages and stream.fields['users'] == data.users and stream.end is None
+
+    salts = [tl.future_salt_c._data_cls(valid_since=i, valid_until=i + 1, salt=i) for i in range(3)]
+    _bytes = tl.future_salts_c.serialize(tl.future_salts_c._data_cls(req_msg_id=1, now=2, salts=salts))
+    stream = tl.vector_stream(_bytes, 'salts')
+    assert list(stream) == salts and stream.fields == {'req_msg_id': 1, 'now': 2}
+
+    try:
+        tl.vector_stream(_bytes, 'now')
+        assert False
+    except Exception as e:
+        assert 'no vector field' in str(e)
+
+def test_generated_modules():
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output', 'py34', 'tl')
+    names = sorted(n for n in os.listdir(directory) if n.endswith('.py'))
+    assert 'mtproto.py' in names
+
+    for name in names:
+        importlib.machinery.SourceFileLoader(name[:-3], os.path.join(directory, name)).load_module()
+
 if __name__ == '__main__':
     test_int()
     test_long()
@@ -131,4 +841,34 @@ if __name__ == '__main__':
     test_bytes()
     test_vector()
     test_bool()
-    test_general()
\ No newline at end of file
+    test_general()
+    test_struct_fusion()
+    test_decode_from()
+    test_serialize_into()
+    test_dispatch()
+    test_vector_bulk()
+    test_int128()
+    test_vector_records()
+    try:
+        test_vector_numpy()
+    except unittest.SkipTest as e:
+        print('skipped test_vector_numpy: {}'.format(e))
+    test_vector_columns()
+    test_lazy()
+    test_skip()
+    test_encoded_size()
+    test_singletons()
+    test_serialization_cache()
+    test_intern_table()
+    test_lazy_text()
+    test_zero_copy_bytes()
+    test_serialize_segments()
+    test_bytes_spill()
+    test_raw_slices()
+    test_request_template()
+    test_serialize_many()
+    test_decode_iterative()
+    test_stream_decoder()
+    test_stream_decoder_vectors()
+    test_vector_stream()
+    test_generated_modules()
@@ -8,10 +8,23 @@ class IRParameter:
     ARG_NAT = _IRParameterKind.ARG_NAT
     MULT = _IRParameterKind.MULT
 
-    def __init__(self, kind, ir_ident, arg_type):
+    def __init__(self, kind, ir_ident, arg_type, count=None):
         self._kind = IRParameter._IRParameterKind(kind)
         self._ir_ident = ir_ident
         self._arg_type = arg_type
+        self._count = count
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def count(self):
+        '''
+        the literal repeat count of a multiplicity parameter (4 in '4*[ int ]'),
+        None when it is given by the preceding # parameter
+        '''
+        return self._count
 
     @property
     def arg_type(self):
@@ -37,5 +50,7 @@ class IRParameter:
 
     def __str__(self):
         if self._kind == IRParameter.MULT:
+            if self._count is not None:
+                return '{}*[ {} ]'.format(self._count, self.arg_type)
             return '[ {} ]'.format(self.arg_type)
         return '{}:{}'.format(self.ident_full, self.arg_type)
@@ -60,6 +60,16 @@ def _get_builtin_combinators():
 
     return {str(_int):_int, str(_long):_long, str(_double):_double, str(_string):_string, str(_bytes):_bytes}
 
+def _combinator_number(declaration):
+    '''
+    computes the number of a combinator declared without one: the crc32 of its
+    declaration without braces and angle brackets
+    '''
+    declaration = re.sub('[{}]', '', declaration)
+    declaration = declaration.replace('<', ' ').replace('>', '')
+    declaration = ' '.join(declaration.split())
+    return zlib.crc32(declaration.encode())
+
 class IRSchema:
     def __init__(self, schema):
         self._schema = schema
@@ -71,11 +81,19 @@ class IRSchema:
 
     def _construct_iter_expressions(self):
         tokens = [
-            # constructor's full identifier
+            # declaration of a built-in type, e.g. 'int ? = Int;'
+            '(?P<builtin>'
+                '{lc-ident}\s+\?\s+=\s+{uc-ident}\s*;'
+            ')'.format(**TLSyntax.TL),
+            # constructor's full identifier, the number is optional
             '(?P<combinator>'
                 '(?:(?P<combinator_namespace>{lc-ident-ns})\.|)'
-                '(?P<combinator_identifier>\S+)'
-                '#(?P<combinator_id>{hex-digit}+)'
+                '(?:'
+                    '(?P<combinator_identifier>\S+)'
+                    '#(?P<combinator_id>{hex-digit}+)'
+                    '|(?P<implicit_combinator_identifier>{lc-ident})(?=\s)'
+                ')'
+                '(?=(?P<combinator_declaration>[^;]*);)'
             ')'.format(**TLSyntax.TL),
             # optional parameter names and types
             '(?P<optional_parameter>'
@@ -92,7 +110,8 @@ class IRSchema:
                 '(?:'
                     '(?P<parameter_identifier>\S+):'
                     '(?P<parameter_type>'
-                        '(?P<vector_parameter>Vector<|)'
+                        '(?P<vector_parameter>[Vv]ector<|)'
+                        '(?P<bare_parameter_type>%|)'
                         '(?:(?P<parameter_type_namespace>{lc-ident-ns})\.|)'
                         '(?P<parameter_type_identifier>[^\s>]+)'
                         '(?:>|)'
@@ -101,7 +120,8 @@ class IRSchema:
                 '|(?P<parameter_nat>'
                     '#'
                 ')'
-                '|\[\s+'
+                '|(?:(?P<parameter_multiplicity_count>{nat-const})\*|)'
+                  '\[\s+'
                     '(?P<parameter_multiplicity>\S+)'
                   '\s+\]'
             ')'.format(**TLSyntax.TL),
@@ -158,12 +178,22 @@ class IRSchema:
         if section == 'constructors' and groups['start_functions']:
             return 'combinators', {'section':'functions'}
 
+        if groups['builtin']:
+            return 'combinators', {'section':section}
+
         if not groups['combinator']:
             return 'error', {'groups': groups}
 
         namespace = groups['combinator_namespace']
-        identifier = groups['combinator_identifier']
-        number = int(groups['combinator_id'], 16)
+        if groups['combinator_id'] is not None:
+            identifier = groups['combinator_identifier']
+            number = int(groups['combinator_id'], 16)
+        else:
+            identifier = groups['implicit_combinator_identifier']
+            declaration = identifier + groups['combinator_declaration']
+            if namespace is not None:
+                declaration = '{}.{}'.format(namespace, declaration)
+            number = _combinator_number(declaration)
 
         if section not in ['functions', 'constructors']:
             return 'error', {'groups', groups}
@@ -201,9 +231,18 @@ class IRSchema:
             param = IRParameter(IRParameter.ARG_NAT, param_ident, arg_type)
         elif groups['parameter_multiplicity'] is not None:
             param_ident = IRIdentifier(IRIdentifier.TEMPLATE, None, None)
-            arg_ident = IRIdentifier(IRIdentifier.TYPE, None, 't')
-            arg_type = IRType(IRType.TEMPLATE, arg_ident)
-            param = IRParameter(IRParameter.MULT, param_ident, arg_type)
+            arg_ident = IRIdentifier(IRIdentifier.TYPE, None, groups['parameter_multiplicity'])
+            type_params = [p.ident_full for p in combinator.params if p.kind == IRParameter.OPT_ARG]
+            if arg_ident.ident_full in type_params:
+                arg_type = IRType(IRType.TEMPLATE, arg_ident)
+            elif arg_ident.is_bare():
+                arg_type = IRType(IRType.BARE, arg_ident.boxed())
+            else:
+                arg_type = IRType(IRType.TEMPLATE, arg_ident)
+
+            count = groups['parameter_multiplicity_count']
+            count = None if count is None else int(count)
+            param = IRParameter(IRParameter.MULT, param_ident, arg_type, count)
         else:
             param_ident = IRIdentifier(IRIdentifier.PARAMETER, None, groups['parameter_identifier'])
             arg_ident = IRIdentifier(IRIdentifier.TYPE, groups['parameter_type_namespace'], groups['parameter_type_identifier'])
@@ -213,6 +252,15 @@ class IRSchema:
                 arg_type = IRType(IRType.BARE, arg_ident.boxed())
             else:
                 arg_type = IRType(IRType.BOXED, arg_ident)
+
+            if groups['bare_parameter_type']:
+                arg_type = IRType(IRType.BARE, arg_ident)
+
+            if groups['vector_parameter']:
+                vector_kind = IRType.BOXED if groups['vector_parameter'][0] == 'V' else IRType.BARE
+                vector_ident = IRIdentifier(IRIdentifier.TYPE, None, groups['vector_parameter'][:-1], arg_ident)
+                arg_type = IRType(vector_kind, vector_ident, arg_type)
+
             param = IRParameter(IRParameter.ARG, param_ident, arg_type)
 
         combinator.add_parameter(param)
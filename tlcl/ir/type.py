@@ -14,6 +14,14 @@ class IRType:
         self.functions = []
         self._vector_type = vector_type
 
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def vector_type(self):
+        return self._vector_type
+
     @property
     def ident_full(self):
         return self._ir_ident.ident_full
@@ -1,25 +1,128 @@
 from collections import OrderedDict
 from inspect import Signature, Parameter
+from struct import calcsize
 from .param import Python34Parameter
 from .ident import Python34Identifier
+from ...ir.combinator import IRCombinator
 import sys
 
 template="""
 class {identifier}:
     number = pack_number({number:#x})
     is_base = False
+    _has_floats = {has_floats}
     _data_cls = namedtuple('{result_type}', [{result_type_params}])
+    _column_types = ({column_types})
+    _field_offsets = ({field_offsets})
+    _nested_fields = ({nested_fields})
+    _bytes_fields = ({bytes_fields})
+    _vector_fields = (){structs}
 
     @staticmethod
     def serialize(data=None):
         {serialize}
 
+    @staticmethod
+    def serialize_into(buf, data=None):
+        {serialize_into}
+
+    @staticmethod
+    def serialize_bare_into(buf, data=None):
+        {serialize_bare_into}
+
+    @staticmethod
+    def serialize_many_into(buf, items):
+        {serialize_many_into}
+
+    @staticmethod
+    def encoded_size(data=None):
+        {encoded_size}
+
+    @staticmethod
+    def encoded_bare_size(data=None):
+        {encoded_bare_size}
+
+    @staticmethod
+    def pack_into(buf, offset, data=None):
+        {pack_into}
+
+    @staticmethod
+    def pack_bare_into(buf, offset, data=None):
+        {pack_bare_into}
+
     @staticmethod
     def deserialize(io_bytes):
-        {deserialize}
+        return decode_io({identifier}.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == {number:#x}
+        return {identifier}.decode_bare_from(buf, offset + 4)
+
+    @staticmethod
+    def decode_bare_from(buf, offset):
+        {decode_bare_from}
+
+    @staticmethod
+    def skip(buf, offset):
+        assert unpack_number_from(buf, offset)[0] == {number:#x}
+        return {identifier}.skip_bare(buf, offset + 4)
+
+    @staticmethod
+    def skip_bare(buf, offset):
+        {skip_bare}
+
+    @staticmethod
+    def decode_columns_from(buf, offset, columns):
+        {decode_columns_from}
+
+    @staticmethod
+    def decode_field_from(buf, offset, index, values):
+        {decode_field_from}
+
+    @staticmethod
+    def skip_field_from(buf, offset, index, values):
+        {skip_field_from}
 combinators[{identifier}.number] = {identifier}
+data_combinators[{identifier}._data_cls] = {identifier}{register_raw}{register}
 """
 
+wide_int_template="""
+class {identifier}:
+    number = pack_number({number:#x})
+    is_base = True
+    item_size = {size}
+
+    @staticmethod
+    def serialize(_int):
+        return _int.to_bytes({size}, byteorder='little', signed=True)
+
+    @staticmethod
+    def serialize_into(buf, _int):
+        buf += _int.to_bytes({size}, byteorder='little', signed=True)
+
+    @staticmethod
+    def encoded_size(_int):
+        return {size}
+
+    @staticmethod
+    def pack_into(buf, offset, _int):
+        buf[offset:offset + {size}] = _int.to_bytes({size}, byteorder='little', signed=True)
+        return offset + {size}
+
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io({identifier}.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return int.from_bytes(buf[offset:offset + {size}], byteorder='little', signed=True), offset + {size}
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + {size}
+combinators[{identifier}.number] = {identifier}
+"""
 
 class Python34Combinator:
     def __init__(self, ident, params, result_type, ir_combinator):
@@ -28,6 +131,9 @@ class Python34Combinator:
         self._result_type = result_type
         self._ir_combinator = ir_combinator
 
+        # whether a value may hold a double, computed by update_has_floats
+        self.has_floats = False
+
         result_type.add_constructor(self)
 
 
@@ -49,13 +155,31 @@ class Python34Combinator:
     def number(self):
         return self._ir_combinator.number
 
+    @property
+    def kind(self):
+        return self._ir_combinator.kind
+
     @property
     def params(self):
         return self._params
 
+    def update_has_floats(self):
+        '''
+        sets has_floats when a parameter may hold a double, directly or in a
+        nested value, returns whether it changed. Called until nothing
+        changes, since types can refer to each other.
+        '''
+        if self.has_floats:
+            return False
+        self.has_floats = any(p.struct_format == 'd' or (p.struct_format is None and p.arg_type.holds_floats)
+                              for p in self.params)
+        return self.has_floats
+
     @property
     def py3ident(self):
-        ident = '{}_c'.format(self._ident.py3ident)
+        namespace = self._ident.ir_ident.namespace
+        ident = self._ident.py3ident if namespace is None else '{}_{}'.format(namespace, self._ident.py3ident)
+        ident = '{}_c'.format(ident)
 
         Python34Identifier.validate(ident)
 
@@ -81,82 +205,558 @@ class Python34Combinator:
     def _template_result_type(self):
         return self.result_type.py3ident
 
-    def _template_deserialize_no_params(self):
-        lines = [
-            'number = io_bytes.read(4)',
-            'assert {}.number == number'.format(self._template_identifier()),
-            "return {0}._data_cls(tag='{1}', number={0}.number)".format(self._template_identifier(),
-                                                                  self.ident.ir_ident.ident_full)
-        ]
-        return '\n        '.join(lines)
+    def _template_decode_bare_from_no_params(self):
+        return 'return {}.instance, offset'.format(self._template_identifier())
 
-    def _template_deserialize(self):
+    def _template_decode_bare_from(self):
         if self.params:
-            return self._template_deserialize_params()
+            return self._template_decode_bare_from_params()
         else:
-            return self._template_deserialize_no_params()
+            return self._template_decode_bare_from_no_params()
+
+    def _template_register_raw(self):
+        if not self.params:
+            return ''
+        return '\ndata_combinators[{0}._raw_cls] = raw_codec({0})'.format(self._template_identifier())
+
+    def _template_register(self):
+        if self.kind != IRCombinator.CONSTRUCTOR or self.result_type.py3class is None:
+            return ''
+        return '\n{}.constructors[{:#x}] = {}'.format(self.result_type.py3class, self.number, self._template_identifier())
+
+    def _struct_runs(self):
+        '''
+        splits the parameters into runs of consecutive fixed-width parameters,
+        which are packed with a single Struct, and the remaining parameters.
+        The first run always starts with the constructor number.
+        '''
+        runs = [['I', []]]
+        for param in self.params:
+            fmt = param.struct_format
+            if fmt is None:
+                runs.append(param)
+            elif isinstance(runs[-1], list):
+                runs[-1][0] += fmt
+                runs[-1][1].append(param)
+            else:
+                runs.append([fmt, [param]])
+        return runs
+
+    def _template_structs(self):
+        if not self.params:
+            # field-less constructors decode to this single instance
+            return "\n    instance = _data_cls(tag='{}', number=number)".format(self.ident.ir_ident.ident_full)
+
+        runs = self._struct_runs()
+        structs = [r[0] for r in runs if isinstance(r, list)]
+        structs = ["\n    _struct_{} = Struct('<{}')".format(i, fmt) for i, fmt in enumerate(structs)]
+        if runs[0][1]:
+            structs.insert(1, "\n    _bare_struct_0 = Struct('<{}')".format(runs[0][0][1:]))
+        else:
+            del structs[0]
+        if self.is_fixed_size:
+            names = ["'{}'".format(p.py3ident) for p in self.params]
+            structs.append("\n    dtype = numpy_dtype('{}', ['number', {}])".format(runs[0][0], ', '.join(names)))
+            structs.append("\n    bare_dtype = numpy_dtype('{}', [{}])".format(runs[0][0][1:], ', '.join(names)))
+        # values decoded with use_raw_slices keep their wire bytes in _raw
+        structs.insert(0, '\n    _raw_cls = type(_data_cls.__name__, (_data_cls, raw_value), {})')
+        return ''.join(structs)
+
+    def _template_column_types(self):
+        types = []
+        for p in self.params:
+            if p.struct_format in ['i', 'q', 'd', 'I']:
+                types.append("'{}'".format(p.struct_format))
+            elif p.arg_type.py3ident in ['String', 'Bytes']:
+                types.append("'blob'")
+            else:
+                types.append('None')
+        if len(types) == 1:
+            return '{},'.format(types[0])
+        return ', '.join(types)
+
+    def _template_decode_columns_from(self):
+        if not self.params:
+            return 'return offset'
+
+        lines, offset = self._template_decode_fields(raw=True)
+        lines += ['columns[{}].append(_{})'.format(i, p.py3ident) for i, p in enumerate(self.params)]
+        lines += ['return {}'.format(offset)]
+        return '\n        '.join(lines)
 
-    def _template_deserialize_params(self):
+    def _template_field_offsets(self):
+        offsets = [0]
+        for p in self.params:
+            if p.struct_format is None:
+                break
+            offsets.append(offsets[-1] + calcsize('<' + p.struct_format))
+        return ''.join(['{},'.format(o) for o in offsets])
+
+    def _template_nested_fields(self):
+        '''
+        for every parameter, the type class of a boxed value or of the boxed
+        items of a boxed vector and whether it is the vector, None for the
+        parameters decode_field_from decodes. Empty when there are no such
+        values, any boxed value has no type class.
+        '''
+        fields = []
+        for p in self.params:
+            arg_type = p.arg_type
+            nested = 'None'
+            if p.is_multiplicity or p.is_bare or p.struct_format is not None:
+                pass
+            elif arg_type.vector_type is not None:
+                item_type = arg_type.vector_type
+                if p.has_bare_items or item_type.record_constructor is not None or item_type.vector_type is not None:
+                    pass
+                elif item_type.py3class is not None:
+                    nested = '({}, True)'.format(item_type.py3class)
+                elif item_type.py3codec is None:
+                    nested = '(None, True)'
+            elif arg_type.py3class is not None:
+                nested = '({}, False)'.format(arg_type.py3class)
+            elif arg_type.py3codec is None:
+                nested = '(None, False)'
+            fields.append(nested)
+
+        if all(f == 'None' for f in fields):
+            return ''
+        if len(fields) == 1:
+            return '{},'.format(fields[0])
+        return ', '.join(fields)
+
+    def _template_bytes_fields(self):
+        '''
+        the indices of the bytes parameters, which stream_decoder can spill
+        as they arrive
+        '''
+        indices = [str(i) for i, p in enumerate(self.params)
+                   if not p.is_multiplicity and p.arg_type.py3ident == 'Bytes']
+        if len(indices) == 1:
+            return '{},'.format(indices[0])
+        return ', '.join(indices)
+
+    def _template_vector_fields(self):
+        '''
+        for every vector parameter, its item codec, whether the items are
+        bare and whether the vector is boxed, None for other parameters.
+        Empty when there are no vector parameters. The codecs of bare items
+        may be declared after the combinator, so it is assigned once every
+        class exists.
+        '''
+        fields = []
+        for p in self.params:
+            if p.is_multiplicity or p.arg_type.vector_type is None:
+                fields.append('None')
+                continue
+            codec, bare = self._template_vector_codec(p)
+            fields.append('({}, {}, {})'.format(codec, bool(bare), not p.is_bare))
+
+        if all(f == 'None' for f in fields):
+            return ''
+        if len(fields) == 1:
+            return '{},'.format(fields[0])
+        return ', '.join(fields)
+
+    def _template_decode_field_from(self):
+        lines = []
+        for i, p in enumerate(self.params):
+            lines.append('if index == {}:'.format(i))
+            if p.struct_format is not None:
+                value = "unpack_from('<{}', buf, offset)[0]".format(p.struct_format)
+                value = p.struct_unpack_value(value) or value
+                body = ['return {}, offset + {}'.format(value, calcsize('<' + p.struct_format))]
+            else:
+                body = self._template_decode_param(p, 0)
+                body.append('return _{}, offset'.format(p.py3ident))
+                if p.is_multiplicity and p.ir_param.count is None:
+                    nat = [j for j, q in enumerate(self.params[:i]) if q.py3ident == 'num'][-1]
+                    body.insert(0, '_num = values[{}]'.format(nat))
+            lines += ['    ' + line for line in body]
+        lines.append('raise IndexError(index)')
+        return '\n        '.join(lines)
 
-        result_args =  []
-        for param in self.params:
-            arg_type = param.arg_type
-            p = 'raise Exception("unimplemented")'
-            if arg_type.py3ident in ['Int', 'Long', 'Double', 'String', 'Bytes']:
-                p = '{} = {}_c.deserialize(io_bytes)'.format(param.py3ident, arg_type.py3ident.lower())
+    def _template_skip_field_from(self):
+        lines = []
+        for i, p in enumerate(self.params):
+            lines.append('if index == {}:'.format(i))
+            if p.struct_format is not None:
+                body = ['return offset + {}'.format(calcsize('<' + p.struct_format))]
             else:
-                p = '{} = deserialize(io_bytes)'.format(param.py3ident)
+                body = ['return {}'.format(self._template_skip_param(p, 0))]
+                if p.is_multiplicity and p.ir_param.count is None:
+                    nat = [j for j, q in enumerate(self.params[:i]) if q.py3ident == 'num'][-1]
+                    body.insert(0, '_num = values[{}]'.format(nat))
+            lines += ['    ' + line for line in body]
+        lines.append('raise IndexError(index)')
+        return '\n        '.join(lines)
 
-            result_args.append(p)
+    def _template_skip_bare(self):
+        lines = []
+        pending = 0
+        for run in self._struct_runs():
+            if isinstance(run, list):
+                fmt, params = run
+                for p in params:
+                    if p.py3ident == 'num' and any(q.is_multiplicity for q in self.params):
+                        lines += ["_num = unpack_from('<I', buf, {})[0]".format(self._template_offset(pending))]
+                    pending += calcsize('<' + p.struct_format)
+                continue
+
+            lines += ['offset = {}'.format(self._template_skip_param(run, pending))]
+            pending = 0
+
+        lines += ['return {}'.format(self._template_offset(pending))]
+        return '\n        '.join(lines)
 
-        ret_stmt = 'return {}._data_cls('.format(self._template_identifier())
+    def _template_skip_param(self, param, pending):
+        arg_type = param.arg_type
+        offset = self._template_offset(pending)
+        if param.is_multiplicity:
+            count = param.ir_param.count
+            count = '_num' if count is None else count
+            return 'vector_c.skip_items(buf, {}, {}, {})'.format(offset, count, arg_type.py3codec)
+        elif arg_type.vector_type is not None:
+            if not param.is_bare:
+                offset = self._template_offset(pending + 4)
+            codec, bare = self._template_vector_codec(param)
+            if arg_type.vector_type.record_constructor is not None:
+                return 'vector_c.skip_records(buf, {}, {})'.format(offset, codec + bare)
+            return 'vector_c.skip(buf, {}, {})'.format(offset, codec + bare)
+        elif param.is_bare and arg_type.bare_constructor is not None:
+            return '{}.skip_bare(buf, {})'.format(arg_type.bare_constructor.py3ident, offset)
+        elif arg_type.py3codec is not None:
+            return '{}.skip(buf, {})'.format(arg_type.py3codec, offset)
+        else:
+            return 'skip(buf, {})'.format(offset)
 
-        result_args = [result_args[0]] + [r.rjust(len(ret_stmt) + len(r) + 8) for r in result_args[1:]]
-        result_args = ',\n'.join(result_args)
-        ret_stmt = '{}{})'.format(ret_stmt, result_args)
+    def _template_decode_bare_from_params(self):
+        lines, offset = self._template_decode_fields()
+        result_args = ', '.join(['_{}'.format(p.py3ident) for p in self.params])
+        lines += ['return {}._data_cls({}), {}'.format(self._template_identifier(), result_args, offset)]
 
-        return ret_stmt
+        return '\n        '.join(lines)
 
-    def _template_serialize_params(self):
+    def _template_decode_fields(self, raw=False):
+        '''
+        the lines decoding every parameter to a local variable and the
+        expression of the offset after them, raw keeps strings as bytes
+        '''
         lines = []
-        lines += ['result = bytearray()']
-        lines += ['result += {}.number'.format(self._template_identifier())]
+        struct_num = 0
+        pending = 0
+        for run in self._struct_runs():
+            offset = self._template_offset(pending)
+            if isinstance(run, list):
+                fmt, params = run
+                struct = '_struct_{}'.format(struct_num)
+                if struct_num == 0:
+                    fmt = fmt[1:]
+                    struct = '_bare_struct_0'
+                struct_num += 1
+                if not params:
+                    continue
+
+                targets = ['_{}'.format(p.py3ident) for p in params]
+                targets = ', '.join(targets) if len(targets) > 1 else '{},'.format(targets[0])
+                lines += ['{} = {}.{}.unpack_from(buf, {})'.format(
+                    targets, self._template_identifier(), struct, offset)]
+                for p in params:
+                    value = p.struct_unpack_value('_{}'.format(p.py3ident))
+                    if value is not None:
+                        lines += ['_{} = {}'.format(p.py3ident, value)]
+                pending += calcsize('<' + fmt)
+                continue
+
+            lines += self._template_decode_param(run, pending, raw)
+            pending = 0
+
+        return lines, self._template_offset(pending)
 
-        result_args =  []
-        for param in self.params:
-            arg_type = param.arg_type
-            p = 'result += {}_c.serialize(data.{})'.format(arg_type.py3ident.lower(), param.py3ident)
-
-            result_args.append(p)
+    @staticmethod
+    def _template_offset(pending):
+        return 'offset + {}'.format(pending) if pending else 'offset'
+
+    def _template_decode_param(self, param, pending, raw=False):
+        arg_type = param.arg_type
+        offset = self._template_offset(pending)
+        if param.is_multiplicity:
+            count = param.ir_param.count
+            count = '_num' if count is None else count
+            return ['_{}, offset = vector_c.decode_items_from(buf, {}, {}, {})'.format(param.py3ident, offset, count,
+                                                                                    arg_type.py3codec)]
+        elif arg_type.vector_type is not None:
+            lines = []
+            if not param.is_bare:
+                lines += ['assert unpack_number_from(buf, {})[0] == 0x1cb5c415'.format(offset)]
+                offset = self._template_offset(pending + 4)
+            decode = '_{}, offset = vector_c.decode_from(buf, {}, {})'
+            codec, bare = self._template_vector_codec(param)
+            if arg_type.vector_type.record_constructor is not None:
+                decode = '_{}, offset = vector_c.decode_records_from(buf, {}, {})'
+            lines += [decode.format(param.py3ident, offset, codec + bare)]
+            return lines
+        elif param.is_bare and arg_type.bare_constructor is not None:
+            return ['_{}, offset = {}.decode_bare_from(buf, {})'.format(param.py3ident, arg_type.bare_constructor.py3ident,
+                                                                      offset)]
+        elif raw and arg_type.py3ident in ['String', 'Bytes']:
+            return ['_{}, offset = bytes_c.view_from(buf, {})'.format(param.py3ident, offset)]
+        elif arg_type.py3codec is not None:
+            return ['_{}, offset = {}.decode_from(buf, {})'.format(param.py3ident, arg_type.py3codec, offset)]
+        else:
+            return ['_{}, offset = decode_from(buf, {})'.format(param.py3ident, offset)]
 
-        lines += result_args
-        lines += ['return bytes(result)']
-        lines = '\n        '.join(lines)
+    @staticmethod
+    def _template_vector_codec(param):
+        '''
+        the element codec of a vector parameter and the trailing argument
+        that selects the bare encoding of its items
+        '''
+        vector_type = param.arg_type.vector_type
+        constructor = vector_type.bare_constructor
+        bare = ', True' if param.has_bare_items else ''
+        if vector_type.record_constructor is not None or (bare and constructor is not None):
+            return constructor.py3ident, bare
+        return str(vector_type.py3codec), ''
+
+    def _template_serialize_param(self, param):
+        arg_type = param.arg_type
+        if param.is_multiplicity:
+            return ['vector_c.serialize_items_into(buf, data.{}, {})'.format(param.py3ident, arg_type.py3codec)]
+        elif arg_type.vector_type is not None:
+            lines = [] if param.is_bare else ['buf += vector_c.number']
+            serialize = 'vector_c.serialize_bare_into(buf, data.{}, {})'
+            codec, bare = self._template_vector_codec(param)
+            if arg_type.vector_type.record_constructor is not None:
+                serialize = 'vector_c.serialize_records_into(buf, data.{}, {})'
+            return lines + [serialize.format(param.py3ident, codec + bare)]
+        elif param.is_bare and arg_type.bare_constructor is not None:
+            return ['{}.serialize_bare_into(buf, data.{})'.format(arg_type.bare_constructor.py3ident, param.py3ident)]
+        elif arg_type.py3ident in ['String', 'Bytes']:
+            return ['{}.serialize_into(buf, data.{})'.format(arg_type.py3codec, param.py3ident)]
+        else:
+            return ['serialize_object_into(buf, data.{})'.format(param.py3ident)]
 
+    def _serialize_lines(self, bare=False, hoisted=False):
+        '''
+        the lines appending data to buf, hoisted refers to the pack methods
+        and the number through the locals bound by serialize_many_into
+        '''
+        lines = []
+        struct_num = 0
+        for run in self._struct_runs():
+            if isinstance(run, list):
+                fmt, params = run
+                args = [p.struct_pack_arg('data.{}'.format(p.py3ident)) for p in params]
+                pack = '{}._struct_{}.pack'.format(self._template_identifier(), struct_num)
+                if struct_num == 0 and bare:
+                    pack = '{}._bare_struct_0.pack'.format(self._template_identifier())
+                elif struct_num == 0:
+                    args = ['{:#x}'.format(self.number)] + args
+                if hoisted:
+                    pack = '_pack_{}'.format(struct_num)
+                struct_num += 1
+                if params:
+                    lines.append('buf += {}({})'.format(pack, ', '.join(args)))
+                elif not bare:
+                    lines.append('buf += {}'.format('number' if hoisted else self._template_identifier() + '.number'))
+            else:
+                lines += self._template_serialize_param(run)
         return lines
 
-    def _template_serialize_no_params(self):
-        return 'return {}.number'.format(self._template_identifier())
+    def _template_serialize_into(self, bare=False):
+        lines = self._serialize_lines(bare)
+        if not lines:
+            lines = ['pass']
+
+        return '\n        '.join(lines)
+
+    def _template_serialize_many_into(self):
+        lines = []
+        struct_num = 0
+        for run in self._struct_runs():
+            if not isinstance(run, list):
+                continue
+            if run[1]:
+                lines.append('_pack_{0} = {1}._struct_{0}.pack'.format(struct_num, self._template_identifier()))
+            elif struct_num == 0:
+                lines.append('number = {}.number'.format(self._template_identifier()))
+            struct_num += 1
+
+        lines.append('for data in items:')
+        lines += ['    ' + line for line in self._serialize_lines(hoisted=True)]
+        return '\n        '.join(lines)
 
     def _template_serialize(self):
-        if self.params:
-            return self._template_serialize_params()
+        if not self.params:
+            return 'return {}.number'.format(self._template_identifier())
+
+        runs = self._struct_runs()
+        if len(runs) == 1:
+            args = ['{:#x}'.format(self.number)] + [p.struct_pack_arg('data.{}'.format(p.py3ident)) for p in self.params]
+            return 'return {}._struct_0.pack({})'.format(self._template_identifier(), ', '.join(args))
+
+        # appending walks the value once, sizing it first would walk nested
+        # values and encode strings twice
+        lines = [
+            'result = bytearray()',
+            '{}.serialize_into(result, data)'.format(self._template_identifier()),
+            'return bytes(result)'
+        ]
+        return '\n        '.join(lines)
+
+    def _template_encoded_size(self, bare=False):
+        # the first run starts with the constructor number
+        fixed = -4 if bare else 0
+        terms = []
+        for run in self._struct_runs():
+            if isinstance(run, list):
+                fixed += calcsize('<' + run[0])
+                continue
+
+            param = run
+            arg_type = param.arg_type
+            value = 'data.{}'.format(param.py3ident)
+            if param.is_multiplicity:
+                terms.append('vector_c.items_encoded_size({}, {})'.format(value, arg_type.py3codec))
+            elif arg_type.vector_type is not None:
+                fixed += 0 if param.is_bare else 4
+                codec, bare_items = self._template_vector_codec(param)
+                size = 'vector_c.encoded_bare_size({}, {})'
+                if arg_type.vector_type.record_constructor is not None:
+                    size = 'vector_c.records_encoded_size({}, {})'
+                terms.append(size.format(value, codec + bare_items))
+            elif param.is_bare and arg_type.bare_constructor is not None:
+                terms.append('{}.encoded_bare_size({})'.format(arg_type.bare_constructor.py3ident, value))
+            elif arg_type.py3ident in ['String', 'Bytes']:
+                terms.append('{}.encoded_size({})'.format(arg_type.py3codec, value))
+            else:
+                terms.append('encoded_size({})'.format(value))
+
+        terms = [str(fixed)] + terms
+        if len(terms) <= 2:
+            return 'return {}'.format(' + '.join(terms))
+        return 'return ({})'.format(' +\n                '.join(terms))
+
+    def _template_pack_into(self, bare=False):
+        lines = []
+        struct_num = 0
+        pending = 0
+        for run in self._struct_runs():
+            offset = self._template_offset(pending)
+            if isinstance(run, list):
+                fmt, params = run
+                args = [p.struct_pack_arg('data.{}'.format(p.py3ident)) for p in params]
+                struct = '_struct_{}'.format(struct_num)
+                if struct_num == 0:
+                    if bare:
+                        struct, fmt = '_bare_struct_0', fmt[1:]
+                    else:
+                        args = ['{:#x}'.format(self.number)] + args
+                struct_num += 1
+                if params:
+                    lines.append('{}.{}.pack_into(buf, {})'.format(self._template_identifier(), struct,
+                                                                   ', '.join([offset] + args)))
+                elif not bare:
+                    lines.append('buf[{0}:{0} + 4] = {1}.number'.format(offset, self._template_identifier()))
+                pending += calcsize('<' + fmt)
+                continue
+
+            lines += self._template_pack_param(run, pending)
+            pending = 0
+
+        lines.append('return {}'.format(self._template_offset(pending)))
+        return '\n        '.join(lines)
+
+    def _template_pack_param(self, param, pending):
+        arg_type = param.arg_type
+        offset = self._template_offset(pending)
+        value = 'data.{}'.format(param.py3ident)
+        if param.is_multiplicity:
+            return ['offset = vector_c.pack_items_into(buf, {}, {}, {})'.format(offset, value, arg_type.py3codec)]
+        elif arg_type.vector_type is not None:
+            lines = []
+            if not param.is_bare:
+                lines.append('buf[{0}:{0} + 4] = vector_c.number'.format(offset))
+                offset = self._template_offset(pending + 4)
+            codec, bare = self._template_vector_codec(param)
+            pack = 'offset = vector_c.pack_bare_into(buf, {}, {}, {})'
+            if arg_type.vector_type.record_constructor is not None:
+                pack = 'offset = vector_c.pack_records_into(buf, {}, {}, {})'
+            return lines + [pack.format(offset, value, codec + bare)]
+        elif param.is_bare and arg_type.bare_constructor is not None:
+            return ['offset = {}.pack_bare_into(buf, {}, {})'.format(arg_type.bare_constructor.py3ident, offset, value)]
+        elif arg_type.py3ident in ['String', 'Bytes']:
+            return ['offset = {}.pack_into(buf, {}, {})'.format(arg_type.py3codec, offset, value)]
         else:
-            return self._template_serialize_no_params()
+            return ['offset = pack_object_into(buf, {}, {})'.format(offset, value)]
 
     @property
     def result_type(self):
         return self._result_type
 
+    @property
+    def is_fixed_size(self):
+        '''
+        whether every parameter is a fixed-width struct item, so that the
+        whole value is packed by _struct_0
+        '''
+        return bool(self.params) and all(p.struct_format is not None and p.struct_unpack_value('') is None
+                                         for p in self.params)
+
+    @property
+    def wide_int_size(self):
+        '''
+        the size in bytes of a combinator made of a fixed number of ints, such
+        as int128 4*[ int ], None for any other combinator
+        '''
+        if len(self.params) != 1:
+            return None
+
+        param = self.params[0]
+        if not param.is_multiplicity or param.ir_param.count is None or param.arg_type.py3ident != 'Int':
+            return None
+
+        return 4*param.ir_param.count
+
     def definition(self):
+        if self.wide_int_size is not None:
+            return wide_int_template.format(identifier=self._template_identifier(), number=self.number,
+                                            size=self.wide_int_size)
+
         return template.format(
             identifier=self._template_identifier(), 
             number=self.number, 
+            has_floats=self.has_floats,
             result_type_params=self._template_result_type_params(),
+            structs=self._template_structs(),
             result_type=self._template_result_type(),
-            deserialize=self._template_deserialize(),
-            serialize=self._template_serialize()
+            decode_bare_from=self._template_decode_bare_from(),
+            decode_columns_from=self._template_decode_columns_from(),
+            column_types=self._template_column_types(),
+            field_offsets=self._template_field_offsets(),
+            nested_fields=self._template_nested_fields(),
+            bytes_fields=self._template_bytes_fields(),
+            decode_field_from=self._template_decode_field_from(),
+            skip_field_from=self._template_skip_field_from(),
+            skip_bare=self._template_skip_bare(),
+            register=self._template_register(),
+            register_raw=self._template_register_raw(),
+            serialize=self._template_serialize(),
+            serialize_into=self._template_serialize_into(),
+            serialize_bare_into=self._template_serialize_into(bare=True),
+            serialize_many_into=self._template_serialize_many_into(),
+            encoded_size=self._template_encoded_size(),
+            encoded_bare_size=self._template_encoded_size(bare=True),
+            pack_into=self._template_pack_into(),
+            pack_bare_into=self._template_pack_into(bare=True)
             )
 
+    def vector_fields_definition(self):
+        vector_fields = self._template_vector_fields()
+        if self.wide_int_size is not None or not vector_fields:
+            return ''
+        return '{}._vector_fields = ({})'.format(self._template_identifier(), vector_fields)
+
     def __str__(self):
         return '{}#{:x}'.format(self.identifier, self.number)
@@ -1,7 +1,11 @@
 from inspect import Parameter
 from .ident import Python34Identifier
+from ...ir.param import IRParameter
+from ...ir.type import IRType
 
 class Python34Parameter:
+    _struct_formats = {'Int': 'i', 'Long': 'q', 'Double': 'd', 'NatNumber': 'I'}
+
     def __init__(self, ident, arg_type, ir_param):
         self._ident = ident
         self._arg_type = arg_type
@@ -16,6 +20,8 @@ class Python34Parameter:
         ident = self._ident.py3ident
         if ident == '#':
             ident = 'num'
+        elif self.is_multiplicity and self._ident.ir_ident.ident is None:
+            ident = 'items'
 
         #Python34Identifier.validate(ident)
         return ident
@@ -24,6 +30,58 @@ class Python34Parameter:
     def arg_type(self):
         return self._arg_type
 
+    @property
+    def is_multiplicity(self):
+        return self._ir_param.kind == IRParameter.MULT
+
+    @property
+    def is_bare(self):
+        '''
+        whether the value is written without its constructor number
+        (vector<long> and %Message)
+        '''
+        return self._ir_param.arg_type.kind == IRType.BARE
+
+    @property
+    def has_bare_items(self):
+        '''
+        whether the items of a vector parameter are written without their
+        constructor numbers (vector<%Message> and vector<future_salt>)
+        '''
+        vector_type = self._ir_param.arg_type.vector_type
+        return vector_type is not None and vector_type.kind == IRType.BARE
+
+    @property
+    def struct_format(self):
+        '''
+        the struct format of a fixed-width parameter, None otherwise
+        '''
+        if self.is_multiplicity:
+            return None
+
+        if self._arg_type.wide_int_size is not None:
+            return '{}s'.format(self._arg_type.wide_int_size)
+
+        return Python34Parameter._struct_formats.get(self._arg_type.py3ident)
+
+    def struct_pack_arg(self, value):
+        '''
+        converts the expression of the parameter's value to the struct argument
+        '''
+        size = self._arg_type.wide_int_size
+        if size is None:
+            return value
+        return "{}.to_bytes({}, byteorder='little', signed=True)".format(value, size)
+
+    def struct_unpack_value(self, value):
+        '''
+        converts the expression of the unpacked struct item to the parameter's value,
+        None when the item is the value itself
+        '''
+        if self._arg_type.wide_int_size is None:
+            return None
+        return "int.from_bytes({}, byteorder='little', signed=True)".format(value)
+
     def declaration(self):
         return self._identifier
 
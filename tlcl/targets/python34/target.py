@@ -21,28 +21,483 @@ def serialize(combinator, *args, **kwargs):
     return c.serialize(*args, **kwargs)
 '''
 
+def_serialize_into="""
+def serialize_into(buf, combinator, *args, **kwargs):
+    c = None
+    if type(combinator) is bytes:
+        c = combinators.get(combinator)
+    else:
+        c = combinators.get(combinator.number)
+    if c is None:
+        raise Exception('combinator "{}" does not exist'.format(combinator))
+
+    c.serialize_into(buf, *args, **kwargs)
+
+
+def serialize_many(combinator, items):
+    '''
+    serializes every value of items with the same constructor combinator,
+    one after the other into a single bytes
+    '''
+    buf = bytearray()
+    combinator.serialize_many_into(buf, items)
+    return bytes(buf)
+
+
+class serialization_cache:
+    '''
+    a bounded LRU cache of the encoded bytes of hashable values, evicting
+    the least recently used entries past max_entries or max_bytes
+    '''
+    def __init__(self, max_entries=1024, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, data):
+        '''
+        the encoded bytes of data or None, without touching the counters
+        '''
+        try:
+            return self.entries.get((type(data), _typed_key(data)))
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, data, c):
+        if getattr(c, '_has_floats', False):
+            # -0.0 == 0.0, equal values may have different bytes
+            return c.serialize(data)
+        try:
+            key = (type(data), _typed_key(data))
+            encoded = self.entries.get(key)
+        except (TypeError, ValueError):
+            # values holding lists or writable memoryviews are not hashable
+            return c.serialize(data)
+
+        if encoded is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return encoded
+
+        self.misses += 1
+        encoded = c.serialize(data)
+        if len(encoded) <= self.max_bytes:
+            self.entries[key] = encoded
+            self.size += len(encoded)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= len(self.entries.popitem(last=False)[1])
+        return encoded
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+_serialization_cache = None
+
+
+def set_serialization_cache(cache):
+    '''
+    makes nested values serialize through cache, a serialization_cache,
+    None disables caching
+    '''
+    global _serialization_cache
+    _serialization_cache = cache
+
+
+def serialize_object_into(buf, data):
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is None:
+        c.serialize_into(buf, data)
+    else:
+        buf += _serialization_cache.get(data, c)
+
+
+class segment_writer:
+    '''
+    a serialize_into target that collects the output as a list of segments
+    for socket.sendmsg. Small pieces are packed together, bytes-like values
+    of at least min_reference_size bytes are kept by reference, so they must
+    not change until the segments are sent.
+    '''
+    def __init__(self, min_reference_size=4096):
+        self.min_reference_size = min_reference_size
+        self.size = 0
+        self._segments = []
+        self._current = bytearray()
+
+    def __iadd__(self, data):
+        self.size += len(data)
+        if len(data) < self.min_reference_size:
+            self._current += data
+            return self
+
+        if self._current:
+            self._segments.append(self._current)
+            self._current = bytearray()
+        self._segments.append(data)
+        return self
+
+    def __len__(self):
+        return self.size
+
+    def segments(self):
+        if self._current:
+            self._segments.append(self._current)
+            self._current = bytearray()
+        return self._segments
+
+
+def serialize_segments(data, min_reference_size=4096):
+    '''
+    serializes data to a list of buffers, large bytes fields are not copied
+    '''
+    writer = segment_writer(min_reference_size)
+    serialize_object_into(writer, data)
+    return writer.segments()
+
+
+def pack_object_into(buf, offset, data):
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is None:
+        return c.pack_into(buf, offset, data)
+
+    encoded = _serialization_cache.get(data, c)
+    buf[offset:offset + len(encoded)] = encoded
+    return offset + len(encoded)
+
+
+def encoded_size(data):
+    '''
+    the exact size of the serialized data, without serializing it
+    '''
+    c = data_combinators.get(type(data))
+    if c is None:
+        raise Exception('no combinator serializes "{}" objects'.format(type(data).__name__))
+
+    if _serialization_cache is not None:
+        encoded = _serialization_cache.lookup(data)
+        if encoded is not None:
+            return len(encoded)
+
+    return c.encoded_size(data)
+"""
+
 def_deserialize='''
 def deserialize(io_bytes, *args, **kwargs):
-    cons = combinators.get(io_bytes.read(4))
+    return decode_io(decode_from, io_bytes, *args, **kwargs)
+'''
+
+def_decode_from="""
+def decode_from(buf, offset, *args, **kwargs):
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
     if cons is None:
-        print('combinator "{}" does not exist'.format(combinator), file=sys.stderr)
-        return None
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.decode_from(buf, offset + 4, *args, **kwargs)
+
+    if _raw_slices and cons._column_types:
+        result, end = decode_raw_from(cons, buf, offset, *args, **kwargs)
+    else:
+        result, end = cons.decode_bare_from(buf, offset + 4, *args, **kwargs)
+    if _intern_table is not None:
+        result = _intern_table.intern(result)
+    return result, end
+
+
+class raw_codec:
+    '''
+    serializes a value decoded by keep_raw by copying its wire bytes, values
+    made with _replace have no wire bytes and are encoded by cons
+    '''
+    def __init__(self, cons):
+        self.cons = cons
+        self._has_floats = cons._has_floats
+
+    def serialize(self, data):
+        raw = getattr(data, '_raw', None)
+        return self.cons.serialize(data) if raw is None else bytes(raw)
+
+    def serialize_into(self, buf, data):
+        raw = getattr(data, '_raw', None)
+        if raw is None:
+            self.cons.serialize_into(buf, data)
+        else:
+            buf += raw
+
+    def encoded_size(self, data):
+        raw = getattr(data, '_raw', None)
+        return self.cons.encoded_size(data) if raw is None else len(raw)
+
+    def pack_into(self, buf, offset, data):
+        raw = getattr(data, '_raw', None)
+        if raw is None:
+            return self.cons.pack_into(buf, offset, data)
+        buf[offset:offset + len(raw)] = raw
+        return offset + len(raw)
+
+
+def _frozen(items):
+    if items and type(items[0]) is list:
+        return tuple(_frozen(i) for i in items)
+    return tuple(items)
+
+
+class raw_value:
+    '''
+    the base of the _raw_cls of the constructors. The values keep_raw makes
+    hold their wire bytes as _raw_buf[_raw_start:_raw_end], _raw is that
+    slice, or None for values made with _replace.
+    '''
+    __slots__ = ()
+
+    @property
+    def _raw(self):
+        buf = getattr(self, '_raw_buf', None)
+        if buf is None or (self._raw_start == 0 and self._raw_end == len(buf)):
+            return buf
+        return memoryview(buf)[self._raw_start:self._raw_end]
+
+
+def keep_raw(cons, result, buf, start, end):
+    '''
+    converts a decoded value to cons._raw_cls holding its boxed wire bytes,
+    its vectors become tuples so that the bytes can not go stale. Without
+    use_zero_copy_bytes the bytes are left in buf, and the value waits in
+    _raw_decode.nested for share_raw to copy them.
+    '''
+    result = cons._raw_cls._make(_frozen(v) if type(v) is list else v for v in result)
+    if _zero_copy_bytes:
+        result._raw_buf, result._raw_start, result._raw_end = memoryview(buf)[start:end], 0, end - start
+    else:
+        result._raw_buf, result._raw_start, result._raw_end = buf, start, end
+        _raw_decode.nested.append(result)
+    return result
+
+
+def share_raw(nested):
+    '''
+    copies the wire bytes of the values of keep_raw, listed in the order
+    they were decoded, out of their buffer. The values nested in another
+    one hold slices of its copy instead of copies of their own.
+    '''
+    if _zero_copy_bytes:
+        return
+    start, end = 0, -1
+    # a value comes after the values nested in it
+    for value in reversed(nested):
+        if not (start <= value._raw_start and value._raw_end <= end):
+            start, end = value._raw_start, value._raw_end
+            raw = bytes(value._raw_buf[start:end])
+        value._raw_buf = raw
+        value._raw_start -= start
+        value._raw_end -= start
+
+
+_raw_decode = local()
+
+
+def decode_raw_from(cons, buf, offset, *args, **kwargs):
+    '''
+    decodes the boxed value of cons at offset with keep_raw. The outermost
+    call collects the values decoded within it, and shares their wire bytes
+    once it returns or fails.
+    '''
+    if getattr(_raw_decode, 'nested', None) is None:
+        _raw_decode.nested = nested = []
+        try:
+            return decode_raw_from(cons, buf, offset, *args, **kwargs)
+        finally:
+            _raw_decode.nested = None
+            share_raw(nested)
+
+    result, end = cons.decode_bare_from(buf, offset + 4, *args, **kwargs)
+    return keep_raw(cons, result, buf, offset, end), end
+
+
+_raw_slices = False
+
+
+def use_raw_slices(enabled=True):
+    '''
+    makes decoded values keep their wire bytes, so that serializing them
+    unmodified copies those bytes instead of encoding the value again.
+    Their vector fields decode to tuples, changed values are made with
+    _replace.
+    '''
+    global _raw_slices
+    _raw_slices = enabled
+
+
+def _typed_key(value):
+    '''
+    a key of value that tells apart nested values of different constructors,
+    which compare equal as tuples when they hold the same fields
+    '''
+    if isinstance(value, tuple):
+        return (type(value),) + tuple(map(_typed_key, value))
+    return value
+
+
+class intern_table:
+    '''
+    shares equal decoded strings and hashable values, keeping at most
+    max_entries of them. Used as a context manager it is installed for
+    the decodes in its block. Blocks may exit in any order, the table of
+    the latest block still open stays installed. There is one installed
+    table for the whole process: blocks of different connections that are
+    open at the same time, in threads or interleaved coroutines, all decode
+    with the table of the latest one.
+    '''
+    def __init__(self, max_entries=65536):
+        self.max_entries = max_entries
+        self.values = OrderedDict()
+        self.hits = 0
+
+    def intern(self, value):
+        if getattr(data_combinators.get(type(value)), '_has_floats', False):
+            # -0.0 == 0.0, an equal value may decode to different data
+            return value
+
+        try:
+            key = (type(value), _typed_key(value))
+            shared = self.values.get(key)
+        except (TypeError, ValueError):
+            # values holding lists or writable memoryviews are not hashable
+            return value
+
+        if shared is not None:
+            self.hits += 1
+            return shared
+
+        self.values[key] = value
+        if len(self.values) > self.max_entries:
+            self.values.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.values.clear()
+
+    def __enter__(self):
+        _intern_scopes.append((self, _intern_table))
+        set_intern_table(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        i = max(i for i, scope in enumerate(_intern_scopes) if scope[0] is self)
+        previous = _intern_scopes.pop(i)[1]
+        if i < len(_intern_scopes):
+            # a later block is still open, it restores this block's previous table
+            _intern_scopes[i] = (_intern_scopes[i][0], previous)
+        else:
+            set_intern_table(previous)
+
+
+_intern_table = None
+# the open intern_table blocks and the table installed before each of them
+_intern_scopes = []
 
-    if not cons.is_base:
-        io_bytes.seek(-4, 1)
-    
-    return cons.deserialize(io_bytes, *args, **kwargs)
+
+def set_intern_table(table):
+    '''
+    makes decoded strings and values shared through table, an intern_table,
+    None disables interning
+    '''
+    global _intern_table
+    _intern_table = table
+"""
+
+def_skip="""
+def skip(buf, offset):
+    '''
+    returns the offset after the boxed value at offset, without decoding it
+    '''
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
+    if cons is None:
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.skip(buf, offset + 4)
+
+    return cons.skip_bare(buf, offset + 4)
+
+
+def encoded_length(buf, offset=0):
+    return skip(buf, offset) - offset
+"""
+
+def_decode_io='''
+def decode_io(decode, io_bytes, *args, **kwargs):
+    offset = io_bytes.tell()
+    if hasattr(io_bytes, 'getbuffer'):
+        with io_bytes.getbuffer() as buf:
+            result, offset = decode(buf, offset, *args, **kwargs)
+    else:
+        buf = io_bytes.read()
+        result, end = decode(buf, 0, *args, **kwargs)
+        offset += end
+    io_bytes.seek(offset)
+    return result
 '''
 
+def_numpy="""
+def numpy_dtype(fmt, names=None):
+    if numpy is None:
+        return None
+    if names is None:
+        return numpy.dtype('<' + fmt)
+    return numpy.dtype([(name, '<' + f) for name, f in zip(names, fmt)])
+
+
+def decode_vector_numpy(buf, elem_type, offset=0, bare=False):
+    '''
+    decodes a vector of ints, longs, doubles or fixed-size constructors to a
+    numpy array that shares the memory of buf, bare for vector<...> vectors
+    '''
+    if numpy is None:
+        raise Exception('decode_vector_numpy requires numpy')
+
+    if not bare:
+        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+        offset += 4
+
+    dtype = getattr(elem_type, 'bare_dtype' if bare and not elem_type.is_base else 'dtype', None)
+    if dtype is None:
+        raise Exception('"{}" items do not have a fixed size'.format(elem_type.__name__))
+
+    count = unpack_number_from(buf, offset)[0]
+    array = numpy.frombuffer(buf, dtype, count, offset + 4)
+    if dtype.names is not None and dtype.names[0] == 'number':
+        number = unpack_number_from(elem_type.number)[0]
+        if not (array['number'] == number).all():
+            raise Exception('vector item is not a "{:#x}" combinator'.format(number))
+    return array, offset + 4 + count*dtype.itemsize
+"""
+
 con_num_struct='''
 _pack_number_struct = Struct('<I')
 pack_number = _pack_number_struct.pack
+pack_number_into = _pack_number_struct.pack_into
+unpack_number_from = _pack_number_struct.unpack_from
 '''
 
 int_c="""
 class int_c:
     number = pack_number(0xa8509bda)
     is_base = True
+    item_format = 'i'
+    dtype = numpy_dtype('i')
+    item_size = 4
 
     _struct = Struct('<i')
 
@@ -50,9 +505,30 @@ class int_c:
     def serialize(_int):
         return int_c._struct.pack(_int)
 
+    @staticmethod
+    def serialize_into(buf, _int):
+        buf += int_c._struct.pack(_int)
+
+    @staticmethod
+    def encoded_size(_int):
+        return 4
+
+    @staticmethod
+    def pack_into(buf, offset, _int):
+        int_c._struct.pack_into(buf, offset, _int)
+        return offset + 4
+
     @staticmethod
     def deserialize(io_bytes):
-        return int_c._struct.unpack(io_bytes.read(4))[0]
+        return decode_io(int_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return int_c._struct.unpack_from(buf, offset)[0], offset + 4
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 4
 combinators[int_c.number] = int_c
 """
 
@@ -60,6 +536,9 @@ long_c="""
 class long_c:
     number = pack_number(0x22076cba)
     is_base = True
+    item_format = 'q'
+    dtype = numpy_dtype('q')
+    item_size = 8
 
     _struct = Struct('<q')
 
@@ -67,9 +546,30 @@ class long_c:
     def serialize(_long):
         return long_c._struct.pack(_long)
 
+    @staticmethod
+    def serialize_into(buf, _long):
+        buf += long_c._struct.pack(_long)
+
+    @staticmethod
+    def encoded_size(_long):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, _long):
+        long_c._struct.pack_into(buf, offset, _long)
+        return offset + 8
+
     @staticmethod
     def deserialize(io_bytes):
-        return long_c._struct.unpack(io_bytes.read(8))[0]     
+        return decode_io(long_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return long_c._struct.unpack_from(buf, offset)[0], offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 8
 combinators[long_c.number] = long_c
 """
 
@@ -77,6 +577,9 @@ double_c="""
 class double_c:
     number = pack_number(0x2210c154)
     is_base = True
+    item_format = 'd'
+    dtype = numpy_dtype('d')
+    item_size = 8
 
     _struct = Struct('<d')
 
@@ -84,9 +587,30 @@ class double_c:
     def serialize(_double):
         return double_c._struct.pack(_double)
 
+    @staticmethod
+    def serialize_into(buf, _double):
+        buf += double_c._struct.pack(_double)
+
+    @staticmethod
+    def encoded_size(_double):
+        return 8
+
+    @staticmethod
+    def pack_into(buf, offset, _double):
+        double_c._struct.pack_into(buf, offset, _double)
+        return offset + 8
+
     @staticmethod
     def deserialize(io_bytes):
-        return double_c._struct.unpack(io_bytes.read(8))[0]    
+        return decode_io(double_c.decode_from, io_bytes)
+
+    @staticmethod
+    def decode_from(buf, offset):
+        return double_c._struct.unpack_from(buf, offset)[0], offset + 8
+
+    @staticmethod
+    def skip(buf, offset):
+        return offset + 8
 combinators[double_c.number] = double_c
 """
 
@@ -98,39 +622,112 @@ class string_c:
     @staticmethod
     def serialize(string):
         result = bytearray()
+        bytes_c.serialize_into(result, string.encode())
+        return bytes(result)
 
-        str_bytes = string.encode()
+    @staticmethod
+    def serialize_into(buf, string):
+        bytes_c.serialize_into(buf, string.encode())
 
-        size_pfx = len(str_bytes)
-        if size_pfx < 254:
-            result += size_pfx.to_bytes(1, byteorder='little')
-        else:
-            result += b'\\xfe'
-            result += size_pfx.to_bytes(3, byteorder='little')
+    @staticmethod
+    def encoded_size(string):
+        return bytes_c.encoded_size(string.encode())
 
-        result += str_bytes
+    @staticmethod
+    def pack_into(buf, offset, string):
+        return bytes_c.pack_into(buf, offset, string.encode())
 
-        padding = len(result)%4
-        result += bytes(padding)
+    @staticmethod
+    def deserialize(io_bytes):
+        return decode_io(string_c.decode_from, io_bytes)
 
-        return bytes(result)
+    @staticmethod
+    def decode_from(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        if _lazy_text:
+            raw = memoryview(buf)[start:end] if _zero_copy_bytes else bytes(buf[start:end])
+            return lazy_text(raw), end + (offset - end)%4
 
+        string = str(buf[start:end], 'utf-8')
+        if _intern_table is not None:
+            string = _intern_table.intern(string)
+        return string, end + (offset - end)%4
 
     @staticmethod
-    def deserialize(io_bytes):
-        size = int.from_bytes(io_bytes.read(1), byteorder='little')
-        pfx_bytes = 1
-        if size == 254:
-            size = b'\\xfe'
-            pfx_bytes = 4
+    def skip(buf, offset):
+        return bytes_c.skip(buf, offset)
+combinators[string_c.number] = string_c
 
-        result = io_bytes.read(size)
 
-        remainder = 4 - (pfx_bytes + size)%4
-        io_bytes.read(remainder)
+class lazy_text:
+    '''
+    a string kept as its UTF-8 bytes, raw, until it is first used as text
+    '''
+    __slots__ = ('raw', '_text')
 
-        return result.decode()
-combinators[string_c.number] = string_c
+    def __init__(self, raw):
+        self.raw = raw
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = str(self.raw, 'utf-8')
+        return self._text
+
+    def __bytes__(self):
+        # raw is a memoryview with use_zero_copy_bytes
+        return bytes(self.raw)
+
+    def encode(self, encoding='utf-8', errors='strict'):
+        if encoding.lower().replace('-', '') == 'utf8':
+            return bytes(self.raw)
+        return str(self).encode(encoding, errors)
+
+    def __eq__(self, other):
+        if isinstance(other, lazy_text):
+            return self.raw == other.raw
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __contains__(self, item):
+        return str(item) in str(self)
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __getattr__(self, name):
+        return getattr(str(self), name)
+
+    def __repr__(self):
+        return 'lazy_text({!r})'.format(self.raw)
+
+
+_lazy_text = False
+
+
+def use_lazy_text(enabled=True):
+    '''
+    makes string fields decode to lazy_text objects, which only decode their
+    UTF-8 bytes when they are used as text
+    '''
+    global _lazy_text
+    _lazy_text = enabled
 """
 
 bytes_c="""
@@ -138,39 +735,193 @@ class bytes_c:
     number = pack_number(0xebefb69e)
     is_base = True
 
+    _padding = (b'', b'\\x00\\x00\\x00', b'\\x00\\x00', b'\\x00')
+
     @staticmethod
     def serialize(_bytes):
         result = bytearray()
+        bytes_c.serialize_into(result, _bytes)
+        return bytes(result)
 
+    @staticmethod
+    def serialize_into(buf, _bytes):
+        if type(_bytes) is spilled_bytes:
+            _bytes = _bytes.read()
         size_pfx = len(_bytes)
         if size_pfx < 254:
-            result += size_pfx.to_bytes(1, byteorder='little')
+            buf += bytes((size_pfx,))
+            size_pfx += 1
         else:
-            result += int(254).to_bytes(1, byteorder='little')
-            result += size_pfx.to_bytes(3, byteorder='little')
+            buf += pack_number(size_pfx << 8 | 254)
+        buf += _bytes
+        buf += bytes_c._padding[size_pfx%4]
 
-        result += _bytes
-
-        padding = len(result)%4
-        result += bytes(padding)
+    @staticmethod
+    def encoded_size(_bytes):
+        size = len(_bytes)
+        size += 1 if size < 254 else 4
+        return size + -size%4
 
-        return bytes(result)
+    @staticmethod
+    def pack_into(buf, offset, _bytes):
+        if type(_bytes) is spilled_bytes:
+            _bytes = _bytes.read()
+        size = len(_bytes)
+        if size < 254:
+            buf[offset] = size
+            start = offset + 1
+        else:
+            pack_number_into(buf, offset, size << 8 | 254)
+            start = offset + 4
+        end = start + size
+        buf[start:end] = _bytes
+        padding = bytes_c._padding[(end - offset)%4]
+        buf[end:end + len(padding)] = padding
+        return end + len(padding)
 
     @staticmethod
     def deserialize(io_bytes):
-        size = int.from_bytes(io_bytes.read(1), byteorder='little')
-        pfx_bytes = 1
+        return decode_io(bytes_c.decode_from, io_bytes)
+
+    @staticmethod
+    def payload_from(buf, offset):
+        size = buf[offset]
         if size == 254:
-            size = int.from_bytes(io_bytes.read(3), byteorder='little')
-            pfx_bytes = 4
+            start = offset + 4
+            size = unpack_number_from(buf, offset)[0] >> 8
+        else:
+            start = offset + 1
+        return start, start + size
 
-        result = io_bytes.read(size)
+    @staticmethod
+    def decode_from(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        if _spill_threshold is not None and end - start > _spill_threshold:
+            return spilled_bytes.spill(buf, start, end), end + (offset - end)%4
+        if _zero_copy_bytes:
+            return memoryview(buf)[start:end], end + (offset - end)%4
+        return bytes(buf[start:end]), end + (offset - end)%4
 
-        remainder = 4 - (pfx_bytes + size)%4
-        io_bytes.read(remainder)
+    @staticmethod
+    def view_from(buf, offset):
+        '''
+        the payload at offset as a memoryview of buf, which is never spilled
+        '''
+        start, end = bytes_c.payload_from(buf, offset)
+        return memoryview(buf)[start:end], end + (offset - end)%4
 
-        return result
+    @staticmethod
+    def skip(buf, offset):
+        start, end = bytes_c.payload_from(buf, offset)
+        return end + (offset - end)%4
 combinators[bytes_c.number] = bytes_c
+
+
+class spilled_bytes:
+    '''
+    a bytes field written to file, where it takes size bytes from offset.
+    A field spilled to its own temporary file frees it with close, or once
+    the field is garbage collected.
+    '''
+    __slots__ = ('file', 'offset', 'size', '_owns_file')
+
+    def __init__(self, file, offset, size, owns_file=False):
+        self.file = file
+        self.offset = offset
+        self.size = size
+        self._owns_file = owns_file
+
+    @staticmethod
+    def _open():
+        if _spill_sink is not None:
+            file = _spill_sink()
+            return spilled_bytes(file, file.seek(0, io.SEEK_END), 0)
+        return spilled_bytes(TemporaryFile(), 0, 0, True)
+
+    @staticmethod
+    def spill(buf, start, end):
+        spill = spilled_bytes._open()
+        spill.file.write(memoryview(buf)[start:end])
+        spill.size = end - start
+        return spill
+
+    @staticmethod
+    def reserve(size):
+        '''
+        a spilled_bytes of size bytes that are written later with write_at
+        '''
+        spill = spilled_bytes._open()
+        if size:
+            spill.file.seek(spill.offset + size - 1)
+            spill.file.write(b'\\0')
+        spill.size = size
+        return spill
+
+    def close(self):
+        '''
+        closes the temporary file of the field, the file of a sink is left open
+        '''
+        if self._owns_file:
+            self.file.close()
+
+    __del__ = close
+
+    def write_at(self, position, data):
+        self.file.seek(self.offset + position)
+        self.file.write(data)
+
+    def read(self):
+        self.file.seek(self.offset)
+        return self.file.read(self.size)
+
+    def __bytes__(self):
+        return self.read()
+
+    def __len__(self):
+        return self.size
+
+    def __eq__(self, other):
+        if isinstance(other, spilled_bytes):
+            other = other.read()
+        return self.read() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<spilled_bytes: {} bytes>'.format(self.size)
+
+
+_spill_threshold = None
+_spill_sink = None
+
+
+def use_bytes_spill(threshold=1 << 20, sink=None):
+    '''
+    makes bytes fields larger than threshold bytes decode to spilled_bytes,
+    appended to the file object returned by sink() for each field, by
+    default a temporary file of its own. A threshold of None disables
+    spilling. decode_from spills fields that are already in memory,
+    stream_decoder writes the fields of constructors to the file as their
+    chunks arrive and does not keep them.
+    '''
+    global _spill_threshold, _spill_sink
+    _spill_threshold = threshold
+    _spill_sink = sink
+
+
+_zero_copy_bytes = False
+
+
+def use_zero_copy_bytes(enabled=True):
+    '''
+    makes bytes fields, and the raw bytes of lazy_text, decode to memoryview
+    slices of the decoded buffer instead of copies. A slice keeps the whole
+    buffer alive, a bytearray or BytesIO can not be resized while slices of
+    it exist, and writing into the buffer changes the slices: copy with
+    bytes() whatever must outlive the buffer or its next reuse.
+    '''
+    global _zero_copy_bytes
+    _zero_copy_bytes = enabled
 """
 
 vector_c="""
@@ -179,33 +930,802 @@ class vector_c:
     is_base = True
 
     @staticmethod
-    def serialize(iterable, vector_type):
-        result = bytearray(vector_c.number)
-        result += len(iterable).to_bytes(4, byteorder='little')
-        for i in iterable:
-            if not vector_type.is_base:
-                result += vector_type.number
-            result += vector_type.serialize(i)
+    def serialize(iterable, vector_type, bare=False):
+        result = bytearray()
+        vector_c.serialize_into(result, iterable, vector_type, bare)
         return bytes(result)
 
     @staticmethod
-    def deserialize(io_bytes, vector_type=None):
-        count = int.from_bytes(io_bytes.read(4), byteorder='little')
+    def serialize_into(buf, iterable, vector_type, bare=False):
+        buf += vector_c.number
+        vector_c.serialize_bare_into(buf, iterable, vector_type, bare)
+
+    @staticmethod
+    def serialize_bare_into(buf, iterable, vector_type, bare=False):
+        buf += pack_number(len(iterable))
+        vector_c.serialize_items_into(buf, iterable, vector_type, bare)
+
+    @staticmethod
+    def serialize_items_into(buf, iterable, vector_type, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            buf += pack('<{}{}'.format(len(iterable), item_format), *iterable)
+            return
+
+        if vector_type is None:
+            serialize_into = serialize_object_into
+        elif bare:
+            serialize_into = vector_type.serialize_bare_into
+        else:
+            serialize_into = vector_type.serialize_into
+        for i in iterable:
+            serialize_into(buf, i)
+
+    @staticmethod
+    def serialize_records_into(buf, iterable, cons, bare=False):
+        buf += pack_number(len(iterable))
+        buf += vector_c.pack_records(iterable, cons, bare)
+
+    @staticmethod
+    def pack_records(iterable, cons, bare=False):
+        '''
+        packs the items of a fixed-size constructor with its precomputed Struct
+        '''
+        if bare:
+            return b''.join(starmap(cons._bare_struct_0.pack, iterable))
+        pack_item = partial(cons._struct_0.pack, unpack_number_from(cons.number)[0])
+        return b''.join(starmap(pack_item, iterable))
+
+    @staticmethod
+    def encoded_size(iterable, vector_type, bare=False):
+        return 8 + vector_c.items_encoded_size(iterable, vector_type, bare)
+
+    @staticmethod
+    def encoded_bare_size(iterable, vector_type, bare=False):
+        return 4 + vector_c.items_encoded_size(iterable, vector_type, bare)
+
+    @staticmethod
+    def items_encoded_size(iterable, vector_type, bare=False):
+        item_size = getattr(vector_type, 'item_size', None)
+        if item_size is not None:
+            return len(iterable)*item_size
+
+        if vector_type is None:
+            size = encoded_size
+        elif bare:
+            size = vector_type.encoded_bare_size
+        else:
+            size = vector_type.encoded_size
+        return sum(map(size, iterable))
+
+    @staticmethod
+    def records_encoded_size(iterable, cons, bare=False):
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        return 4 + len(iterable)*struct.size
+
+    @staticmethod
+    def pack_into(buf, offset, iterable, vector_type, bare=False):
+        buf[offset:offset + 4] = vector_c.number
+        return vector_c.pack_bare_into(buf, offset + 4, iterable, vector_type, bare)
+
+    @staticmethod
+    def pack_bare_into(buf, offset, iterable, vector_type, bare=False):
+        pack_number_into(buf, offset, len(iterable))
+        return vector_c.pack_items_into(buf, offset + 4, iterable, vector_type, bare)
+
+    @staticmethod
+    def pack_items_into(buf, offset, iterable, vector_type, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            pack_into('<{}{}'.format(len(iterable), item_format), buf, offset, *iterable)
+            return offset + len(iterable)*vector_type.item_size
+
+        if vector_type is None:
+            pack_item_into = pack_object_into
+        elif bare:
+            pack_item_into = vector_type.pack_bare_into
+        else:
+            pack_item_into = vector_type.pack_into
+        for i in iterable:
+            offset = pack_item_into(buf, offset, i)
+        return offset
+
+    @staticmethod
+    def pack_records_into(buf, offset, iterable, cons, bare=False):
+        pack_number_into(buf, offset, len(iterable))
+        records = vector_c.pack_records(iterable, cons, bare)
+        buf[offset + 4:offset + 4 + len(records)] = records
+        return offset + 4 + len(records)
+
+    @staticmethod
+    def deserialize(io_bytes, vector_type=None, bare=False):
+        return decode_io(vector_c.decode_from, io_bytes, vector_type, bare)
+
+    @staticmethod
+    def decode_from(buf, offset, vector_type=None, bare=False):
+        count = unpack_number_from(buf, offset)[0]
+        return vector_c.decode_items_from(buf, offset + 4, count, vector_type, bare)
+
+    @staticmethod
+    def decode_items_from(buf, offset, count, vector_type=None, bare=False):
+        item_format = getattr(vector_type, 'item_format', None)
+        if item_format is not None:
+            items = unpack_from('<{}{}'.format(count, item_format), buf, offset)
+            return list(items), offset + count*vector_type.item_size
+
+        if vector_type is None:
+            decode = decode_from
+        elif bare:
+            decode = vector_type.decode_bare_from
+        else:
+            decode = vector_type.decode_from
         items = []
-        cons = None
-        if vector_type is not None:
-            cons = vector_type
         for i in range(count):
-            if vector_type is None:
-                cnum = int.from_bytes(io_bytes.read(4), byteorder='little')
-                cons = combinators.get(cnum) 
-            items.append(cons.deserialize(io_bytes))
-        return items
+            item, offset = decode(buf, offset)
+            items.append(item)
+        return items, offset
+
+    @staticmethod
+    def decode_records_from(buf, offset, cons, bare=False):
+        '''
+        unpacks the items of a fixed-size constructor in a single pass of Struct.iter_unpack
+        '''
+        count = unpack_number_from(buf, offset)[0]
+        offset += 4
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        end = offset + count*struct.size
+        records = struct.iter_unpack(buf[offset:end])
+        make = cons._data_cls._make
+        number = unpack_number_from(cons.number)[0]
+        if bare:
+            items = list(map(make, records))
+        else:
+            items = [make(r[1:]) for r in records if r[0] == number]
+        if len(items) != count:
+            raise Exception('expected {} items of combinator "{:#x}", found {}'.format(count, number, len(items)))
+        return items, end
+
+    @staticmethod
+    def skip(buf, offset, vector_type=None, bare=False):
+        count = unpack_number_from(buf, offset)[0]
+        return vector_c.skip_items(buf, offset + 4, count, vector_type, bare)
+
+    @staticmethod
+    def skip_items(buf, offset, count, vector_type=None, bare=False):
+        item_size = getattr(vector_type, 'item_size', None)
+        if item_size is not None:
+            return offset + count*item_size
+
+        if vector_type is None:
+            skip_item = skip
+        elif bare:
+            skip_item = vector_type.skip_bare
+        else:
+            skip_item = vector_type.skip
+        for i in range(count):
+            offset = skip_item(buf, offset)
+        return offset
+
+    @staticmethod
+    def skip_records(buf, offset, cons, bare=False):
+        struct = cons._bare_struct_0 if bare else cons._struct_0
+        return offset + 4 + unpack_number_from(buf, offset)[0]*struct.size
 combinators[vector_c.number] = vector_c
 """
 
+def_columns="""
+class blob_column:
+    '''
+    a column of strings or bytes stored back to back in blob,
+    item i is blob[offsets[i]:offsets[i + 1]]
+    '''
+    def __init__(self):
+        self.offsets = array('q', [0])
+        self.blob = bytearray()
+
+    def append(self, value):
+        self.blob += value
+        self.offsets.append(len(self.blob))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+
+vector_partition = namedtuple('vector_partition', ['rows', 'columns'])
+
+
+def new_column(column_type):
+    if column_type is None:
+        return []
+    if column_type == 'blob':
+        return blob_column()
+    return array(column_type)
+
+
+def decode_vector_columns(buf, offset=0):
+    '''
+    decodes a Vector of boxed values to columns, partitioned by constructor.
+    Returns a dict mapping each constructor to a vector_partition of the
+    positions of its items and an OrderedDict of its field columns.
+    '''
+    assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+    count = unpack_number_from(buf, offset + 4)[0]
+    offset += 8
+
+    partitions = {}
+    for i in range(count):
+        cons = combinators.get(bytes(buf[offset:offset + 4]))
+        if cons is None or cons.is_base:
+            raise Exception('combinator "{:#x}" does not decode to columns'.format(unpack_number_from(buf, offset)[0]))
+        partition = partitions.get(cons)
+        if partition is None:
+            columns = [new_column(t) for t in cons._column_types]
+            partition = partitions[cons] = vector_partition(array('I'), columns)
+        partition.rows.append(i)
+        offset = cons.decode_columns_from(buf, offset + 4, partition.columns)
+
+    result = {}
+    for cons, partition in partitions.items():
+        names = cons._data_cls._fields if cons._column_types else ()
+        result[cons] = vector_partition(partition.rows, OrderedDict(zip(names, partition.columns)))
+    return result, offset
+"""
+
+def_lazy="""
+_unset = object()
+
+
+class lazy_view:
+    '''
+    a value of a constructor whose fields are decoded from buf when first
+    accessed, fields at a fixed offset are read without decoding the ones
+    before them
+    '''
+    __slots__ = ('_cons', '_buf', '_offsets', '_values')
+
+    def __init__(self, cons, buf, offset):
+        self._cons = cons
+        self._buf = buf
+        self._offsets = [offset + o for o in cons._field_offsets]
+        self._values = [_unset] * len(cons._column_types)
+
+    def field(self, index):
+        value = self._values[index]
+        if value is not _unset:
+            return value
+
+        cons, offsets, values = self._cons, self._offsets, self._values
+        if index + 1 < len(offsets):
+            values[index] = cons.decode_field_from(self._buf, offsets[index], index, values)[0]
+        for i in range(len(offsets) - 1, index + 1):
+            values[i], end = cons.decode_field_from(self._buf, offsets[i], i, values)
+            offsets.append(end)
+        return values[index]
+
+    def __getattr__(self, name):
+        try:
+            index = self._cons._data_cls._fields.index(name)
+        except ValueError:
+            raise AttributeError(name)
+        if index >= len(self._values):
+            return getattr(self.decode(), name)
+        return self.field(index)
+
+    @property
+    def end(self):
+        '''
+        the offset after the value, which decodes the trailing fields
+        '''
+        if self._values:
+            self.field(len(self._values) - 1)
+        return self._offsets[-1]
+
+    def decode(self):
+        if not self._values:
+            return self._cons.decode_bare_from(self._buf, self._offsets[0])[0]
+        return self._cons._data_cls(*[self.field(i) for i in range(len(self._values))])
+
+    def __repr__(self):
+        return '<lazy {}>'.format(self._cons.__name__)
+
+
+def decode_lazy_from(buf, offset=0):
+    '''
+    decodes the boxed value at offset to a lazy_view, base values are decoded
+    as usual. The end property of the view is the offset after the value.
+    '''
+    cons = combinators.get(bytes(buf[offset:offset + 4]))
+    if cons is None:
+        raise Exception('combinator "{:#x}" does not exist'.format(unpack_number_from(buf, offset)[0]))
+
+    if cons.is_base:
+        return cons.decode_from(buf, offset + 4)[0]
+
+    return lazy_view(cons, buf, offset + 4)
+"""
+
+def_iterative="""
+class _decode_frame:
+    '''
+    a constructor being decoded by _decode_state, or a boxed vector when
+    cons is vector_c. items collects the items of the vector field it is
+    in, boxed values of item_cls decoded by descending into them, or the
+    values of item_decode when it is set. spill is the bytes field being
+    written to the spill file, spill_left bytes of it are still to come.
+    '''
+    __slots__ = ('cons', 'start', 'offset', 'values', 'items', 'item_cls', 'item_decode', 'item_skip', 'count',
+                 'spill', 'spill_left', 'spill_pad')
+
+    def __init__(self, cons, start):
+        self.cons = cons
+        self.start = start
+        self.offset = start + 4
+        self.values = []
+        self.items = None
+        self.item_cls = None
+        self.item_decode = None
+        self.item_skip = None
+        self.count = 0
+        self.spill = None
+        self.spill_left = 0
+        self.spill_pad = 0
+
+
+def _fits(skip, buf, *args):
+    '''
+    whether the value skip reads from buf ends within buf
+    '''
+    try:
+        return skip(buf, *args) <= len(buf)
+    except (struct_error, IndexError):
+        return False
+
+
+def _spill_from(buf, frame):
+    '''
+    writes the bytes field at frame.offset to the spill file as far as buf
+    goes, returns the spilled_bytes once it is complete, _unset before that
+    and None when the field is not larger than the spill threshold
+    '''
+    if frame.spill is None:
+        if len(buf) < frame.offset + 4:
+            return _unset
+        start, end = bytes_c.payload_from(buf, frame.offset)
+        if end - start <= _spill_threshold:
+            return None
+        frame.spill, frame.spill_left = spilled_bytes.reserve(end - start), end - start
+        frame.spill_pad = (frame.offset - end)%4
+        frame.offset = start
+
+    spill = frame.spill
+    if frame.spill_left:
+        size = min(frame.spill_left, len(buf) - frame.offset)
+        spill.write_at(spill.size - frame.spill_left, memoryview(buf)[frame.offset:frame.offset + size])
+        frame.offset += size
+        frame.spill_left -= size
+        if frame.spill_left:
+            return _unset
+
+    if len(buf) < frame.offset + frame.spill_pad:
+        return _unset
+    frame.offset += frame.spill_pad
+    frame.spill = None
+    return spill
+
+
+def _item_codec(codec, bare):
+    '''
+    the functions decoding and skipping one item of a vector of codec
+    '''
+    if codec is None:
+        return decode_from, skip
+    if bare:
+        return codec.decode_bare_from, codec.skip_bare
+    return codec.decode_from, codec.skip
+
+
+class _decode_state:
+    '''
+    the explicit stack of a boxed value being decoded, offset and type_cls
+    are the next boxed value to decode when descend is set. raw_nested are
+    the values of keep_raw that share_raw copies once the value is complete.
+    '''
+    def __init__(self, offset, max_depth):
+        self.max_depth = max_depth
+        self.stack = []
+        self.offset = offset
+        self.type_cls = None
+        self.descend = True
+        self.raw_nested = []
+
+    def run(self, buf, partial=False):
+        '''
+        decodes from buf, returns the value and the offset after it. When
+        partial, returns _unset if buf ends first, and run continues from
+        where it stopped once buf has more bytes.
+        '''
+        if not _raw_slices:
+            return self._run(buf, partial)
+
+        # values decoded by recursive calls wait with those of the frames
+        _raw_decode.nested = self.raw_nested
+        try:
+            return self._run(buf, partial)
+        except Exception:
+            share_raw(self.raw_nested)
+            del self.raw_nested[:]
+            raise
+        finally:
+            _raw_decode.nested = None
+
+    def _run(self, buf, partial):
+        stack, max_depth = self.stack, self.max_depth
+        offset, type_cls, descend = self.offset, self.type_cls, self.descend
+        value = _unset
+        while True:
+            if descend:
+                # offset is at a boxed value of type_cls, or of any type when None
+                if partial and len(buf) < offset + 4:
+                    self.offset, self.type_cls, self.descend = offset, type_cls, True
+                    return _unset
+                number = unpack_number_from(buf, offset)[0]
+                if type_cls is None:
+                    cons = combinators.get(bytes(buf[offset:offset + 4]))
+                    if cons is None:
+                        raise Exception('combinator "{:#x}" does not exist'.format(number))
+                else:
+                    cons = type_cls.constructors.get(number)
+                    if cons is None:
+                        raise Exception('combinator "{:#x}" is not a constructor of {}'.format(number, type_cls.__name__))
+
+                # partly received values are kept in frames down to their fields
+                # and the items of their vectors
+                if partial and cons is vector_c:
+                    if len(buf) < offset + 8:
+                        self.offset, self.type_cls, self.descend = offset, type_cls, True
+                        return _unset
+                    if len(stack) >= max_depth:
+                        raise Exception('value nested deeper than {} levels'.format(max_depth))
+                    frame = _decode_frame(cons, offset)
+                    frame.count = unpack_number_from(buf, offset + 4)[0]
+                    frame.items, frame.offset = [], offset + 8
+                    stack.append(frame)
+                    value = _unset
+                elif cons.is_base or not (cons._column_types if partial else cons._nested_fields):
+                    if partial and not _fits(skip if type_cls is None else type_cls.skip, buf, offset):
+                        self.offset, self.type_cls, self.descend = offset, type_cls, True
+                        return _unset
+                    value, offset = (decode_from if type_cls is None else type_cls.decode_from)(buf, offset)
+                else:
+                    if len(stack) >= max_depth:
+                        raise Exception('value nested deeper than {} levels'.format(max_depth))
+                    stack.append(_decode_frame(cons, offset))
+                    value = _unset
+
+            descend = True
+            while stack:
+                frame = stack[-1]
+                if value is not _unset:
+                    frame.offset = offset
+                    if frame.items is not None:
+                        frame.items.append(value)
+                    else:
+                        frame.values.append(value)
+                    value = _unset
+
+                items = frame.items
+                if items is not None:
+                    while frame.item_decode is not None and len(items) < frame.count:
+                        if not _fits(frame.item_skip, buf, frame.offset):
+                            self.descend = False
+                            return _unset
+                        item, frame.offset = frame.item_decode(buf, frame.offset)
+                        items.append(item)
+                    if len(items) < frame.count:
+                        type_cls, offset = frame.item_cls, frame.offset
+                        break
+                    frame.items = frame.item_decode = None
+                    if frame.cons is vector_c:
+                        stack.pop()
+                        value, offset = items, frame.offset
+                        continue
+                    frame.values.append(items)
+
+                cons, values, nested = frame.cons, frame.values, frame.cons._nested_fields
+                # in partial mode vectors are decoded item by item, except for
+                # items of a fixed size, which are skipped without scanning them
+                vectors = cons._vector_fields if partial else ()
+                index, count = len(values), len(cons._column_types)
+                while (index < count and (not nested or nested[index] is None) and
+                       (not vectors or vectors[index] is None or hasattr(vectors[index][0], 'item_size'))):
+                    field = None
+                    if partial and _spill_threshold is not None and index in cons._bytes_fields:
+                        field = _spill_from(buf, frame)
+                        if field is _unset:
+                            self.descend = False
+                            return _unset
+                    if field is None:
+                        if partial and not _fits(cons.skip_field_from, buf, frame.offset, index, values):
+                            self.descend = False
+                            return _unset
+                        field, frame.offset = cons.decode_field_from(buf, frame.offset, index, values)
+                    values.append(field)
+                    index += 1
+
+                if index < count:
+                    offset = frame.offset
+                    if nested and nested[index] is not None:
+                        type_cls, is_vector = nested[index]
+                        if not is_vector:
+                            break
+                        frame.item_cls, boxed = type_cls, True
+                    else:
+                        codec, bare, boxed = vectors[index]
+                        frame.item_decode, frame.item_skip = _item_codec(codec, bare)
+                    header = 8 if boxed else 4
+                    if partial and len(buf) < offset + header:
+                        self.descend = False
+                        return _unset
+                    if boxed:
+                        assert unpack_number_from(buf, offset)[0] == 0x1cb5c415
+                    frame.count = unpack_number_from(buf, offset + header - 4)[0]
+                    frame.items = []
+                    frame.offset = offset + header
+                    continue
+
+                stack.pop()
+                value, offset = cons._data_cls(*values), frame.offset
+                if _raw_slices:
+                    value = keep_raw(cons, value, buf, frame.start, offset)
+                if _intern_table is not None:
+                    value = _intern_table.intern(value)
+
+            if not stack:
+                if self.raw_nested:
+                    share_raw(self.raw_nested)
+                    del self.raw_nested[:]
+                return value, offset
+
+
+def decode_iterative(buf, offset=0, max_depth=1000):
+    '''
+    decodes the boxed value at offset like decode_from, but nested boxed
+    values are decoded by a loop over an explicit stack, driven by the
+    _nested_fields of the constructors, instead of by recursive calls.
+    Values nested deeper than max_depth raise an exception.
+    '''
+    return _decode_state(offset, max_depth).run(buf)
+
+
+class stream_decoder:
+    '''
+    decodes a stream of boxed values received in chunks of any size. The
+    fields, nested values and vector items of a partly received value are
+    kept between chunks, only a field or vector item that is not complete
+    yet is checked again from its start by the next feed.
+    '''
+    def __init__(self, max_depth=1000):
+        self.max_depth = max_depth
+        self._buf = bytearray()
+        self._state = _decode_state(0, max_depth)
+
+    def feed(self, chunk):
+        '''
+        adds chunk to the stream, returns the values it completes
+        '''
+        try:
+            self._buf += chunk
+        except BufferError:
+            # zero-copy fields of the pending value hold views of the buffer
+            self._buf = self._buf + chunk
+
+        results = []
+        while True:
+            result = self._state.run(self._buf, partial=True)
+            if result is _unset:
+                break
+            value, offset = result
+            results.append(value)
+            self._state = _decode_state(offset, self.max_depth)
+
+        state = self._state
+        position = state.offset if state.descend or not state.stack else state.stack[-1].offset
+        if position and 2*position >= len(self._buf) and (not state.stack or not _raw_slices):
+            # the bytes before position are decoded, or spilled, and only raw
+            # slices refer to them. Dropping them when they are at least half
+            # of the buffer copies every byte a bounded number of times.
+            self._buf = self._buf[position:]
+            state.offset -= position
+            for frame in state.stack:
+                frame.start -= position
+                frame.offset -= position
+        return results
+
+    @property
+    def pending(self):
+        '''
+        whether a value is partly received
+        '''
+        return len(self._buf) > self._state.offset or bool(self._state.stack)
+"""
+
+def_vector_stream="""
+def _fixed_size(buf, offset, size):
+    return offset + size
+
+
+class vector_stream:
+    '''
+    decodes the boxed value at offset of source, a buffer or a binary file,
+    yielding the items of its vector field one at a time. fields holds the
+    other fields by name, the ones before the vector once the stream is
+    made and the ones after it once the items are iterated, when end is
+    the offset after the value in a buffer. Files are read in chunks of
+    chunk_size and only the bytes of the current item are kept.
+    '''
+    def __init__(self, source, field, offset=0, chunk_size=65536):
+        if hasattr(source, 'read'):
+            self._file, self._buf, self._offset = source, bytearray(), 0
+        else:
+            self._file, self._buf, self._offset = None, source, offset
+        self._chunk_size = chunk_size
+
+        self._fill(_fixed_size, 4)
+        cons = combinators.get(bytes(self._buf[self._offset:self._offset + 4]))
+        if cons is None or cons.is_base:
+            raise Exception('combinator "{:#x}" is not a constructor'.format(unpack_number_from(self._buf, self._offset)[0]))
+        names = cons._data_cls._fields
+        if field not in names or not cons._vector_fields or cons._vector_fields[names.index(field)] is None:
+            raise Exception('{} has no vector field "{}"'.format(cons.__name__, field))
+
+        self.cons = cons
+        self.fields = OrderedDict()
+        self.end = None
+        self._index = names.index(field)
+        self._values = []
+        self._offset += 4
+        self._decode_fields(self._index)
+
+        boxed = cons._vector_fields[self._index][2]
+        self._fill(_fixed_size, 8 if boxed else 4)
+        if boxed:
+            assert unpack_number_from(self._buf, self._offset)[0] == 0x1cb5c415
+            self._offset += 4
+        self.count = unpack_number_from(self._buf, self._offset)[0]
+        self._offset += 4
+        self._started = False
+
+    def _fill(self, skip, *args):
+        '''
+        reads the file until the value that skip reads at the offset is in
+        the buffer, dropping the bytes before the offset
+        '''
+        if self._file is None:
+            return
+        while not _fits(skip, self._buf, self._offset, *args):
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                raise Exception('the file ends inside the value')
+            # a new buffer, decoded zero-copy fields may hold views of the old one
+            self._buf = self._buf[self._offset:] + chunk
+            self._offset = 0
+
+    def _decode_fields(self, end):
+        cons, values = self.cons, self._values
+        for i in range(len(values), end):
+            if i == self._index:
+                values.append(None)
+                continue
+            self._fill(cons.skip_field_from, i, values)
+            value, self._offset = cons.decode_field_from(self._buf, self._offset, i, values)
+            values.append(value)
+            self.fields[cons._data_cls._fields[i]] = value
+
+    def __iter__(self):
+        if self._started:
+            raise Exception('the items of a vector_stream are iterated once')
+        self._started = True
+
+        codec, bare, boxed = self.cons._vector_fields[self._index]
+        decode, skip_item = _item_codec(codec, bare)
+
+        for i in range(self.count):
+            self._fill(skip_item)
+            item, self._offset = decode(self._buf, self._offset)
+            yield item
+
+        self._decode_fields(len(self.cons._column_types))
+        self.end = self._offset if self._file is None else None
+"""
+
+def_template="""
+_field_structs = {code: Struct('<' + code) for code in 'iIqd'}
+
+
+class request_template:
+    '''
+    a request serialized once, fill packs the named fixed-width fields in
+    place and leaves the rest of the bytes as they are. prefix holds the
+    already serialized headers of wrappers such as invokeWithLayer and
+    initConnection, whose query is the templated request.
+    '''
+    def __init__(self, cons, data, variable=(), prefix=b''):
+        self.cons = cons
+        self._buf = bytearray(prefix)
+        start = len(self._buf)
+        cons.serialize_into(self._buf, data)
+
+        fields = cons._data_cls._fields
+        indices = []
+        for name in variable:
+            if name not in fields:
+                raise Exception('{} has no field "{}"'.format(cons.__name__, name))
+            index = fields.index(name)
+            if cons._column_types[index] not in _field_structs:
+                raise Exception('field "{}" of {} is not fixed-width'.format(name, cons.__name__))
+            indices.append(index)
+
+        self._fields = {}
+        offset, values = start + 4, []
+        for i in range(max(indices, default=-1) + 1):
+            if i in indices:
+                self._fields[fields[i]] = (_field_structs[cons._column_types[i]], offset)
+            value, offset = cons.decode_field_from(self._buf, offset, i, values)
+            values.append(value)
+
+    def fill(self, **values):
+        '''
+        the request bytes with the given variable fields replaced, fields
+        that are not given keep their last value
+        '''
+        fields = self._fields
+        for name, value in values.items():
+            field_struct, offset = fields[name]
+            field_struct.pack_into(self._buf, offset, value)
+        return bytes(self._buf)
+
+    def __len__(self):
+        return len(self._buf)
+"""
+
+bool_template="""
+class bool_c:
+    '''
+    encodes python bools as boolTrue and boolFalse
+    '''
+    @staticmethod
+    def serialize(_bool):
+        return boolTrue_c.number if _bool else boolFalse_c.number
+
+    @staticmethod
+    def serialize_into(buf, _bool):
+        buf += boolTrue_c.number if _bool else boolFalse_c.number
+
+    @staticmethod
+    def encoded_size(_bool):
+        return 4
+
+    @staticmethod
+    def pack_into(buf, offset, _bool):
+        buf[offset:offset + 4] = boolTrue_c.number if _bool else boolFalse_c.number
+        return offset + 4
+data_combinators[bool] = bool_c
+
+
+def use_native_bool(enabled=True):
+    '''
+    makes boolTrue and boolFalse decode to True and False instead of their
+    namedtuple instances
+    '''
+    boolTrue_c.instance = True if enabled else boolTrue_c._data_cls(tag='boolTrue', number=boolTrue_c.number)
+    boolFalse_c.instance = False if enabled else boolFalse_c._data_cls(tag='boolFalse', number=boolFalse_c.number)
+"""
+
 base_types=['int', 'Int', 'long', 'Long', 'double', 'Double', 'string', 'String', 'bytes', 'Bytes', 'vector']
-base_templates=[def_serialize, def_deserialize, con_num_struct, int_c, long_c, double_c, string_c, bytes_c, vector_c]
+base_templates=[def_serialize, def_serialize_into, def_deserialize, def_decode_from, def_skip, def_decode_io, def_numpy, con_num_struct, int_c, long_c, double_c, string_c, bytes_c, vector_c, def_columns, def_lazy, def_iterative, def_vector_stream, def_template]
 
 class Python34Target(Target):
     def __init__(self, schema, types, combinators):
@@ -238,27 +1758,53 @@ class Python34Target(Target):
         return Python34Identifier
 
     def translate(self):
-        print('from collections import namedtuple')
-        print('from struct import Struct')
+        print('from array import array')
+        print('from collections import namedtuple, OrderedDict')
+        print('from functools import partial')
+        print('from itertools import starmap')
+        print('from struct import Struct, error as struct_error, pack, pack_into, unpack_from')
+        print('from tempfile import TemporaryFile')
+        print('from threading import local')
         print('import io')
         print('')
+        print('try:')
+        print('    import numpy')
+        print('except ImportError:')
+        print('    numpy = None')
+        print('')
         print('combinators = {}')
-        #try:
-        #    for name, t in self.types.items():
-        #        print(t.definition())
-        #except Exception as e:
-        #    raise e
+        print('data_combinators = {}')
 
         for t in base_templates:
             print(t)
 
+        while any([c.update_has_floats() for c in self.combinators.values()]):
+            pass
+
+        for name, t in self.types.items():
+            if t.py3class is not None:
+                print(t.definition())
+
+        defined = []
         for name, c in self.combinators.items():
             try:
                 if c.ident.ir_ident.ident_full not in base_types:
                     print(c.definition())
+                    defined.append(c)
             except Exception as e:
                 print(c, file=sys.stderr)
                 print(e, file=sys.stderr)
 
+        # item codecs of vector fields may be declared after the combinator
+        print('')
+        for c in defined:
+            vector_fields = c.vector_fields_definition()
+            if vector_fields:
+                print(vector_fields)
+
+        identifiers = [c.ident.ir_ident.ident_full for c in self.combinators.values()]
+        if 'boolTrue' in identifiers and 'boolFalse' in identifiers:
+            print(bool_template)
+
         #for name, c in self.combinators.items():
         #    print('{}.deserialize(bytes(2000))'.format(c.py3ident))
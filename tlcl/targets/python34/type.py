@@ -2,25 +2,55 @@ from inspect import Signature, Parameter
 from pathlib import Path
 from collections import OrderedDict
 from .ident import Python34Identifier
+from ...ir.combinator import IRCombinator
 
 __all__ = ('Python34Type')
 
 template="""
 class {identifier}:
-    def __init__(self):
-        pass
+    constructors = {{}}
 
     @staticmethod
     def deserialize(io_bytes):
-        print('{identifier}')
-        return io_bytes
+        return decode_io({identifier}.decode_from, io_bytes)
 
+    @staticmethod
+    def decode_from(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = {identifier}.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{{:#x}}" is not a constructor of {name}'.format(number))
+        if _raw_slices and cons._column_types:
+            result, end = decode_raw_from(cons, buf, offset)
+        else:
+            result, end = cons.decode_bare_from(buf, offset + 4)
+        if _intern_table is not None:
+            result = _intern_table.intern(result)
+        return result, end
+
+    @staticmethod
+    def skip(buf, offset):
+        number = unpack_number_from(buf, offset)[0]
+        cons = {identifier}.constructors.get(number)
+        if cons is None:
+            raise Exception('combinator "{{:#x}}" is not a constructor of {name}'.format(number))
+        return cons.skip_bare(buf, offset + 4)
+
+    serialize_into = staticmethod(serialize_object_into)
+    pack_into = staticmethod(pack_object_into)
+    encoded_size = staticmethod(encoded_size)
 """
 
 class Python34Type:
-    def __init__(self, ident, ir_type):
+    # Object is any boxed value, it is decoded by the number of its constructor
+    _base_types = ['Int', 'Long', 'Double', 'String', 'Bytes', 'Vector', 'NatNumber', 'Type', 'Object']
+
+    _base_codecs = {'Int': 'int_c', 'Long': 'long_c', 'Double': 'double_c', 'String': 'string_c', 'Bytes': 'bytes_c'}
+
+    def __init__(self, ident, ir_type, vector_type=None):
         self._ident = ident
         self._ir_type = ir_type
+        self._vector_type = vector_type
         self._constructors = {}
         self._members = {}
 
@@ -51,7 +81,90 @@ class Python34Type:
 
         return ident
 
+    @property
+    def vector_type(self):
+        '''
+        the element type of a Vector<t> type, None for any other type
+        '''
+        return self._vector_type
+
+    @property
+    def py3codec(self):
+        '''
+        identifier of the generated class that encodes and decodes values of
+        this type, None when a value can only be decoded by its constructor number
+        '''
+        codec = Python34Type._base_codecs.get(self.py3ident)
+        if self.wide_int_size is not None:
+            codec = self.constructors[0].py3ident
+        elif codec is None and self.vector_type is None:
+            codec = self.py3class
+        return codec
+
+    @property
+    def holds_floats(self):
+        '''
+        whether values of this type may hold a double, any boxed value may
+        '''
+        if self.vector_type is not None:
+            return self.vector_type.holds_floats
+        if self.py3ident == 'Double' or self.py3codec is None:
+            return True
+        return any(c.has_floats for c in self.constructors)
+
+    @property
+    def wide_int_size(self):
+        '''
+        the size in bytes of a type such as Int128 whose only constructor is
+        a fixed number of ints, None for any other type
+        '''
+        constructors = self.constructors
+        if len(constructors) != 1:
+            return None
+        return constructors[0].wide_int_size
+
+    @property
+    def constructors(self):
+        return [c for c in self._constructors.values() if c.kind == IRCombinator.CONSTRUCTOR]
+
+    @property
+    def bare_constructor(self):
+        '''
+        the constructor that encodes the bare values of the type, None for base
+        types and types with more than one constructor
+        '''
+        constructors = self.constructors
+        if len(constructors) != 1 or self.py3class is None:
+            return None
+        return constructors[0]
+
+    @property
+    def record_constructor(self):
+        '''
+        the only constructor of a type whose values have a fixed size,
+        vectors of such values are decoded with a single Struct.iter_unpack
+        '''
+        constructor = self.bare_constructor
+        if constructor is None or not constructor.is_fixed_size:
+            return None
+        return constructor
+
+    @property
+    def py3class(self):
+        '''
+        identifier of the generated class dispatching on the type's constructors,
+        None for base types and types without constructors
+        '''
+        if self.py3ident in Python34Type._base_types or not self.constructors or self.wide_int_size is not None:
+            return None
+
+        namespace = self._ident.ir_ident.namespace
+        ident = self.py3ident if namespace is None else '{}_{}'.format(namespace, self.py3ident)
+        ident = '{}_t'.format(ident)
+
+        Python34Identifier.validate(ident)
+
+        return ident
+
     def definition(self):
-        init_sig = ', '.join(['self'] + ['{}=None'.format(m) for m in self._members])
-        member_init = '\n        '.join(['self.{0} = {0}'.format(m) for m in self._members] or ['pass'])
-        return template.format(identifier=self.py3ident, init_sig=init_sig, member_init=member_init)
+        return template.format(identifier=self.py3class, name=self._ident.ir_ident.ident_full)
@@ -74,10 +74,29 @@ class _Targets:
 			tgt_type = convert_type(ir_type)
 			types[ir_type.ident_full] = tgt_type
 
+		# bare types may be named after their only constructor, e.g. future_salt
+		constructor_types = {}
+		for name, ir_combinator in schema.combinators.items():
+			if ir_combinator.kind == ir_combinator.CONSTRUCTOR:
+				constructor_types[ir_combinator.identifier.ident_full] = ir_combinator.result_type
+
+		def lookup_type(ir_type):
+			tgt_type = types.get(ir_type.ident_full)
+			if tgt_type is None and ir_type.kind == ir_type.BARE and ir_type.vector_type is None:
+				result_type = constructor_types.get(ir_type.ir_ident.bare().ident_full)
+				if result_type is not None:
+					tgt_type = types.get(result_type.ident_full)
+			if tgt_type is None and ir_type.vector_type is not None:
+				vector_type = lookup_type(ir_type.vector_type)
+				if vector_type is not None:
+					tgt_type = type_cls(ident_cls(ir_type.ir_ident), ir_type, vector_type)
+					types[ir_type.ident_full] = tgt_type
+			return tgt_type
+
 		for name, ir_combinator in schema.combinators.items():
 			params = []
 			for ir_param in ir_combinator.params:
-				arg_type = types.get(ir_param.arg_type.ident_full)
+				arg_type = lookup_type(ir_param.arg_type)
 
 				if arg_type is None:
 					print('WARNING: {} in parameter "{}"; unkown arg type: {}'.format(ir_combinator, ir_param, ir_param.arg_type), file=stderr)